@@ -0,0 +1,200 @@
+# analysis/metrics.py
+#
+# Vectorized movement metrics over a whole session at once. Landmarks are
+# the 33-point MediaPipe pose layout; every joint angle for every frame comes
+# out of one batched set of array operations, and the summaries (range of
+# motion, angular velocity, stability) are reductions over that array.
+import warnings
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from analysis.movement_codec import MovementArrays
+from schemas.user import MovementMetrics
+
+# MediaPipe pose landmark indices
+NOSE = 0
+LEFT_SHOULDER, RIGHT_SHOULDER = 11, 12
+LEFT_ELBOW, RIGHT_ELBOW = 13, 14
+LEFT_WRIST, RIGHT_WRIST = 15, 16
+LEFT_HIP, RIGHT_HIP = 23, 24
+LEFT_KNEE, RIGHT_KNEE = 25, 26
+LEFT_ANKLE, RIGHT_ANKLE = 27, 28
+LEFT_FOOT, RIGHT_FOOT = 31, 32
+
+# Joint name -> (proximal landmark, joint vertex, distal landmark)
+JOINTS: Dict[str, Tuple[int, int, int]] = {
+    "left_elbow": (LEFT_SHOULDER, LEFT_ELBOW, LEFT_WRIST),
+    "right_elbow": (RIGHT_SHOULDER, RIGHT_ELBOW, RIGHT_WRIST),
+    "left_shoulder": (LEFT_HIP, LEFT_SHOULDER, LEFT_ELBOW),
+    "right_shoulder": (RIGHT_HIP, RIGHT_SHOULDER, RIGHT_ELBOW),
+    "left_hip": (LEFT_SHOULDER, LEFT_HIP, LEFT_KNEE),
+    "right_hip": (RIGHT_SHOULDER, RIGHT_HIP, RIGHT_KNEE),
+    "left_knee": (LEFT_HIP, LEFT_KNEE, LEFT_ANKLE),
+    "right_knee": (RIGHT_HIP, RIGHT_KNEE, RIGHT_ANKLE),
+    "left_ankle": (LEFT_KNEE, LEFT_ANKLE, LEFT_FOOT),
+    "right_ankle": (RIGHT_KNEE, RIGHT_ANKLE, RIGHT_FOOT),
+}
+JOINT_NAMES: List[str] = list(JOINTS)
+_PROXIMAL = np.array([joint[0] for joint in JOINTS.values()])
+_VERTEX = np.array([joint[1] for joint in JOINTS.values()])
+_DISTAL = np.array([joint[2] for joint in JOINTS.values()])
+# Landmarks a frame needs for every joint above
+POSE_LANDMARKS = max(max(joint) for joint in JOINTS.values()) + 1
+
+# Angles from landmarks the model is unsure of are left out (NaN)
+MIN_VISIBILITY = 0.5
+# Left/right range-of-motion gap worth a clinical note, in degrees
+ASYMMETRY_NOTE_DEGREES = 15.0
+LOW_VISIBILITY_NOTE = 0.6
+
+
+def joint_angles(points: np.ndarray, min_visibility: float = MIN_VISIBILITY) -> np.ndarray:
+    # points: (frames, landmarks, 3) of x, y, visibility.
+    # Returns (frames, joints) interior angles in degrees, NaN where any of
+    # the three landmarks is below min_visibility.
+    proximal = points[:, _PROXIMAL]
+    vertex = points[:, _VERTEX]
+    distal = points[:, _DISTAL]
+    a = proximal[..., :2] - vertex[..., :2]
+    b = distal[..., :2] - vertex[..., :2]
+    cross = a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0]
+    dot = (a * b).sum(axis=-1)
+    angles = np.degrees(np.arctan2(np.abs(cross), dot))
+    visibility = np.minimum(np.minimum(proximal[..., 2], vertex[..., 2]), distal[..., 2])
+    angles[visibility < min_visibility] = np.nan
+    return angles
+
+
+def angular_velocity(angles: np.ndarray, timestamps: np.ndarray) -> np.ndarray:
+    # (frames - 1, joints) in degrees per second; repeated timestamps give NaN
+    dt = np.diff(timestamps)
+    dt = np.where(dt > 0, dt, np.nan)
+    return np.diff(angles, axis=0) / dt[:, None]
+
+
+def _nan_stat(fn, values: np.ndarray, axis: int = 0) -> np.ndarray:
+    # NaN-aware reductions warn on all-NaN columns; those stay NaN
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return fn(values, axis=axis)
+
+
+def _value(number) -> Optional[float]:
+    number = float(number)
+    return None if np.isnan(number) else round(number, 3)
+
+
+STABILITY_FIELDS = (
+    "center_sway_x_variance", "center_sway_y_variance", "shoulder_tilt_variance", "hip_tilt_variance",
+)
+
+
+def stability_series(points: np.ndarray) -> np.ndarray:
+    # (frames, 4): hip midpoint x and y (a centre-of-mass proxy), and the
+    # tilt of the shoulder and hip lines in degrees. Stability is the
+    # variance of each over the session.
+    hips = (points[:, LEFT_HIP, :2] + points[:, RIGHT_HIP, :2]) / 2
+    shoulder_tilt = np.degrees(np.arctan2(
+        points[:, RIGHT_SHOULDER, 1] - points[:, LEFT_SHOULDER, 1],
+        points[:, RIGHT_SHOULDER, 0] - points[:, LEFT_SHOULDER, 0],
+    ))
+    hip_tilt = np.degrees(np.arctan2(
+        points[:, RIGHT_HIP, 1] - points[:, LEFT_HIP, 1],
+        points[:, RIGHT_HIP, 0] - points[:, LEFT_HIP, 0],
+    ))
+    return np.column_stack((hips[:, 0], hips[:, 1], shoulder_tilt, hip_tilt))
+
+
+def stability_summary(variances: np.ndarray, mean_visibility: float) -> Dict[str, float]:
+    metrics = dict(zip(STABILITY_FIELDS, variances))
+    metrics["mean_visibility"] = mean_visibility
+    return {name: value for name, value in ((name, _value(value)) for name, value in metrics.items()) if value is not None}
+
+
+def stability(points: np.ndarray) -> Dict[str, float]:
+    return stability_summary(stability_series(points).var(axis=0), points[..., 2].mean())
+
+
+def summarize_angles(angles: np.ndarray, velocity: np.ndarray) -> Tuple[dict, dict, dict]:
+    mean = _nan_stat(np.nanmean, angles)
+    std = _nan_stat(np.nanstd, angles)
+    low = _nan_stat(np.nanmin, angles)
+    high = _nan_stat(np.nanmax, angles)
+    speed = np.abs(velocity)
+    mean_speed = _nan_stat(np.nanmean, speed)
+    peak_speed = _nan_stat(np.nanmax, speed)
+    return joint_summaries(mean, std, low, high, mean_speed, peak_speed)
+
+
+def joint_summaries(mean, std, low, high, mean_speed, peak_speed) -> Tuple[dict, dict, dict]:
+    # Per-joint arrays (NaN = not measured) to the MovementMetrics dicts
+    joint_summary, rom, velocity_summary = {}, {}, {}
+    for index, name in enumerate(JOINT_NAMES):
+        joint_summary[name] = {"mean": _value(mean[index]), "std": _value(std[index])}
+        rom[name] = {
+            "min": _value(low[index]),
+            "max": _value(high[index]),
+            "range": _value(high[index] - low[index]),
+        }
+        velocity_summary[name] = {"mean": _value(mean_speed[index]), "peak": _value(peak_speed[index])}
+    return joint_summary, rom, velocity_summary
+
+
+def clinical_notes(rom: dict, stability_metrics: Dict[str, float]) -> List[str]:
+    notes = []
+    for name in JOINT_NAMES:
+        if not name.startswith("left_"):
+            continue
+        joint = name[len("left_"):]
+        left = rom[name]["range"]
+        right = rom[f"right_{joint}"]["range"]
+        if left is None or right is None:
+            notes.append(f"{joint.capitalize()} range of motion could not be measured on both sides")
+        elif abs(left - right) >= ASYMMETRY_NOTE_DEGREES:
+            side = "left" if left < right else "right"
+            notes.append(
+                f"{joint.capitalize()} range of motion is {abs(left - right):.0f}° lower on the {side} side"
+            )
+    if stability_metrics.get("mean_visibility", 1.0) < LOW_VISIBILITY_NOTE:
+        notes.append("Low landmark visibility; metrics may be unreliable")
+    return notes
+
+
+def no_pose_metrics(exercise_type: str, frames: int, duration: float) -> MovementMetrics:
+    return MovementMetrics(
+        exercise_type=exercise_type, duration=duration, frame_count=frames,
+        frame_rate=0.0, joint_angles={}, range_of_motion={}, movement_velocity={},
+        stability_metrics={}, clinical_notes=["No full-body pose frames to analyse"],
+    )
+
+
+def build_metrics(exercise_type: str, frames: int, duration: float, joint_summary: dict,
+                  rom: dict, velocity_summary: dict, stability_metrics: Dict[str, float]) -> MovementMetrics:
+    return MovementMetrics(
+        exercise_type=exercise_type,
+        duration=round(duration, 3),
+        frame_count=frames,
+        frame_rate=round((frames - 1) / duration, 3) if duration > 0 else 0.0,
+        joint_angles=joint_summary,
+        range_of_motion=rom,
+        movement_velocity=velocity_summary,
+        stability_metrics=stability_metrics,
+        clinical_notes=clinical_notes(rom, stability_metrics),
+    )
+
+
+def compute_movement_metrics(movement: MovementArrays, exercise_type: str) -> MovementMetrics:
+    timestamps = np.asarray(movement.timestamps, dtype=np.float64)
+    points = np.asarray(movement.points, dtype=np.float32)
+    frames = len(timestamps)
+    duration = float(timestamps[-1] - timestamps[0]) if frames > 1 else 0.0
+
+    if frames == 0 or points.shape[1] < POSE_LANDMARKS:
+        # Nothing to measure, or not a full-body pose layout
+        return no_pose_metrics(exercise_type, frames, duration)
+
+    angles = joint_angles(points)
+    velocity = angular_velocity(angles, timestamps)
+    joint_summary, rom, velocity_summary = summarize_angles(angles, velocity)
+    return build_metrics(exercise_type, frames, duration, joint_summary, rom, velocity_summary, stability(points))
@@ -0,0 +1,130 @@
+# analysis/movement_codec.py
+#
+# Binary storage for pose movement: a 16-byte header, a float64 timestamp per
+# frame, then one contiguous float32 array of frames x landmarks x channels
+# (x, y, visibility). Decoding wraps the stored bytes with np.frombuffer, so
+# no values are copied or parsed.
+import struct
+from typing import Iterable, List, NamedTuple, Optional
+
+import numpy as np
+
+MAGIC = b"MOV1"
+VERSION = 1
+CHANNELS = 3
+# magic, version, channels, landmarks, frames (little-endian)
+HEADER = struct.Struct("<4sHHII")
+
+TIMESTAMP_DTYPE = np.dtype("<f8")
+POINT_DTYPE = np.dtype("<f4")
+
+
+class MovementArrays(NamedTuple):
+    timestamps: np.ndarray  # (frames,) float64
+    points: np.ndarray      # (frames, landmarks, 3) float32
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.timestamps)
+
+
+class MovementFormatError(ValueError):
+    pass
+
+
+def encode_movement(timestamps, points) -> bytes:
+    timestamps = np.ascontiguousarray(timestamps, dtype=TIMESTAMP_DTYPE)
+    points = np.ascontiguousarray(points, dtype=POINT_DTYPE)
+    if points.ndim != 3 or points.shape[2] != CHANNELS:
+        raise MovementFormatError(f"points must be frames x landmarks x {CHANNELS}, got {points.shape}")
+    if len(timestamps) != points.shape[0]:
+        raise MovementFormatError("one timestamp is needed per frame")
+    header = HEADER.pack(MAGIC, VERSION, CHANNELS, points.shape[1], points.shape[0])
+    return b"".join((header, timestamps.tobytes(), points.tobytes()))
+
+
+def decode_movement(blob) -> MovementArrays:
+    # The arrays are read-only views over blob
+    view = memoryview(blob)
+    if len(view) < HEADER.size:
+        raise MovementFormatError("movement blob is shorter than its header")
+    magic, version, channels, landmarks, frames = HEADER.unpack_from(view)
+    if magic != MAGIC or version != VERSION or channels != CHANNELS:
+        raise MovementFormatError(f"unsupported movement blob {magic!r} v{version}")
+    points_offset = HEADER.size + frames * TIMESTAMP_DTYPE.itemsize
+    expected = points_offset + frames * landmarks * CHANNELS * POINT_DTYPE.itemsize
+    if len(view) != expected:
+        raise MovementFormatError(f"movement blob is {len(view)} bytes, expected {expected}")
+    timestamps = np.frombuffer(view, dtype=TIMESTAMP_DTYPE, count=frames, offset=HEADER.size)
+    points = np.frombuffer(
+        view, dtype=POINT_DTYPE, count=frames * landmarks * CHANNELS, offset=points_offset
+    ).reshape(frames, landmarks, CHANNELS)
+    return MovementArrays(timestamps, points)
+
+
+def _landmark_values(landmark) -> tuple:
+    if isinstance(landmark, dict):
+        return landmark.get("x", 0.0), landmark.get("y", 0.0), landmark.get("visibility", 0.0)
+    return tuple(landmark[:CHANNELS])
+
+
+def movement_from_frames(frames: Iterable) -> MovementArrays:
+    # Accepts the JSON shapes movement has been stored in: PoseData-style
+    # {"timestamp", "landmarks": [{"x", "y", "visibility"}]} objects, or the
+    # compact [timestamp, [[x, y, visibility], ...]] pairs from ingestion.
+    timestamps: List[float] = []
+    rows: List[list] = []
+    for index, frame in enumerate(frames):
+        if isinstance(frame, dict):
+            timestamp = frame.get("timestamp", float(index))
+            landmarks = frame.get("landmarks") or []
+        else:
+            timestamp, landmarks = frame[0], frame[1]
+        timestamps.append(timestamp)
+        rows.append([_landmark_values(landmark) for landmark in landmarks])
+    if not rows:
+        return MovementArrays(np.empty(0, TIMESTAMP_DTYPE), np.empty((0, 0, CHANNELS), POINT_DTYPE))
+    landmarks = max(len(row) for row in rows)
+    points = np.zeros((len(rows), landmarks, CHANNELS), dtype=POINT_DTYPE)
+    for index, row in enumerate(rows):
+        if row:
+            # Frames missing landmarks keep zero visibility for them
+            points[index, :len(row)] = row
+    return MovementArrays(np.asarray(timestamps, dtype=TIMESTAMP_DTYPE), points)
+
+
+def movement_from_json(data) -> MovementArrays:
+    if isinstance(data, dict):
+        # {"frames": [...]} wrappers
+        data = data.get("frames") or []
+    return movement_from_frames(data or [])
+
+
+def concat_movement(parts: List[MovementArrays]) -> MovementArrays:
+    parts = [part for part in parts if part.frame_count]
+    if not parts:
+        return MovementArrays(np.empty(0, TIMESTAMP_DTYPE), np.empty((0, 0, CHANNELS), POINT_DTYPE))
+    if len(parts) == 1:
+        return parts[0]
+    timestamps = np.concatenate([part.timestamps for part in parts])
+    landmarks = max(part.points.shape[1] for part in parts)
+    if all(part.points.shape[1] == landmarks for part in parts):
+        return MovementArrays(timestamps, np.concatenate([part.points for part in parts]))
+    # Batches recorded with fewer landmarks (another layout, or frames with
+    # none) are padded with zero visibility, as within a batch
+    points = np.zeros((len(timestamps), landmarks, CHANNELS), dtype=POINT_DTYPE)
+    start = 0
+    for part in parts:
+        points[start:start + part.frame_count, :part.points.shape[1]] = part.points
+        start += part.frame_count
+    return MovementArrays(timestamps, points)
+
+
+def load_movement(blob: Optional[bytes], data) -> Optional[MovementArrays]:
+    # Read path for rows that may predate the binary column: the blob when
+    # there is one, otherwise the legacy JSON
+    if blob:
+        return decode_movement(blob)
+    if data:
+        return movement_from_json(data)
+    return None
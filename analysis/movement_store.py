@@ -0,0 +1,79 @@
+# analysis/movement_store.py
+import time
+from typing import Optional
+
+import orjson
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from analysis.movement_codec import (
+    MovementArrays, concat_movement, decode_movement, encode_movement, load_movement,
+    movement_from_json,
+)
+from models.user import AssessmentSession, PoseFrameBatch
+
+
+async def session_movement(db: AsyncSession, session_id: str) -> Optional[MovementArrays]:
+    # A session's movement, whichever way it was stored: the session's own
+    # blob or legacy JSON, otherwise the frames streamed in for it
+    result = await db.execute(
+        select(AssessmentSession.movement_blob, AssessmentSession.movement_data)
+        .where(AssessmentSession.session_id == session_id)
+    )
+    row = result.first()
+    if row is None:
+        return None
+    movement = load_movement(row.movement_blob, row.movement_data)
+    if movement is not None:
+        return movement
+
+    result = await db.execute(
+        select(PoseFrameBatch.frames_blob, PoseFrameBatch.frames)
+        .where(PoseFrameBatch.session_id == session_id)
+        .order_by(PoseFrameBatch.first_timestamp, PoseFrameBatch.id)
+    )
+    parts = [load_movement(batch.frames_blob, batch.frames) for batch in result]
+    parts = [part for part in parts if part is not None]
+    return concat_movement(parts) if parts else None
+
+
+class MigrationReport:
+    def __init__(self, session_id: str, json_bytes: int, blob_bytes: int,
+                 json_decode_ms: float, blob_decode_ms: float, frames: int):
+        self.session_id = session_id
+        self.json_bytes = json_bytes
+        self.blob_bytes = blob_bytes
+        self.json_decode_ms = json_decode_ms
+        self.blob_decode_ms = blob_decode_ms
+        self.frames = frames
+
+    def as_dict(self) -> dict:
+        return {
+            "session_id": self.session_id,
+            "frames": self.frames,
+            "json_bytes": self.json_bytes,
+            "blob_bytes": self.blob_bytes,
+            "size_ratio": round(self.json_bytes / self.blob_bytes, 2) if self.blob_bytes else None,
+            "json_decode_ms": round(self.json_decode_ms, 3),
+            "blob_decode_ms": round(self.blob_decode_ms, 3),
+        }
+
+
+def migrate_movement(session_id: str, data) -> tuple:
+    # Converts one session's JSON movement; returns the blob and a report of
+    # what it saves. Decode times compare parsing the stored JSON text into
+    # arrays with opening the blob.
+    json_text = orjson.dumps(data)
+    started = time.perf_counter()
+    movement = movement_from_json(orjson.loads(json_text))
+    json_decode_ms = (time.perf_counter() - started) * 1000
+
+    blob = encode_movement(movement.timestamps, movement.points)
+    started = time.perf_counter()
+    decode_movement(blob)
+    blob_decode_ms = (time.perf_counter() - started) * 1000
+
+    report = MigrationReport(
+        session_id, len(json_text), len(blob), json_decode_ms, blob_decode_ms, movement.frame_count
+    )
+    return blob, report
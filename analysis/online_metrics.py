@@ -0,0 +1,127 @@
+# analysis/online_metrics.py
+#
+# MovementMetrics for a session that is still streaming. Running counts,
+# means, sums of squared deviations (Welford, merged a batch at a time with
+# Chan's update) and min/max are kept per joint, so memory is fixed by the
+# number of joints however long the session runs. The statistics match
+# analysis.metrics.compute_movement_metrics over the same frames.
+from typing import Optional
+
+import numpy as np
+
+from analysis.metrics import (
+    JOINT_NAMES, POSE_LANDMARKS, STABILITY_FIELDS, angular_velocity, build_metrics, joint_angles,
+    joint_summaries, no_pose_metrics, stability_series, stability_summary,
+)
+from schemas.user import MovementMetrics
+
+
+class RunningStats:
+    # Count, mean, M2 (sum of squared deviations), min and max of each
+    # column; NaN values are skipped
+    def __init__(self, size: int):
+        self.count = np.zeros(size, dtype=np.int64)
+        self.mean = np.zeros(size)
+        self.m2 = np.zeros(size)
+        self.low = np.full(size, np.inf)
+        self.high = np.full(size, -np.inf)
+
+    def update(self, values: np.ndarray) -> None:
+        # values: (n, size)
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=0)
+        if not count.any():
+            return
+        values = values.astype(np.float64)
+        mean = np.where(valid, values, 0.0).sum(axis=0) / np.maximum(count, 1)
+        m2 = (np.where(valid, values - mean, 0.0) ** 2).sum(axis=0)
+        total = self.count + count
+        share = count / np.maximum(total, 1)
+        delta = np.where(count > 0, mean - self.mean, 0.0)
+        self.m2 += m2 + delta ** 2 * self.count * share
+        self.mean += delta * share
+        self.count = total
+        self.low = np.fmin(self.low, np.where(valid, values, np.inf).min(axis=0))
+        self.high = np.fmax(self.high, np.where(valid, values, -np.inf).max(axis=0))
+
+    def _measured(self, values: np.ndarray) -> np.ndarray:
+        return np.where(self.count > 0, values, np.nan)
+
+    def means(self) -> np.ndarray:
+        return self._measured(self.mean)
+
+    def variances(self) -> np.ndarray:
+        return self._measured(self.m2 / np.maximum(self.count, 1))
+
+    def stds(self) -> np.ndarray:
+        return np.sqrt(self.variances())
+
+    def lows(self) -> np.ndarray:
+        return self._measured(self.low)
+
+    def highs(self) -> np.ndarray:
+        return self._measured(self.high)
+
+
+class MovementAccumulator:
+    # Fed one batch of frames at a time, in timestamp order. The last
+    # frame's angles are kept so velocity carries across batch boundaries.
+    def __init__(self, exercise_type: str):
+        self.exercise_type = exercise_type
+        self.frame_count = 0
+        self.pose_frames = 0
+        self.first_timestamp: Optional[float] = None
+        self.last_timestamp: Optional[float] = None
+        self.angles = RunningStats(len(JOINT_NAMES))
+        self.speed = RunningStats(len(JOINT_NAMES))
+        self.stability = RunningStats(len(STABILITY_FIELDS))
+        self.visibility_sum = 0.0
+        self.visibility_count = 0
+        self._last_angles: Optional[np.ndarray] = None
+        self._last_pose_timestamp: Optional[float] = None
+
+    def update(self, timestamps: np.ndarray, points: np.ndarray) -> None:
+        if not len(timestamps):
+            return
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        if self.first_timestamp is None:
+            self.first_timestamp = float(timestamps[0])
+        self.last_timestamp = float(timestamps[-1])
+        self.frame_count += len(timestamps)
+        if points.shape[1] < POSE_LANDMARKS:
+            # Not a full-body layout; counted, but there is nothing to measure
+            return
+
+        angles = joint_angles(points)
+        self.angles.update(angles)
+        if self._last_angles is not None:
+            velocity = angular_velocity(
+                np.vstack((self._last_angles, angles)),
+                np.concatenate(([self._last_pose_timestamp], timestamps)),
+            )
+        else:
+            velocity = angular_velocity(angles, timestamps)
+        self.speed.update(np.abs(velocity))
+        self._last_angles = angles[-1:]
+        self._last_pose_timestamp = float(timestamps[-1])
+
+        self.stability.update(stability_series(points))
+        self.visibility_sum += float(points[..., 2].sum(dtype=np.float64))
+        self.visibility_count += points[..., 2].size
+        self.pose_frames += len(timestamps)
+
+    def metrics(self) -> MovementMetrics:
+        duration = (self.last_timestamp - self.first_timestamp) if self.frame_count > 1 else 0.0
+        if not self.pose_frames:
+            return no_pose_metrics(self.exercise_type, self.frame_count, duration)
+        joint_summary, rom, velocity_summary = joint_summaries(
+            self.angles.means(), self.angles.stds(), self.angles.lows(), self.angles.highs(),
+            self.speed.means(), self.speed.highs(),
+        )
+        stability_metrics = stability_summary(
+            self.stability.variances(), self.visibility_sum / self.visibility_count
+        )
+        return build_metrics(
+            self.exercise_type, self.frame_count, duration,
+            joint_summary, rom, velocity_summary, stability_metrics,
+        )
@@ -0,0 +1,88 @@
+# analysis/scoring.py
+#
+# Turns MovementMetrics into a MovementScore. Each joint scores the share of
+# its expected range of motion the session reached, less a penalty when the
+# two sides differ; the overall score is the mean over measured joints,
+# scaled down when the landmarks were hard to see.
+from typing import Dict, List
+
+import numpy as np
+
+from analysis.metrics import ASYMMETRY_NOTE_DEGREES, JOINT_NAMES, LOW_VISIBILITY_NOTE, compute_movement_metrics
+from analysis.movement_codec import MovementArrays
+from schemas.user import MovementMetrics, MovementScore
+
+# Expected range of motion during an assessment, in degrees, per joint kind
+TARGET_ROM = {
+    "elbow": 140.0,
+    "shoulder": 150.0,
+    "hip": 100.0,
+    "knee": 120.0,
+    "ankle": 40.0,
+}
+# Points taken off both sides per degree of left/right range difference
+ASYMMETRY_PENALTY_PER_DEGREE = 0.5
+ASYMMETRY_PENALTY_MAX = 20.0
+# Joint scores below this get a mobility recommendation
+RECOMMEND_BELOW = 60.0
+
+
+def _joint_kind(name: str) -> str:
+    return name.split("_", 1)[1]
+
+
+def score_metrics(metrics: MovementMetrics) -> MovementScore:
+    rom = metrics.range_of_motion
+    joint_scores: Dict[str, float] = {}
+    recommendations: List[str] = []
+
+    for name in JOINT_NAMES:
+        reached = (rom.get(name) or {}).get("range")
+        if reached is None:
+            continue
+        target = TARGET_ROM[_joint_kind(name)]
+        score = min(reached / target, 1.0) * 100
+        side, kind = name.split("_", 1)
+        other = (rom.get(f"{'right' if side == 'left' else 'left'}_{kind}") or {}).get("range")
+        if other is not None:
+            score -= min(abs(reached - other) * ASYMMETRY_PENALTY_PER_DEGREE, ASYMMETRY_PENALTY_MAX)
+        joint_scores[name] = round(max(score, 0.0), 1)
+
+    for kind, target in TARGET_ROM.items():
+        sides = [f"{side}_{kind}" for side in ("left", "right") if joint_scores.get(f"{side}_{kind}") is not None]
+        low = [name for name in sides if joint_scores[name] < RECOMMEND_BELOW]
+        if low:
+            reached = min(rom[name]["range"] for name in low)
+            where = "both sides" if len(low) == 2 else f"the {low[0].split('_', 1)[0]} side"
+            recommendations.append(
+                f"Work on {kind} mobility on {where}: {reached:.0f}° of an expected {target:.0f}° range"
+            )
+        if len(sides) == 2:
+            gap = abs(rom[sides[0]]["range"] - rom[sides[1]]["range"])
+            if gap >= ASYMMETRY_NOTE_DEGREES:
+                recommendations.append(f"Add single-side {kind} exercises to reduce a {gap:.0f}° left/right difference")
+
+    if not joint_scores:
+        return MovementScore(
+            overall_score=0.0,
+            recommendations=["Re-record the session with the whole body in view"],
+            movement_metrics=metrics,
+        )
+
+    overall = float(np.mean(list(joint_scores.values())))
+    visibility = metrics.stability_metrics.get("mean_visibility", 1.0)
+    if visibility < LOW_VISIBILITY_NOTE:
+        overall *= visibility / LOW_VISIBILITY_NOTE
+        recommendations.append("Improve lighting and camera position; landmarks were often not visible")
+    return MovementScore(
+        overall_score=round(min(max(overall, 0.0), 100.0), 1),
+        joint_scores=joint_scores,
+        recommendations=recommendations,
+        movement_metrics=metrics,
+    )
+
+
+def score_movement(timestamps: np.ndarray, points: np.ndarray, exercise_type: str) -> dict:
+    # Process pool entry point: arrays in, plain JSON-ready dict out
+    metrics = compute_movement_metrics(MovementArrays(timestamps, points), exercise_type)
+    return score_metrics(metrics).model_dump()
@@ -1,46 +1,90 @@
 # assessments.py
+from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status
-from typing import  Optional
-from sqlalchemy.orm import Session
-from core.database import get_db
-from models.user import User, Assessment
+from typing import Optional
+from sqlalchemy import func, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.database import get_read_db
+from models.user import User, Assessment, AssessmentStatusEnum, AssessmentTypeEnum
+from schemas.user import AssessmentListItem
+from schemas.response_models import Page, AssessmentPageAdapter
+from api.pagination import PageParams, page_params, paginate, page_response
 from auth.utils import get_current_user, require_role
 
 router = APIRouter()
 
-@router.get("/assessments")
-async def get_assessments_with_employee_names(
+def assessment_filters(
+    status: Optional[AssessmentStatusEnum] = None,
+    assessment_type: Optional[AssessmentTypeEnum] = None,
     consultant_id: Optional[int] = None,
-    db: Session = Depends(get_db),
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+) -> list:
+    conditions = []
+    if status is not None:
+        conditions.append(Assessment.status == status)
+    if assessment_type is not None:
+        conditions.append(Assessment.assessment_type == assessment_type)
+    if consultant_id is not None:
+        conditions.append(Assessment.consultant_id == consultant_id)
+    if date_from is not None:
+        conditions.append(Assessment.created_at >= date_from)
+    if date_to is not None:
+        conditions.append(Assessment.created_at < date_to)
+    return conditions
+
+def assessment_list_query(conditions: list):
+    # One round-trip: the listed columns plus the employee's name via a join,
+    # instead of loading full rows and fetching each employee separately
+    employee_name = func.coalesce(
+        User.first_name + literal(" ") + User.last_name,
+        literal("Unknown Employee")
+    ).label("employee_name")
+    return (
+        select(
+            Assessment.id,
+            Assessment.assessment_id,
+            Assessment.user_id,
+            Assessment.consultant_id,
+            Assessment.assessment_type,
+            Assessment.title,
+            Assessment.description,
+            Assessment.status,
+            Assessment.overall_progress,
+            Assessment.final_score,
+            Assessment.scheduled_date,
+            Assessment.started_at,
+            Assessment.completed_at,
+            Assessment.created_at,
+            employee_name,
+        )
+        .outerjoin(User, User.id == Assessment.user_id)
+        .where(*conditions)
+    )
+
+@router.get("/assessments", response_model=Page[AssessmentListItem])
+async def get_assessments_with_employee_names(
+    conditions: list = Depends(assessment_filters),
+    params: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
     _ = Depends(get_current_user),
     current_user = Depends(require_role(['admin']))
 ):
     try:
         print("📦 Admin Dashboard - Fetching all assessments")
         
-        # Base query for assessments
-        query = db.query(Assessment)
-        
-        # Filter by consultant if provided
-        if consultant_id is not None:
-            query = query.filter(Assessment.consultant_id == consultant_id)
-        
-        assessments = query.all()
-        results = []
-        
-        for assessment in assessments:
-            user = db.query(User).get(assessment.user_id)
-            results.append({
-                **assessment.__dict__,
-                "employee_name": f"{user.first_name} {user.last_name}" if user else "Unknown Employee"
-            })
+        results = await paginate(
+            db, assessment_list_query(conditions), Assessment, params, scalars=False
+        )
         
-        print(f"📦 Admin assessments fetched: {len(results)}")
-        return results
+        print(f"📦 Admin assessments fetched: {len(results['items'])}")
+        return page_response(AssessmentPageAdapter, results)
         
+    except HTTPException:
+        raise
     except Exception as error:
         print(f"Error fetching admin assessments: {error}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch assessments"
-        )
\ No newline at end of file
+        )
@@ -1,40 +1,97 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
 from typing import List
-from core.database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.database import get_read_db
+from core.consultant_scope import consultant_scope, scope_conditions
+from core.user_search import user_search
 from models.user import User
-from schemas.user import User as UserSchema
+from schemas.user import User as UserSchema, UserSearchHit
 from auth.utils import get_current_user
+from schemas.response_models import Page, UserPageAdapter
+from api.pagination import PageParams, page_params, paginate, page_response, decode_cursor, encode_cursor, keyset_order
 router = APIRouter()
 
-@router.get("/employees", response_model=List[UserSchema])
+async def get_scoped_employees(db: AsyncSession, consultant_id: int, params: PageParams) -> dict:
+    after = decode_cursor(params.cursor) if params.cursor else None
+    scoped = consultant_scope.page(consultant_id, after, params.limit)
+    if scoped is None:
+        # Index not built yet: resolve the same scope in SQL
+        result = await db.execute(
+            select(User.employer_id, User.assigned_locations).where(User.id == consultant_id)
+        )
+        consultant = result.first()
+        employer_id, assigned_locations = consultant if consultant else (None, None)
+        query = select(User).where(*scope_conditions(consultant_id, employer_id, assigned_locations))
+        return await paginate(db, query, User, params)
+
+    # The index gives the page's ids in order; only those rows are loaded
+    items = []
+    if scoped["ids"]:
+        result = await db.execute(
+            select(User)
+            .where(User.id.in_(scoped["ids"]))
+            .order_by(*keyset_order(User))
+        )
+        items = result.scalars().all()
+    next_key = scoped["next_key"]
+    return {
+        "items": items,
+        "next_cursor": encode_cursor(*next_key) if next_key else None,
+        "total": scoped["total"] if params.include_total else None,
+    }
+
+@router.get("/employees", response_model=Page[UserSchema])
 async def get_consultant_employees(
-    db: Session = Depends(get_db),
+    params: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     # Check if user has consultant role
     if current_user.role != "consultant":
         raise HTTPException(
-            status_code=403, 
+            status_code=403,
             detail="Only consultants can access this endpoint"
         )
-    
+
     print(f"📦 Consultant Dashboard - Fetching scoped employees for consultant: {current_user.id}")
-    
+
     try:
-        # Get employees assigned to this consultant using created_by_consultant_id
-        employees = db.query(User).filter(
-            User.created_by_consultant_id != current_user.id,
-            User.is_active == True
-        ).all()
-        
-        print(f"📦 Scoped employees for consultant: {len(employees)}")
-        
-        return employees
-        
+        # Employees the consultant created, plus active employees of their
+        # employer at one of their assigned locations
+        employees = await get_scoped_employees(db, current_user.id, params)
+
+        print(f"📦 Scoped employees for consultant: {len(employees['items'])}")
+
+        return page_response(UserPageAdapter, employees)
+
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error fetching consultant employees: {str(e)}")
         raise HTTPException(
             status_code=500,
             detail="Failed to fetch employees"
-        )
\ No newline at end of file
+        )
+
+@router.get("/employees/search", response_model=List[UserSearchHit])
+async def search_consultant_employees(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+    current_user: User = Depends(get_current_user)
+):
+    if current_user.role != "consultant":
+        raise HTTPException(
+            status_code=403,
+            detail="Only consultants can access this endpoint"
+        )
+
+    # Only employees in the consultant's scope are searched
+    scope = consultant_scope.resolve(current_user.id)
+    hits = None if scope is None else user_search.search(q, limit, role="employee", within=scope)
+    if hits is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Search index is still being built, try again shortly"
+        )
+    return hits
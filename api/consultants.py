@@ -1,24 +1,31 @@
-import bcrypt
-from fastapi import APIRouter, Depends, HTTPException, Path, status
-from typing import Any, Dict, List, Optional
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, status
+from datetime import datetime
+from typing import Any, Dict
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from schemas.user import  UserCreate, User
-from schemas.response_models import UserSchema
-from core.database import get_db
+from schemas.response_models import Page, UserSchema, UserPageAdapter
+from core.database import get_async_db
 from models.user import User as UserModel
-from models.user import Employer  # Make sure you have this imported for employer lookup
-from auth.utils import require_role, get_current_user
+from auth.utils import require_role, get_current_user, invalidate_user_tokens
+from auth.hashing import hash_password
+from api.pagination import PageParams, page_params, paginate, page_json
+from core.response_cache import response_cache
+from core.org_index import employer_org_index
 import logging
 
 router = APIRouter()
 
 # Your existing GET request - unchanged
-async def get_consultants_with_details(db: Session) -> List[UserModel]:
+async def get_consultants_with_details(db: AsyncSession, params: PageParams) -> dict:
     try:
-        return db.query(UserModel).filter(
+        query = select(UserModel).where(
             UserModel.is_active == True,
             UserModel.role == 'consultant'
-        ).all()
+        )
+        return await paginate(db, query, UserModel, params)
+    except HTTPException:
+        raise
     except Exception as error:
         logging.error(f'Error getting consultants: {error}')
         raise HTTPException(
@@ -26,23 +33,32 @@ async def get_consultants_with_details(db: Session) -> List[UserModel]:
             detail="Failed to fetch consultants"
         )
 
-@router.get("/consultants", response_model=List[UserSchema])
+@router.get("/consultants", response_model=Page[UserSchema])
 async def get_all_consultants(
-    db: Session = Depends(get_db),
+    request: Request,
+    params: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_async_db),
     _: UserSchema = Depends(get_current_user),
     current_user: UserSchema = Depends(require_role(['admin']))
 ):
-    logging.info("🔍 DEBUG: Fetching all consultants")
-    consultants = await get_consultants_with_details(db)
-    logging.info(f"📦 Found {len(consultants)} consultants")
-    return consultants
+    # Cached bodies are read from the primary: a replica read could cache
+    # lag past the invalidation that follows a write
+    cache_key = response_cache.key("consultants", request, current_user.role)
+    cached = response_cache.get(cache_key)
+    if cached is None:
+        generation = response_cache.generation("consultants")
+        logging.info("🔍 DEBUG: Fetching all consultants")
+        consultants = await get_consultants_with_details(db, params)
+        logging.info(f"📦 Found {len(consultants['items'])} consultants")
+        cached = response_cache.put(cache_key, "consultants", page_json(UserPageAdapter, consultants), generation)
+    return response_cache.respond(request, cached)
 
 # /api/admin/consultants
 # New POST request converted from your Express code
 @router.post("/consultants", response_model=User)
 async def create_consultant(
     user_in: UserCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_role(['admin']))
 ):
     
@@ -54,16 +70,13 @@ async def create_consultant(
 
     # Validate employer and assigned locations
     if user_in.employer_id and user_in.assigned_locations:
-        employer = db.query(Employer).filter(Employer.id == user_in.employer_id).first()
-        if not employer:
+        org = await employer_org_index.get(db, user_in.employer_id)
+        if not org:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Selected employer not found"
             )
-        invalid_locations = [
-            loc for loc in user_in.assigned_locations
-            if not employer.locations or loc not in employer.locations
-        ]
+        invalid_locations = org.invalid("locations", user_in.assigned_locations)
         if invalid_locations:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -88,7 +101,8 @@ async def create_consultant(
 
     try:
         # Check existing email
-        existing_user = db.query(UserModel).filter(UserModel.email == user_in.email).first()
+        result = await db.execute(select(UserModel).where(UserModel.email == user_in.email))
+        existing_user = result.scalars().first()
         if existing_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -97,9 +111,10 @@ async def create_consultant(
 
         new_consultant = UserModel(**consultant_data)
         db.add(new_consultant)
-        db.commit()
-        db.refresh(new_consultant)
+        await db.commit()
+        await db.refresh(new_consultant)
 
+        response_cache.invalidate("consultants")
         logging.info(f"✅ SUCCESS: Consultant created with ID: {new_consultant.id}")
 
         return new_consultant
@@ -117,13 +132,13 @@ async def create_consultant(
 async def update_consultant(
     consultant_id: int = Path(..., description="ID of the consultant to update"),
     update_data: Dict[str, Any] = None,  # or use a Pydantic model UserUpdate
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserSchema = Depends(require_role(['admin']))
 ):
     logging.info(f"🔍 DEBUG: Updating consultant ID: {consultant_id}")
     logging.info(f"🔍 DEBUG: Update data: {update_data}")
 
-    existing_consultant = db.query(UserModel).filter(UserModel.id == consultant_id).first()
+    existing_consultant = await db.get(UserModel, consultant_id)
     if not existing_consultant:
         logging.error(f"❌ Consultant not found with ID: {consultant_id}")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Consultant not found")
@@ -132,11 +147,11 @@ async def update_consultant(
     employer_id = update_data.get("employer_id")
     assigned_locations = update_data.get("assigned_locations", [])
     if employer_id and assigned_locations:
-        employer = db.query(Employer).filter(Employer.id == employer_id).first()
-        if not employer:
+        org = await employer_org_index.get(db, employer_id)
+        if not org:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Selected employer not found")
 
-        invalid_locations = [loc for loc in assigned_locations if not employer.locations or loc not in employer.locations]
+        invalid_locations = org.invalid("locations", assigned_locations)
         if invalid_locations:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -150,17 +165,20 @@ async def update_consultant(
         update_data.pop("password")
     elif password:
         logging.info("🔒 Hashing new password")
-        hashed = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
-        update_data["password"] = hashed.decode('utf-8')
+        update_data["password"] = await hash_password(password)
 
     # Update the consultant fields dynamically
     for field, value in update_data.items():
         if hasattr(existing_consultant, field):
             setattr(existing_consultant, field, value)
+    # Tokens carrying the old fields stop working on every worker
+    existing_consultant.tokens_valid_after = datetime.utcnow()
 
     try:
-        db.commit()
-        db.refresh(existing_consultant)
+        await db.commit()
+        await db.refresh(existing_consultant)
+        invalidate_user_tokens(consultant_id, existing_consultant.tokens_valid_after)
+        response_cache.invalidate("consultants")
         logging.info(f"✅ Updated consultant with ID: {consultant_id}")
         return existing_consultant
     except Exception as error:
@@ -174,19 +192,21 @@ async def update_consultant(
 @router.delete("/consultants/{consultant_id}")
 async def delete_consultant(
     consultant_id: int = Path(..., description="ID of the consultant to delete"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserSchema = Depends(require_role(['admin']))
 ):
     logging.info(f"🔍 DEBUG: Deleting consultant ID: {consultant_id}")
 
-    existing_consultant = db.query(UserModel).filter(UserModel.id == consultant_id).first()
+    existing_consultant = await db.get(UserModel, consultant_id)
     if not existing_consultant:
         logging.error(f"❌ Consultant not found with ID: {consultant_id}")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Consultant not found")
 
     try:
-        db.delete(existing_consultant)
-        db.commit()
+        await db.delete(existing_consultant)
+        await db.commit()
+        invalidate_user_tokens(consultant_id)
+        response_cache.invalidate("consultants")
         logging.info(f"✅ Deleted consultant with ID: {consultant_id}")
         return {"message": "Consultant deleted successfully"}
     except Exception as error:
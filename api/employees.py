@@ -1,20 +1,24 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
-from schemas.response_models import UserSchema
-from core.database import get_db
-from sqlalchemy.orm import Session
+from schemas.response_models import Page, UserSchema, UserPageAdapter
+from core.database import get_read_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.user import User as UserModel
 from auth.utils import require_role, get_current_user
+from api.pagination import PageParams, page_params, paginate, page_response
 from schemas.user import User
 
 router = APIRouter()
 
-async def get_users_by_role(db: Session, role: str) -> List[UserModel]:
+def users_by_role_conditions(role: str) -> list:
+    return [UserModel.role == role, UserModel.is_active == True]
+
+async def get_users_by_role(db: AsyncSession, role: str, params: PageParams) -> dict:
     try:
-        return db.query(UserModel).filter(
-            UserModel.role == role,
-            UserModel.is_active == True
-        ).all()
+        query = select(UserModel).where(*users_by_role_conditions(role))
+        return await paginate(db, query, UserModel, params)
+    except HTTPException:
+        raise
     except Exception as error:
         print(f'Error getting users by role {role}: {error}')
         raise HTTPException(
@@ -22,13 +26,14 @@ async def get_users_by_role(db: Session, role: str) -> List[UserModel]:
             detail="Failed to fetch users"
         )
 
-@router.get("/employees", response_model=List[User])
+@router.get("/employees", response_model=Page[User])
 async def get_all_employees(
-    db: Session = Depends(get_db),
+    params: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
     _: UserSchema = Depends(get_current_user),
     current_user: UserSchema = Depends(require_role(['admin']))
 ):
     print("📦 Admin Dashboard - Fetching all employees")
-    employees = await get_users_by_role(db, 'employee')
-    print(f"📦 Admin employees fetched: {len(employees)}")
-    return employees
\ No newline at end of file
+    employees = await get_users_by_role(db, 'employee', params)
+    print(f"📦 Admin employees fetched: {len(employees['items'])}")
+    return page_response(UserPageAdapter, employees)
\ No newline at end of file
@@ -1,18 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException, Path, status
-from typing import List
-from schemas.response_models import UserSchema
-from core.database import get_db
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, status
+from schemas.response_models import Page, UserSchema, EmployerPageAdapter
+from core.database import get_async_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.user import Employer as EmployerModel
 from auth.utils import require_role, get_current_user  # Added get_current_user
 from schemas.user import Employer,EmployerCreate
+from api.pagination import PageParams, page_params, paginate, page_json
+from core.response_cache import response_cache
+from core.org_index import employer_org_index
 import logging
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-async def get_employers(db: Session) -> List[EmployerModel]:
+async def get_employers(db: AsyncSession, params: PageParams) -> dict:
     try:
-        return db.query(EmployerModel).filter(EmployerModel.is_active == True).all()
+        query = select(EmployerModel).where(EmployerModel.is_active == True)
+        return await paginate(db, query, EmployerModel, params)
+    except HTTPException:
+        raise
     except Exception as error:
         print(f'Error getting employers: {error}')
         raise HTTPException(
@@ -20,21 +26,30 @@ async def get_employers(db: Session) -> List[EmployerModel]:
             detail="Failed to fetch employers"
         )
 
-@router.get("/employers", response_model=List[Employer])
+@router.get("/employers", response_model=Page[Employer])
 async def get_all_employers(
-    db: Session = Depends(get_db),
+    request: Request,
+    params: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_async_db),
     _: UserSchema = Depends(get_current_user),  # Added token authentication
     current_user: UserSchema = Depends(require_role(['admin']))
 ):
-    print("🔍 DEBUG: Fetching all employers")
-    employers = await get_employers(db)
-    print(f"📦 Found {len(employers)} employers")
-    return employers
+    # Cached bodies are read from the primary: a replica read could cache
+    # lag past the invalidation that follows a write
+    cache_key = response_cache.key("employers", request, current_user.role)
+    cached = response_cache.get(cache_key)
+    if cached is None:
+        generation = response_cache.generation("employers")
+        print("🔍 DEBUG: Fetching all employers")
+        employers = await get_employers(db, params)
+        print(f"📦 Found {len(employers['items'])} employers")
+        cached = response_cache.put(cache_key, "employers", page_json(EmployerPageAdapter, employers), generation)
+    return response_cache.respond(request, cached)
 
 @router.post("/employers", response_model=Employer)
 async def create_employer(
     employer_data: EmployerCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _: UserSchema = Depends(get_current_user),
     current_user: UserSchema = Depends(require_role(['admin']))
 ):
@@ -68,15 +83,16 @@ async def create_employer(
         )
 
         db.add(db_employer)
-        db.commit()
-        db.refresh(db_employer)
+        await db.commit()
+        await db.refresh(db_employer)
 
+        response_cache.invalidate("employers")
         logger.info(f"✅ Employer created with ID: {db_employer.id}")
         return Employer.from_orm(db_employer)  # ✅ Use Pydantic conversion
 
     except Exception as error:
         logger.error(f"💥 Error creating employer: {error}", exc_info=True)
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create employer: {str(error)}"
@@ -87,14 +103,14 @@ async def update_employer(
     employer_data: EmployerCreate , 
     employer_id: int = Path(..., gt=0),
     # Reuse the same input model
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _: UserSchema = Depends(get_current_user),
     current_user: UserSchema = Depends(require_role(['admin']))
 ):
     try:
         logger.info(f"🔄 UPDATE: Attempting to update employer with ID: {employer_id}")
         
-        db_employer = db.query(EmployerModel).filter(EmployerModel.id == employer_id).first()
+        db_employer = await db.get(EmployerModel, employer_id)
 
         if not db_employer:
             raise HTTPException(
@@ -106,15 +122,17 @@ async def update_employer(
             if hasattr(db_employer, field):
                 setattr(db_employer, field, value)
 
-        db.commit()
-        db.refresh(db_employer)
+        await db.commit()
+        await db.refresh(db_employer)
 
+        response_cache.invalidate("employers")
+        employer_org_index.invalidate(employer_id)
         logger.info(f"✅ UPDATE: Successfully updated employer ID {employer_id}")
         return Employer.from_orm(db_employer)
 
     except Exception as error:
         logger.error(f"❌ UPDATE ERROR: {error}", exc_info=True)
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to update employer"
@@ -123,14 +141,14 @@ async def update_employer(
 @router.delete("/employers/{employer_id}")
 async def delete_employer(
     employer_id: int = Path(..., gt=0),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _: UserSchema = Depends(get_current_user),
     current_user: UserSchema = Depends(require_role(['admin']))
 ):
     try:
         logger.info(f"🗑️ DELETE: Attempting to delete employer with ID: {employer_id}")
 
-        db_employer = db.query(EmployerModel).filter(EmployerModel.id == employer_id).first()
+        db_employer = await db.get(EmployerModel, employer_id)
 
         if not db_employer:
             raise HTTPException(
@@ -138,15 +156,17 @@ async def delete_employer(
                 detail="Employer not found"
             )
 
-        db.delete(db_employer)
-        db.commit()
+        await db.delete(db_employer)
+        await db.commit()
 
+        response_cache.invalidate("employers")
+        employer_org_index.invalidate(employer_id)
         logger.info(f"✅ DELETE: Successfully deleted employer ID {employer_id}")
         return {"success": True, "message": "Employer deleted successfully"}
 
     except Exception as error:
         logger.error(f"💥 DELETE ERROR: {error}", exc_info=True)
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete employer"
@@ -0,0 +1,135 @@
+# api/exports.py
+import csv
+import enum
+import io
+import logging
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
+import orjson
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from core.database import read_session
+from models.user import User as UserModel, Assessment, AssessmentSession
+from schemas.response_models import UserSchema
+from auth.utils import require_role
+from api.employees import users_by_role_conditions
+from api.assessments import assessment_filters, assessment_list_query
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+EXPORT_BATCH_SIZE = 1000
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+EMPLOYEE_COLUMNS = [
+    UserModel.id, UserModel.employee_id, UserModel.email, UserModel.first_name,
+    UserModel.last_name, UserModel.dob_year, UserModel.employer_id, UserModel.subclient,
+    UserModel.business_unit, UserModel.location, UserModel.job_role,
+    UserModel.created_by_consultant_id, UserModel.is_active, UserModel.created_at,
+]
+
+SESSION_COLUMNS = [
+    AssessmentSession.id, AssessmentSession.session_id, AssessmentSession.assessment_id,
+    AssessmentSession.user_id, AssessmentSession.consultant_id,
+    AssessmentSession.assessment_type, AssessmentSession.session_number,
+    AssessmentSession.session_type, AssessmentSession.overall_score,
+    AssessmentSession.outcome, AssessmentSession.escalation_level,
+    AssessmentSession.created_at, AssessmentSession.completed_at,
+]
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+async def _stream_rows(query, export_format: str, name: str) -> AsyncIterator[bytes]:
+    # The session lives as long as the response body, not the request
+    # dependencies, so it is opened here. Rows come off a server-side cursor
+    # EXPORT_BATCH_SIZE at a time and leave in chunks of about
+    # EXPORT_CHUNK_BYTES, so memory stays flat however many rows match.
+    exported = 0
+    async with read_session() as db:
+        result = await db.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        if export_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(list(result.keys()))
+            async for row in result:
+                writer.writerow([_csv_value(value) for value in row])
+                exported += 1
+                if buffer.tell() >= EXPORT_CHUNK_BYTES:
+                    yield buffer.getvalue().encode("utf-8")
+                    buffer.seek(0)
+                    buffer.truncate()
+            yield buffer.getvalue().encode("utf-8")
+        else:
+            chunk = bytearray()
+            async for row in result.mappings():
+                chunk += orjson.dumps(dict(row), option=orjson.OPT_APPEND_NEWLINE)
+                exported += 1
+                if len(chunk) >= EXPORT_CHUNK_BYTES:
+                    yield bytes(chunk)
+                    chunk.clear()
+            yield bytes(chunk)
+    logger.info(f"📤 Exported {exported} {name} rows as {export_format}")
+
+def _export_response(query, export_format: str, name: str) -> StreamingResponse:
+    stamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+    return StreamingResponse(
+        _stream_rows(query, export_format, name),
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}-{stamp}.{export_format}"'
+        }
+    )
+
+@router.get("/exports/employees")
+async def export_employees(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    current_user: UserSchema = Depends(require_role(['admin']))
+):
+    query = select(*EMPLOYEE_COLUMNS).where(*users_by_role_conditions('employee')).order_by(UserModel.id)
+    return _export_response(query, format, "employees")
+
+@router.get("/exports/assessments")
+async def export_assessments(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    conditions: list = Depends(assessment_filters),
+    current_user: UserSchema = Depends(require_role(['admin']))
+):
+    query = assessment_list_query(conditions).order_by(Assessment.id)
+    return _export_response(query, format, "assessments")
+
+@router.get("/exports/sessions")
+async def export_sessions(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    assessment_id: Optional[str] = None,
+    user_id: Optional[int] = None,
+    consultant_id: Optional[int] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    current_user: UserSchema = Depends(require_role(['admin']))
+):
+    conditions: List = []
+    if assessment_id is not None:
+        conditions.append(AssessmentSession.assessment_id == assessment_id)
+    if user_id is not None:
+        conditions.append(AssessmentSession.user_id == user_id)
+    if consultant_id is not None:
+        conditions.append(AssessmentSession.consultant_id == consultant_id)
+    if date_from is not None:
+        conditions.append(AssessmentSession.created_at >= date_from)
+    if date_to is not None:
+        conditions.append(AssessmentSession.created_at < date_to)
+    query = select(*SESSION_COLUMNS).where(*conditions).order_by(AssessmentSession.id)
+    return _export_response(query, format, "sessions")
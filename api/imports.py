@@ -0,0 +1,324 @@
+# api/imports.py
+import csv
+import io
+import logging
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+import orjson
+from fastapi import APIRouter, Depends, File, HTTPException, Path, Query, UploadFile, status
+from pydantic import ValidationError
+from sqlalchemy import insert, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.database import get_async_db
+from models.user import User as UserModel, RoleEnum
+from core.org_index import EmployerOrg, employer_org_index
+from core.change_feed import Change, change_feed
+from schemas.user import UserCreate
+from schemas.response_models import UserSchema
+from auth.utils import require_role
+from auth.hashing import password_hasher
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+IMPORT_BATCH_SIZE = 1000
+# Stop reporting individual rows past this point; the counts stay exact
+IMPORT_MAX_REPORTED_ERRORS = 1000
+
+# Unique user columns, checked before insert, with the message for a taken value
+IDENTIFIER_FIELDS = {
+    "email": "Email already exists",
+    "employee_id": "Employee ID already exists",
+    "username": "Username already exists",
+}
+
+# Employer lists a row's value must appear in, keyed by the row field
+ORG_FIELDS = {
+    "location": "locations",
+    "business_unit": "business_units",
+    "subclient": "subclients",
+    "job_role": "job_roles",
+}
+
+def _detect_format(upload: UploadFile, requested: Optional[str]) -> str:
+    if requested:
+        return requested
+    name = (upload.filename or "").lower()
+    content_type = (upload.content_type or "").lower()
+    if name.endswith((".ndjson", ".jsonl")) or "ndjson" in content_type or "jsonl" in content_type:
+        return "ndjson"
+    return "csv"
+
+def _read_rows(upload: UploadFile, import_format: str) -> Iterator[Tuple[int, object]]:
+    # The upload is already spooled to disk by the multipart parser, so rows
+    # are read off the file lazily rather than loading the whole body.
+    text = io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+    try:
+        if import_format == "csv":
+            for row_number, row in enumerate(csv.DictReader(text), start=1):
+                # Blank CSV cells mean "not provided", not an empty string
+                yield row_number, {
+                    key.strip(): value.strip() or None
+                    for key, value in row.items()
+                    if key and value is not None
+                }
+        else:
+            row_number = 0
+            for line in text:
+                if not line.strip():
+                    continue
+                row_number += 1
+                try:
+                    yield row_number, orjson.loads(line)
+                except orjson.JSONDecodeError as error:
+                    yield row_number, error
+    finally:
+        text.detach()
+
+def _batches(rows: Iterator[Tuple[int, object]], size: int) -> Iterator[List[Tuple[int, object]]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}"
+        for item in error.errors()
+    )
+
+class ImportReport:
+    def __init__(self):
+        self.total = 0
+        self.created = 0
+        self.failed = 0
+        self.errors: List[dict] = []
+
+    def fail(self, row: int, error: str, field: Optional[str] = None):
+        self.failed += 1
+        if len(self.errors) < IMPORT_MAX_REPORTED_ERRORS:
+            entry = {"row": row, "error": error}
+            if field:
+                entry["field"] = field
+            self.errors.append(entry)
+
+    def as_dict(self, employer_id: int) -> dict:
+        return {
+            "employer_id": employer_id,
+            "total": self.total,
+            "created": self.created,
+            "failed": self.failed,
+            "errors": sorted(self.errors, key=lambda entry: entry["row"]),
+            "errors_truncated": self.failed > len(self.errors),
+        }
+
+async def _existing_identifiers(db: AsyncSession, values: Dict[str, set]) -> Dict[str, set]:
+    # One set-based lookup per batch instead of a query per row
+    conditions = [
+        getattr(UserModel, field).in_(wanted) for field, wanted in values.items() if wanted
+    ]
+    taken: Dict[str, set] = {field: set() for field in values}
+    if not conditions:
+        return taken
+    result = await db.execute(
+        select(*(getattr(UserModel, field) for field in values)).where(or_(*conditions))
+    )
+    for row in result:
+        for field, value in zip(values, row):
+            if value in values[field]:
+                taken[field].add(value)
+    return taken
+
+async def _import_batch(
+    db: AsyncSession,
+    batch: List[Tuple[int, object]],
+    employer_id: int,
+    org: EmployerOrg,
+    consultant_id: Optional[int],
+    seen: Dict[str, set],
+    report: ImportReport,
+):
+    valid: List[Tuple[int, UserCreate]] = []
+    for row_number, raw in batch:
+        if isinstance(raw, Exception):
+            report.fail(row_number, f"Invalid JSON: {raw}")
+            continue
+        if not isinstance(raw, dict):
+            report.fail(row_number, "Row must be an object")
+            continue
+        try:
+            user_in = UserCreate.model_validate(raw)
+        except ValidationError as error:
+            report.fail(row_number, _validation_message(error))
+            continue
+
+        invalid_field = next(
+            (
+                field for field, values in ORG_FIELDS.items()
+                if getattr(user_in, field) is not None and getattr(user_in, field) not in getattr(org, values)
+            ),
+            None,
+        )
+        if invalid_field:
+            report.fail(
+                row_number,
+                f"Invalid {invalid_field} for selected employer: {getattr(user_in, invalid_field)}",
+                invalid_field,
+            )
+            continue
+        valid.append((row_number, user_in))
+
+    if not valid:
+        return
+
+    taken = await _existing_identifiers(db, {
+        field: {getattr(user_in, field) for _, user_in in valid if getattr(user_in, field)}
+        for field in IDENTIFIER_FIELDS
+    })
+
+    accepted: List[Tuple[int, UserCreate]] = []
+    for row_number, user_in in valid:
+        # Duplicates are checked against the database and against earlier
+        # rows of the same upload
+        duplicate = next(
+            (
+                field for field in IDENTIFIER_FIELDS
+                if getattr(user_in, field) and (
+                    getattr(user_in, field) in taken[field] or getattr(user_in, field) in seen[field]
+                )
+            ),
+            None,
+        )
+        if duplicate:
+            report.fail(row_number, IDENTIFIER_FIELDS[duplicate], duplicate)
+            continue
+        for field in IDENTIFIER_FIELDS:
+            if getattr(user_in, field):
+                seen[field].add(getattr(user_in, field))
+        accepted.append((row_number, user_in))
+
+    if not accepted:
+        return
+
+    hashed = await password_hasher.hash_many([user_in.password for _, user_in in accepted])
+
+    created_at = datetime.utcnow()
+    rows = [
+        {
+            "email": user_in.email,
+            "username": user_in.username,
+            "password": password,
+            "role": RoleEnum.employee,
+            "first_name": user_in.first_name,
+            "last_name": user_in.last_name,
+            "dob_year": user_in.dob_year,
+            "employee_id": user_in.employee_id,
+            "subclient": user_in.subclient,
+            "business_unit": user_in.business_unit,
+            "location": user_in.location,
+            "job_role": user_in.job_role,
+            "created_by_consultant_id": consultant_id,
+            "employer_id": employer_id,
+            "phone": user_in.phone,
+            "city": user_in.city,
+            "state": user_in.state,
+            "invited": user_in.invited,
+            "is_active": True,
+            "created_at": created_at,
+        }
+        for (_, user_in), password in zip(accepted, hashed)
+    ]
+
+    try:
+        await _insert_rows(db, rows)
+        report.created += len(rows)
+    except IntegrityError as error:
+        # Another writer took one of the identifiers after the lookup above.
+        # The batch is rolled back and retried row by row, so only the rows
+        # that actually conflict fail.
+        await db.rollback()
+        logger.warning(f"⚠️ Import batch conflicted on insert, retrying row by row: {error.orig}")
+        for (row_number, _), row in zip(accepted, rows):
+            try:
+                await _insert_rows(db, [row])
+                report.created += 1
+            except IntegrityError:
+                await db.rollback()
+                report.fail(row_number, "Email, username or employee ID was taken concurrently")
+
+async def _insert_rows(db: AsyncSession, rows: List[dict]) -> None:
+    # A single executemany INSERT; SQLAlchemy batches it into multi-row
+    # VALUES statements on drivers that support it
+    result = await db.execute(
+        insert(UserModel).returning(UserModel.id, sort_by_parameter_order=True),
+        rows
+    )
+    new_ids = result.scalars().all()
+    await db.commit()
+    # Core inserts bypass the ORM flush, so the derived indexes are told
+    # about the new rows here
+    change_feed.publish([
+        Change("users", "insert", {**row, "id": user_id})
+        for row, user_id in zip(rows, new_ids)
+    ])
+
+@router.post("/employers/{employer_id}/employees/import")
+async def import_employees(
+    employer_id: int = Path(..., description="Employer the employees belong to"),
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, pattern="^(csv|ndjson)$"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserSchema = Depends(require_role(['admin', 'consultant']))
+):
+    consultant_id = current_user.id if current_user.role == "consultant" else None
+    if consultant_id is not None:
+        # Consultants may only import into their own employer
+        consultant_employer_id = await db.scalar(
+            select(UserModel.employer_id).where(UserModel.id == consultant_id)
+        )
+        if consultant_employer_id != employer_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Consultants can only import employees for their own employer"
+            )
+
+    # Every row is checked against the employer's org sets in memory
+    org = await employer_org_index.get(db, employer_id)
+    if not org:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Employer not found")
+    import_format = _detect_format(file, format)
+    logger.info(f"📥 Importing employees for employer {employer_id} from {import_format} upload {file.filename}")
+
+    report = ImportReport()
+    seen: Dict[str, set] = {field: set() for field in IDENTIFIER_FIELDS}
+    try:
+        for batch in _batches(_read_rows(file, import_format), IMPORT_BATCH_SIZE):
+            report.total += len(batch)
+            await _import_batch(
+                db, batch, employer_id, org, consultant_id, seen, report,
+            )
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Upload must be UTF-8 encoded"
+        )
+    except csv.Error as error:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Malformed CSV: {error}"
+        )
+    except Exception as error:
+        logger.error(f"💥 EMPLOYEE IMPORT ERROR: {error}")
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to import employees"
+        )
+
+    logger.info(f"✅ Imported {report.created}/{report.total} employees for employer {employer_id} ({report.failed} failed)")
+    return report.as_dict(employer_id)
@@ -0,0 +1,115 @@
+# api/internal.py
+from fastapi import APIRouter, Depends
+from schemas.response_models import UserSchema
+from auth.utils import require_role, token_cache, last_accessed_buffer, revoked_tokens, revocation_sync, session_reaper
+from auth.hashing import password_hasher
+from core.pool_metrics import pool_metrics
+from core.database import replica_router
+from core.query_stats import route_query_stats
+from core.response_cache import response_cache
+from core.org_index import employer_org_index
+from core.consultant_scope import consultant_scope
+from core.change_feed import change_feed
+from core.derived_index import index_refresher
+from core.summary_counters import summary_counters
+from core.user_search import user_search
+from core.pose_ingest import live_sessions, pose_ingest_stats, pose_writer
+from core.session_scoring import session_scorer
+
+router = APIRouter()
+
+@router.get("/auth-cache")
+async def get_auth_cache_stats(
+    current_user: UserSchema = Depends(require_role(['admin']))
+):
+    return token_cache.stats()
+
+@router.get("/session-touch")
+async def get_session_touch_stats(
+    current_user: UserSchema = Depends(require_role(['admin']))
+):
+    return last_accessed_buffer.stats()
+
+@router.get("/hashing")
+async def get_hashing_stats(
+    current_user: UserSchema = Depends(require_role(['admin']))
+):
+    return password_hasher.stats()
+
+@router.get("/revocations")
+async def get_revocation_stats(
+    current_user: UserSchema = Depends(require_role(['admin']))
+):
+    return {**revoked_tokens.stats(), "sync": revocation_sync.stats()}
+
+@router.get("/session-reaper")
+async def get_session_reaper_stats(
+    current_user: UserSchema = Depends(require_role(['admin']))
+):
+    return session_reaper.stats()
+
+@router.get("/db-pool")
+async def get_db_pool_stats(
+    current_user: UserSchema = Depends(require_role(['admin']))
+):
+    return {name: metrics.snapshot() for name, metrics in pool_metrics.items()}
+
+@router.get("/read-routing")
+async def get_read_routing_stats(
+    current_user: UserSchema = Depends(require_role(['admin']))
+):
+    return replica_router.stats()
+
+@router.get("/queries")
+async def get_query_stats(
+    current_user: UserSchema = Depends(require_role(['admin']))
+):
+    return route_query_stats.snapshot()
+
+@router.get("/response-cache")
+async def get_response_cache_stats(
+    current_user: UserSchema = Depends(require_role(['admin']))
+):
+    return response_cache.stats()
+
+@router.get("/org-index")
+async def get_org_index_stats(
+    current_user: UserSchema = Depends(require_role(['admin']))
+):
+    return employer_org_index.stats()
+
+@router.get("/consultant-scope")
+async def get_consultant_scope_stats(
+    current_user: UserSchema = Depends(require_role(['admin']))
+):
+    return {**consultant_scope.stats(), "change_feed": change_feed.stats()}
+
+@router.get("/indexes")
+async def get_index_refresher_stats(
+    current_user: UserSchema = Depends(require_role(['admin']))
+):
+    return index_refresher.stats()
+
+@router.get("/summary-counters")
+async def get_summary_counters_stats(
+    current_user: UserSchema = Depends(require_role(['admin']))
+):
+    return summary_counters.stats()
+
+@router.get("/user-search")
+async def get_user_search_stats(
+    current_user: UserSchema = Depends(require_role(['admin']))
+):
+    return user_search.stats()
+
+@router.get("/pose-ingest")
+async def get_pose_ingest_stats(
+    current_user: UserSchema = Depends(require_role(['admin']))
+):
+    return {**pose_ingest_stats.as_dict(), "writer": pose_writer.stats(), "live": live_sessions.stats()}
+
+@router.get("/scoring")
+async def get_scoring_stats(
+    current_user: UserSchema = Depends(require_role(['admin']))
+):
+    return session_scorer.stats()
@@ -0,0 +1,93 @@
+# api/pagination.py
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+from fastapi import HTTPException, Query, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+class PageParams:
+    def __init__(self, limit: int, cursor: Optional[str], include_total: bool):
+        self.limit = limit
+        self.cursor = cursor
+        self.include_total = include_total
+
+def page_params(
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: bool = Query(False, description="Also count all matching rows"),
+) -> PageParams:
+    return PageParams(limit, cursor, include_total)
+
+# Rows written before created_at had a default have it NULL. They sort
+# first (DESC NULLS FIRST is a backward scan of the (created_at, id) index
+# on Postgres) and a cursor inside them carries a null created_at.
+
+def encode_cursor(created_at: Optional[datetime], row_id: int) -> str:
+    raw = json.dumps([created_at.isoformat() if created_at else None, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, row_id = json.loads(raw)
+        return (datetime.fromisoformat(created_at) if created_at is not None else None), int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+def keyset_order(model) -> tuple:
+    return model.created_at.desc().nulls_first(), model.id.desc()
+
+def keyset_after(model, created_at: Optional[datetime], row_id: int):
+    # Rows after the cursor in keyset_order
+    if created_at is None:
+        return or_(
+            and_(model.created_at.is_(None), model.id < row_id),
+            model.created_at.isnot(None),
+        )
+    return or_(
+        model.created_at < created_at,
+        and_(model.created_at == created_at, model.id < row_id)
+    )
+
+def _keyset_values(row) -> Tuple[Optional[datetime], int]:
+    if hasattr(row, "keys"):
+        return row["created_at"], row["id"]
+    return row.created_at, row.id
+
+async def paginate(db: AsyncSession, query, model, params: PageParams, scalars: bool = True) -> dict:
+    # Keyset pagination on (created_at, id), newest first. Each page is an
+    # index range scan from the cursor, however deep the page is.
+    total = None
+    if params.include_total:
+        total = await db.scalar(
+            select(func.count()).select_from(query.order_by(None).subquery())
+        )
+
+    if params.cursor:
+        query = query.where(keyset_after(model, *decode_cursor(params.cursor)))
+    query = query.order_by(*keyset_order(model)).limit(params.limit + 1)
+
+    result = await db.execute(query)
+    rows = result.scalars().all() if scalars else result.mappings().all()
+    next_cursor = None
+    if len(rows) > params.limit:
+        rows = rows[:params.limit]
+        next_cursor = encode_cursor(*_keyset_values(rows[-1]))
+
+    return {"items": rows, "next_cursor": next_cursor, "total": total}
+
+def page_json(adapter: TypeAdapter, page: dict) -> bytes:
+    # Validates ORM rows once, from attributes, and lets pydantic-core write
+    # the JSON directly.
+    return adapter.dump_json(adapter.validate_python(page, from_attributes=True), by_alias=True)
+
+def page_response(adapter: TypeAdapter, page: dict) -> Response:
+    # Returning a Response skips FastAPI's second validation and
+    # jsonable_encoder pass; response_model stays for the docs.
+    return Response(content=page_json(adapter, page), media_type="application/json")
@@ -0,0 +1,25 @@
+# api/search.py
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from core.user_search import user_search
+from models.user import RoleEnum
+from schemas.user import UserSearchHit
+from schemas.response_models import UserSchema
+from auth.utils import require_role
+
+router = APIRouter()
+
+SEARCH_WARMING_UP = "Search index is still being built, try again shortly"
+
+@router.get("/users/search", response_model=List[UserSearchHit])
+async def search_users(
+    q: str = Query(..., min_length=1, max_length=100),
+    role: Optional[RoleEnum] = Query(None),
+    employer_id: Optional[int] = Query(None),
+    limit: int = Query(10, ge=1, le=50),
+    current_user: UserSchema = Depends(require_role(['admin']))
+):
+    hits = user_search.search(q, limit, role=role.value if role else None, employer_id=employer_id)
+    if hits is None:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=SEARCH_WARMING_UP)
+    return hits
@@ -0,0 +1,237 @@
+# api/sessions.py
+import asyncio
+import enum
+import logging
+import orjson
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, status
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.database import AsyncSessionLocal, get_async_db
+from analysis.scoring import score_metrics
+from core.pose_ingest import LiveSession, live_sessions, open_pose_stream, pose_ingest_stats
+from core.session_scoring import ScoringQueueFull, session_scorer
+from models.user import AssessmentSession, PoseFrameBatch
+from schemas.user import MovementScore, PoseData
+from schemas.response_models import UserSchema
+from auth.utils import require_role, user_for_token
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# Frames a client may pack into one message
+MAX_FRAMES_PER_MESSAGE = 300
+# Every frame carries the full MediaPipe pose layout
+LANDMARKS_PER_FRAME = 33
+# How long a new connection has to send its auth message
+STREAM_AUTH_TIMEOUT_SECONDS = 10
+
+async def can_access_session(db: AsyncSession, user, session_id: str) -> Optional[bool]:
+    # None when the session does not exist
+    result = await db.execute(
+        select(AssessmentSession.consultant_id).where(AssessmentSession.session_id == session_id)
+    )
+    row = result.first()
+    if row is None:
+        return None
+    consultant_id = row[0]
+    return user.role == "admin" or consultant_id is None or consultant_id == user.id
+
+async def authorize_stream(token: str, session_id: str) -> bool:
+    async with AsyncSessionLocal() as db:
+        try:
+            user = await user_for_token(db, token)
+        except HTTPException:
+            return False
+        if user.role not in ("admin", "consultant"):
+            return False
+        return bool(await can_access_session(db, user, session_id))
+
+async def require_session_access(db: AsyncSession, user: UserSchema, session_id: str) -> None:
+    allowed = await can_access_session(db, user, session_id)
+    if allowed is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
+    if not allowed:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed to access this session")
+
+def submit_for_scoring(session_id: str) -> Optional[dict]:
+    try:
+        return session_scorer.submit(session_id).as_dict()
+    except ScoringQueueFull as error:
+        logger.warning(f"⚠️ Session {session_id} not queued for scoring: {error}")
+        return None
+
+async def open_live_session(session_id: str) -> LiveSession:
+    # Running metrics only cover the whole session if nothing was stored
+    # for it before this stream
+    async with AsyncSessionLocal() as db:
+        exercise_type = await db.scalar(
+            select(AssessmentSession.assessment_type).where(AssessmentSession.session_id == session_id)
+        )
+        stored = await db.scalar(
+            select(PoseFrameBatch.id).where(PoseFrameBatch.session_id == session_id).limit(1)
+        )
+    exercise_type = exercise_type.value if isinstance(exercise_type, enum.Enum) else str(exercise_type)
+    return live_sessions.open(session_id, exercise_type, complete=stored is None)
+
+def live_score(session_id: str, live: LiveSession) -> MovementScore:
+    score = score_metrics(live.accumulator.metrics())
+    score.session_id = session_id
+    score.timestamp = datetime.utcnow().isoformat()
+    return score
+
+async def finish_scoring(session_id: str, live: LiveSession) -> Optional[dict]:
+    # The running metrics already cover every frame, so the final score is
+    # written right away; otherwise the session goes to the scoring pool
+    if live.complete and live.streams == 1 and live.accumulator.frame_count:
+        try:
+            job = await session_scorer.record(session_id, live_score(session_id, live))
+            return job.as_dict()
+        except Exception as error:
+            logger.error(f"❌ Saving the live score for session {session_id} failed: {error}")
+    return submit_for_scoring(session_id)
+
+def parse_frames(payload, session_id: str) -> list:
+    # A message is one PoseData object or a list of them; frames are kept
+    # as [timestamp, [[x, y, visibility], ...]]
+    items = payload if isinstance(payload, list) else [payload]
+    if len(items) > MAX_FRAMES_PER_MESSAGE:
+        raise ValueError(f"At most {MAX_FRAMES_PER_MESSAGE} frames per message")
+    frames = []
+    for item in items:
+        # Checked before validation so an oversized list is never parsed
+        landmarks = item.get("landmarks") if isinstance(item, dict) else None
+        if not isinstance(landmarks, list) or len(landmarks) != LANDMARKS_PER_FRAME:
+            raise ValueError(f"Each frame must have {LANDMARKS_PER_FRAME} landmarks")
+        frame = PoseData.model_validate(item)
+        if frame.session_id is not None and frame.session_id != session_id:
+            raise ValueError("Frame session_id does not match the stream")
+        frames.append([frame.timestamp, [[point.x, point.y, point.visibility] for point in frame.landmarks]])
+    return frames
+
+async def receive_stream_token(websocket: WebSocket) -> Optional[str]:
+    # The first message is {"type": "auth", "token": ...}
+    try:
+        message = await asyncio.wait_for(websocket.receive_text(), STREAM_AUTH_TIMEOUT_SECONDS)
+        payload = orjson.loads(message)
+    except (asyncio.TimeoutError, orjson.JSONDecodeError):
+        return None
+    if not isinstance(payload, dict) or payload.get("type") != "auth":
+        return None
+    token = payload.get("token")
+    return token if isinstance(token, str) else None
+
+@router.websocket("/{session_id}/stream")
+async def stream_pose_frames(
+    websocket: WebSocket,
+    session_id: str
+):
+    # Browsers cannot set headers on a WebSocket, and a query string ends up
+    # in access logs, so the token comes in the first message after the
+    # connection opens. Send {"type": "end"} to flush and get a final count.
+    await websocket.accept()
+    try:
+        token = await receive_stream_token(websocket)
+    except WebSocketDisconnect:
+        return
+    if token is None or not await authorize_stream(token, session_id):
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    live = await open_live_session(session_id)
+    stream = open_pose_stream(session_id, live.accumulator)
+    pose_ingest_stats.connections += 1
+    pose_ingest_stats.active_connections += 1
+    logger.info(f"📡 Pose stream opened for session {session_id}")
+    finished = False
+    try:
+        while True:
+            message = await websocket.receive_text()
+            try:
+                payload = orjson.loads(message)
+            except orjson.JSONDecodeError as error:
+                pose_ingest_stats.frames_rejected += 1
+                await websocket.send_json({"type": "error", "detail": str(error)[:200]})
+                continue
+            if isinstance(payload, dict) and "type" in payload:
+                if payload["type"] == "end":
+                    # Scoring starts only once every frame is committed
+                    stored = await stream.close()
+                    finished = True
+                    job = await finish_scoring(session_id, live) if stored else None
+                    await websocket.send_json({
+                        "type": "closed",
+                        "frames": stream.frames_received,
+                        "batches": stream.batches,
+                        "stored": stored,
+                        "scoring": job["status"] if job else None,
+                    })
+                    await websocket.close()
+                    break
+                continue
+            try:
+                frames = parse_frames(payload, session_id)
+            except (ValidationError, ValueError) as error:
+                pose_ingest_stats.frames_rejected += 1
+                await websocket.send_json({"type": "error", "detail": str(error)[:200]})
+                continue
+            for frame in frames:
+                await stream.put(frame)
+            pose_ingest_stats.frames_received += len(frames)
+    except WebSocketDisconnect:
+        pass
+    except Exception as error:
+        logger.error(f"❌ Pose stream for session {session_id} failed: {error}")
+    finally:
+        if not finished:
+            # Keep what the client already sent, even on an abrupt disconnect
+            try:
+                await stream.close()
+            except Exception:
+                await stream.abort()
+        live_sessions.close(session_id)
+        pose_ingest_stats.active_connections -= 1
+        pose_ingest_stats.queue_full_waits += stream.queue_full_waits
+        logger.info(f"📡 Pose stream closed for session {session_id}: {stream.frames_received} frames in {stream.batches} batches")
+
+@router.post("/{session_id}/score", status_code=status.HTTP_202_ACCEPTED)
+async def score_session(
+    session_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserSchema = Depends(require_role(['admin', 'consultant']))
+):
+    # Queues the session; poll GET /{session_id}/score for the result
+    await require_session_access(db, current_user, session_id)
+    try:
+        job = session_scorer.submit(session_id)
+    except ScoringQueueFull as error:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(error))
+    return job.as_dict()
+
+@router.get("/{session_id}/score")
+async def get_scoring_status(
+    session_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserSchema = Depends(require_role(['admin', 'consultant']))
+):
+    await require_session_access(db, current_user, session_id)
+    job = session_scorer.job(session_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No scoring job for this session")
+    return job.as_dict()
+
+@router.get("/{session_id}/live-score", response_model=MovementScore)
+async def get_live_score(
+    session_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserSchema = Depends(require_role(['admin', 'consultant']))
+):
+    # Provisional score from the frames received so far (up to
+    # POSE_FLUSH_SECONDS behind the stream)
+    await require_session_access(db, current_user, session_id)
+    live = live_sessions.get(session_id)
+    if live is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session is not streaming")
+    return live_score(session_id, live)
@@ -0,0 +1,24 @@
+# api/summary.py
+import logging
+from fastapi import APIRouter, Depends, HTTPException, status
+from core.summary_counters import summary_counters
+from schemas.response_models import UserSchema
+from auth.utils import require_role
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+@router.get("/summary")
+async def get_admin_summary(
+    current_user: UserSchema = Depends(require_role(['admin']))
+):
+    # Served from counters kept current by the change feed, so the
+    # dashboard headline numbers cost no queries
+    try:
+        return await summary_counters.summary()
+    except Exception as error:
+        logger.error(f"❌ Error building admin summary: {error}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to build summary"
+        )
@@ -1,7 +1,7 @@
 # routes/users.py
 from fastapi import APIRouter, Depends, HTTPException, status, Header
-from sqlalchemy.orm import Session
-from core.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.database import get_async_db
 from auth.utils import get_current_user, destroy_token
 from schemas.response_models import (
     LoginRequest,
@@ -17,7 +17,7 @@ from typing import Optional
 router = APIRouter()
 
 @router.post("/login", response_model=LoginResponse, tags=["auth"])
-async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
+async def login(login_data: LoginRequest, db: AsyncSession = Depends(get_async_db)):
     try:
         if not login_data.username or not login_data.password:
             raise HTTPException(
@@ -72,7 +72,7 @@ async def get_me(
 @router.post("/logout", response_model=LogoutResponse, tags=["auth"])
 async def logout(
     authorization: Optional[str] = Header(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     try:
         if not authorization:
@@ -96,7 +96,7 @@ async def logout(
 @router.get("/logout", response_model=LogoutResponse, tags=["auth"])
 async def legacy_logout(
     authorization: Optional[str] = Header(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     try:
         if not authorization:
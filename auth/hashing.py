@@ -0,0 +1,105 @@
+# auth/hashing.py
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+import bcrypt
+
+from core.config import settings
+
+
+class PasswordHasher:
+    # bcrypt releases the GIL while it works, so a small thread pool keeps
+    # hashing off the event loop. max_workers caps how many hashes run at once;
+    # anything beyond that waits in the executor queue and shows up in stats().
+    # Bulk hashing (imports) is held to bulk_workers threads at a time and
+    # waits outside the executor, so it never queues ahead of a login.
+    def __init__(self, max_workers: int, bulk_workers: int = 1):
+        self.max_workers = max_workers
+        self.bulk_workers = max(1, min(bulk_workers, max_workers - 1))
+        self._bulk_slots = asyncio.Semaphore(self.bulk_workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="bcrypt"
+        )
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.max_queue_depth = 0
+        self.total_wait_ms = 0.0
+        self.total_run_ms = 0.0
+
+    async def hash(self, password: str) -> str:
+        hashed = await self._submit(
+            bcrypt.hashpw, password.encode('utf-8'), bcrypt.gensalt()
+        )
+        return hashed.decode('utf-8')
+
+    async def hash_many(self, passwords: List[Optional[str]]) -> List[Optional[str]]:
+        # None for empty passwords
+        async def hash_one(password: Optional[str]) -> Optional[str]:
+            if not password:
+                return None
+            async with self._bulk_slots:
+                return await self.hash(password)
+        return await asyncio.gather(*(hash_one(password) for password in passwords))
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._submit(
+            bcrypt.checkpw, password.encode('utf-8'), hashed.encode('utf-8')
+        )
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "bulk_workers": self.bulk_workers,
+                "queued": self.queued,
+                "running": self.running,
+                "completed": self.completed,
+                "max_queue_depth": self.max_queue_depth,
+                "avg_wait_ms": round(self.total_wait_ms / self.completed, 2) if self.completed else 0.0,
+                "avg_run_ms": round(self.total_run_ms / self.completed, 2) if self.completed else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    async def _submit(self, fn, *args):
+        submitted = time.perf_counter()
+        with self._lock:
+            self.queued += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queued)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self._run, fn, args, submitted
+        )
+
+    def _run(self, fn, args, submitted: float):
+        started = time.perf_counter()
+        with self._lock:
+            self.queued -= 1
+            self.running += 1
+        try:
+            return fn(*args)
+        finally:
+            finished = time.perf_counter()
+            with self._lock:
+                self.running -= 1
+                self.completed += 1
+                self.total_wait_ms += (started - submitted) * 1000
+                self.total_run_ms += (finished - started) * 1000
+
+
+password_hasher = PasswordHasher(settings.BCRYPT_MAX_WORKERS, settings.BCRYPT_BULK_WORKERS)
+
+
+async def hash_password(password: str) -> str:
+    return await password_hasher.hash(password)
+
+
+async def verify_password(password: str, hashed: str) -> bool:
+    return await password_hasher.verify(password, hashed)
@@ -0,0 +1,270 @@
+# auth/revocation.py
+import asyncio
+import hashlib
+import heapq
+import logging
+import math
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.database import AsyncSessionLocal
+from models.user import Session as DBSession, User
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(capacity, 1)
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def add(self, key: str) -> None:
+        for index in self._indexes(key):
+            self._bits[index >> 3] |= 1 << (index & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[index >> 3] & (1 << (index & 7)) for index in self._indexes(key))
+
+    def clear(self) -> None:
+        self._bits = bytearray(len(self._bits))
+
+    def _indexes(self, key: str):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+
+class RevocationStore:
+    # Revoked tokens, kept only until their session would have expired anyway.
+    # A Bloom filter answers the common "not revoked" case without touching the
+    # exact map. At max_entries the soonest-to-expire token is dropped when
+    # evict is set; that is safe in session mode because its session row is
+    # already inactive, so validate_token still rejects it after a cache miss.
+    # Signed mode never reads the row, so there nothing is dropped: the store
+    # grows past max_entries, logs an error and resizes its Bloom filter.
+    def __init__(self, max_entries: int, error_rate: float, default_ttl: timedelta,
+                 evict: bool = True):
+        self.max_entries = max_entries
+        self.error_rate = error_rate
+        self.default_ttl = default_ttl
+        self.evict = evict
+        self._bloom = BloomFilter(max_entries, error_rate)
+        self._bloom_capacity = max_entries
+        self._expiry: Dict[str, datetime] = {}
+        self._heap: List[Tuple[datetime, str]] = []
+        self._removed_since_rebuild = 0
+        # user_id -> (epoch cutoff, expiry): tokens issued before the cutoff
+        # are rejected. Used by signed tokens, which have no session row check.
+        self._user_cutoffs: Dict[int, Tuple[float, datetime]] = {}
+        self._lock = threading.Lock()
+        # Upper end of the last pull from the database
+        self._synced_at: Optional[datetime] = None
+        self.expired = 0
+        self.dropped = 0
+        self.over_capacity = 0
+
+    def revoke(self, token: str, expires_at: Optional[datetime] = None) -> None:
+        now = datetime.utcnow()
+        expires_at = expires_at or now + self.default_ttl
+        if expires_at <= now:
+            return
+        with self._lock:
+            self._purge(now)
+            if self._expiry.get(token) == expires_at:
+                return
+            if len(self._expiry) >= self.max_entries:
+                if self.evict:
+                    while len(self._expiry) >= self.max_entries and self._heap:
+                        if self._pop_oldest():
+                            self.dropped += 1
+                else:
+                    if not self.over_capacity:
+                        logger.error(
+                            f"❌ Revocation store is over capacity ({len(self._expiry)} of "
+                            f"{self.max_entries}); raise REVOCATION_MAX_ENTRIES"
+                        )
+                    self.over_capacity += 1
+            self._expiry[token] = expires_at
+            heapq.heappush(self._heap, (expires_at, token))
+            if len(self._expiry) > self._bloom_capacity:
+                self._rebuild_bloom()
+            else:
+                self._bloom.add(token)
+
+    def is_revoked(self, token: str) -> bool:
+        if token not in self._bloom:
+            return False
+        with self._lock:
+            expires_at = self._expiry.get(token)
+            return expires_at is not None and expires_at > datetime.utcnow()
+
+    def revoke_user(self, user_id: int, cutoff: Optional[datetime] = None) -> None:
+        # cutoff: users.tokens_valid_after, naive UTC like every other column
+        cutoff = cutoff or datetime.utcnow()
+        epoch = cutoff.replace(tzinfo=timezone.utc).timestamp()
+        with self._lock:
+            current = self._user_cutoffs.get(user_id)
+            if current is None or current[0] < epoch:
+                self._user_cutoffs[user_id] = (epoch, cutoff + self.default_ttl)
+
+    def is_user_revoked(self, user_id: int, issued_at: float) -> bool:
+        cutoff = self._user_cutoffs.get(user_id)
+        return cutoff is not None and issued_at <= cutoff[0] and cutoff[1] > datetime.utcnow()
+
+    def __contains__(self, token: str) -> bool:
+        return self.is_revoked(token)
+
+    def __len__(self) -> int:
+        return len(self._expiry)
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            return self._purge(datetime.utcnow())
+
+    async def load_from_db(self, db: AsyncSession, since: Optional[datetime] = None) -> int:
+        # Logged-out sessions that have not expired yet are still revoked;
+        # without eviction every one of them is needed. With since, only
+        # sessions revoked and users cut off from then on are read.
+        now = datetime.utcnow()
+        query = select(DBSession.token, DBSession.expires_at).where(
+            DBSession.is_active == False,
+            DBSession.expires_at > now
+        ).order_by(DBSession.expires_at.desc())
+        if since is not None:
+            query = query.where(DBSession.revoked_at >= since)
+        elif self.evict:
+            query = query.limit(self.max_entries)
+        rows = (await db.execute(query)).all()
+        for token, expires_at in rows:
+            self.revoke(token, expires_at)
+
+        users = await db.execute(
+            select(User.id, User.tokens_valid_after).where(
+                User.tokens_valid_after >= (since or now - self.default_ttl)
+            )
+        )
+        for user_id, cutoff in users:
+            self.revoke_user(user_id, cutoff)
+        self._synced_at = now
+        if since is None:
+            logger.info(f"🔒 Rehydrated {len(rows)} revoked tokens from sessions")
+        return len(rows)
+
+    async def sync_from_db(self, db: AsyncSession, overlap: timedelta = timedelta(seconds=5)) -> int:
+        # Revocations written by other workers since the last pull; the
+        # window overlaps the previous one so a commit racing it is not missed
+        if self._synced_at is None:
+            return await self.load_from_db(db)
+        return await self.load_from_db(db, self._synced_at - overlap)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._expiry),
+                "revoked_users": len(self._user_cutoffs),
+                "max_entries": self.max_entries,
+                "bloom_bits": self._bloom.num_bits,
+                "bloom_hashes": self._bloom.num_hashes,
+                "expired": self.expired,
+                "dropped": self.dropped,
+                "over_capacity": self.over_capacity,
+            }
+
+    def _purge(self, now: datetime) -> int:
+        removed = 0
+        while self._heap and self._heap[0][0] <= now:
+            if self._pop_oldest():
+                removed += 1
+        for user_id, (_, until) in list(self._user_cutoffs.items()):
+            if until <= now:
+                del self._user_cutoffs[user_id]
+        self.expired += removed
+        return removed
+
+    def _pop_oldest(self) -> bool:
+        expires_at, token = heapq.heappop(self._heap)
+        # Skip heap entries superseded by a later revoke() of the same token
+        if self._expiry.get(token) != expires_at:
+            return False
+        del self._expiry[token]
+        self._removed_since_rebuild += 1
+        if self._removed_since_rebuild > self.max_entries // 4:
+            self._rebuild_bloom()
+        return True
+
+    def _rebuild_bloom(self) -> None:
+        # Bloom filters cannot delete, so stale bits are cleared by rebuilding;
+        # a store grown past its capacity gets a filter twice its size
+        if len(self._expiry) > self._bloom_capacity:
+            self._bloom_capacity = len(self._expiry) * 2
+            self._bloom = BloomFilter(self._bloom_capacity, self.error_rate)
+        else:
+            self._bloom.clear()
+        for token in self._expiry:
+            self._bloom.add(token)
+        self._removed_since_rebuild = 0
+
+
+class RevocationSync:
+    # Signed tokens are checked against this worker's memory only, so each
+    # worker pulls the logouts and user cutoffs recorded through the others
+    # every interval_seconds. That interval bounds how long a revoked token
+    # keeps working elsewhere, like the token cache TTL does in session mode.
+    def __init__(self, store: RevocationStore, interval_seconds: float):
+        self.store = store
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+        self.runs = 0
+        self.failures = 0
+        self.tokens_pulled = 0
+        self.last_run_ms = 0.0
+        self.last_run_at: Optional[datetime] = None
+
+    async def start(self) -> None:
+        if self.interval_seconds <= 0 or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "interval_seconds": self.interval_seconds,
+            "runs": self.runs,
+            "failures": self.failures,
+            "tokens_pulled": self.tokens_pulled,
+            "last_run_ms": self.last_run_ms,
+            "last_run_at": self.last_run_at,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            started = time.perf_counter()
+            try:
+                async with AsyncSessionLocal() as db:
+                    self.tokens_pulled += await self.store.sync_from_db(db)
+            except Exception as error:
+                self.failures += 1
+                logger.error(f"❌ Revocation sync failed: {error}")
+                continue
+            self.runs += 1
+            self.last_run_ms = round((time.perf_counter() - started) * 1000, 2)
+            self.last_run_at = datetime.utcnow()
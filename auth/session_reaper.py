@@ -0,0 +1,108 @@
+# auth/session_reaper.py
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import delete, select
+
+from core.database import AsyncSessionLocal
+from models.user import Session as DBSession
+
+logger = logging.getLogger(__name__)
+
+
+class SessionReaper:
+    # Periodically deletes sessions that expired more than retention ago.
+    # Rows go in small batches, each in its own transaction, so a backlog
+    # never holds a long lock on the sessions table.
+    def __init__(self, interval_seconds: float, batch_size: int, retention: timedelta,
+                 pause_seconds: float = 0.05):
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.retention = retention
+        self.pause_seconds = pause_seconds
+        self._task: Optional[asyncio.Task] = None
+        self.runs = 0
+        self.batches = 0
+        self.rows_removed = 0
+        self.last_run_rows = 0
+        self.last_batch_ms = 0.0
+        self.max_batch_ms = 0.0
+        self.last_run_at: Optional[datetime] = None
+
+    async def start(self) -> None:
+        if self.interval_seconds <= 0 or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def reap(self) -> int:
+        cutoff = datetime.utcnow() - self.retention
+        removed = 0
+        while True:
+            count = await self._delete_batch(cutoff)
+            removed += count
+            if count < self.batch_size:
+                break
+            await asyncio.sleep(self.pause_seconds)
+        self.runs += 1
+        self.rows_removed += removed
+        self.last_run_rows = removed
+        self.last_run_at = datetime.utcnow()
+        if removed:
+            logger.info(f"🧹 Session reaper removed {removed} expired sessions")
+        return removed
+
+    def stats(self) -> dict:
+        return {
+            "interval_seconds": self.interval_seconds,
+            "batch_size": self.batch_size,
+            "retention_hours": self.retention.total_seconds() / 3600,
+            "runs": self.runs,
+            "batches": self.batches,
+            "rows_removed": self.rows_removed,
+            "last_run_rows": self.last_run_rows,
+            "last_batch_ms": self.last_batch_ms,
+            "max_batch_ms": self.max_batch_ms,
+            "last_run_at": self.last_run_at,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.reap()
+            except Exception as error:
+                logger.error(f"❌ Session reaper failed: {error}")
+            await asyncio.sleep(self.interval_seconds)
+
+    async def _delete_batch(self, cutoff: datetime) -> int:
+        started = time.perf_counter()
+        batch_ids = (
+            select(DBSession.id)
+            .where(DBSession.expires_at < cutoff)
+            .limit(self.batch_size)
+            .scalar_subquery()
+        )
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                delete(DBSession)
+                .where(DBSession.id.in_(batch_ids))
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        elapsed = round((time.perf_counter() - started) * 1000, 2)
+        self.batches += 1
+        self.last_batch_ms = elapsed
+        self.max_batch_ms = max(self.max_batch_ms, elapsed)
+        return result.rowcount
@@ -0,0 +1,135 @@
+# auth/session_touch.py
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Dict, Optional, Set
+
+from sqlalchemy import bindparam, update
+
+from core.database import AsyncSessionLocal
+from models.user import Session as DBSession
+
+logger = logging.getLogger(__name__)
+
+sessions_table = DBSession.__table__
+
+
+class LastAccessedBuffer:
+    # Write-behind buffer for Session.last_accessed. Touches are coalesced per
+    # token in memory and written as one executemany UPDATE, either every
+    # flush_seconds or as soon as max_pending tokens are waiting. While the
+    # database is failing the buffer holds at most max_buffered tokens; touches
+    # for further tokens are dropped (last_accessed is best effort).
+    def __init__(self, flush_seconds: float, max_pending: int):
+        self.flush_seconds = flush_seconds
+        self.max_pending = max_pending
+        self.max_buffered = max_pending * 2
+        self._pending: Dict[str, datetime] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._inflight: Set[asyncio.Task] = set()
+        self._flush_lock = asyncio.Lock()
+        self.touches = 0
+        self.dropped = 0
+        self.flushes = 0
+        self.rows_written = 0
+        self.last_flush_ms = 0.0
+
+    @property
+    def write_through(self) -> bool:
+        return self.flush_seconds <= 0
+
+    def touch(self, token: str, when: Optional[datetime] = None) -> None:
+        if token not in self._pending and len(self._pending) >= self.max_buffered:
+            self.dropped += 1
+            return
+        self._pending[token] = when or datetime.utcnow()
+        self.touches += 1
+        # One size-triggered flush at a time; a failing database would
+        # otherwise get a new flush task from every request
+        if len(self._pending) >= self.max_pending and not self._inflight and not self._flush_lock.locked():
+            task = asyncio.create_task(self._safe_flush())
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def flush(self) -> int:
+        async with self._flush_lock:
+            batch = self._take()
+            if not batch:
+                return 0
+            await self._write(batch)
+            return len(batch)
+
+    async def start(self) -> None:
+        if self.write_through or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        # Drain whatever is still buffered before the process exits
+        await self.flush()
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._pending),
+            "flush_seconds": self.flush_seconds,
+            "max_pending": self.max_pending,
+            "touches": self.touches,
+            "dropped": self.dropped,
+            "flushes": self.flushes,
+            "rows_written": self.rows_written,
+            "last_flush_ms": self.last_flush_ms,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_seconds)
+            await self._safe_flush()
+
+    async def _safe_flush(self) -> None:
+        try:
+            await self.flush()
+        except Exception as error:
+            logger.error(f"❌ last_accessed flush failed: {error}")
+
+    def _take(self) -> Dict[str, datetime]:
+        batch, self._pending = self._pending, {}
+        return batch
+
+    async def _write(self, batch: Dict[str, datetime]) -> None:
+        started = time.perf_counter()
+        stmt = (
+            update(sessions_table)
+            .where(sessions_table.c.token == bindparam("b_token"))
+            .values(last_accessed=bindparam("b_last_accessed"))
+        )
+        params = [
+            {"b_token": token, "b_last_accessed": when}
+            for token, when in batch.items()
+        ]
+        async with AsyncSessionLocal() as db:
+            try:
+                await db.execute(stmt, params)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                # Put the batch back unless newer touches already replaced it,
+                # up to max_buffered tokens
+                for token, when in batch.items():
+                    if token in self._pending:
+                        continue
+                    if len(self._pending) >= self.max_buffered:
+                        self.dropped += 1
+                        continue
+                    self._pending[token] = when
+                raise
+        self.flushes += 1
+        self.rows_written += len(batch)
+        self.last_flush_ms = round((time.perf_counter() - started) * 1000, 2)
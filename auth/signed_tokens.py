@@ -0,0 +1,80 @@
+# auth/signed_tokens.py
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+import time
+from datetime import datetime
+from typing import Tuple
+
+from core.config import settings
+from schemas.user import User as UserSchema
+
+TOKEN_PREFIX = "v1"
+
+
+class SignedTokenError(Exception):
+    pass
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _signing_key() -> bytes:
+    if not settings.AUTH_SIGNING_KEY:
+        raise SignedTokenError("AUTH_SIGNING_KEY must be set when AUTH_MODE is 'signed'")
+    return settings.AUTH_SIGNING_KEY.encode("utf-8")
+
+
+def _sign(message: bytes) -> str:
+    return _b64encode(hmac.new(_signing_key(), message, hashlib.sha256).digest())
+
+
+def issue_signed_token(user: UserSchema, expires_at: datetime) -> Tuple[str, str]:
+    # The token carries the public user fields so get_current_user can build
+    # the UserSchema without a database round-trip. Returns the token and its
+    # jti, which is what the sessions row and the revocation list store: the
+    # token itself grows with the user's fields.
+    jti = secrets.token_urlsafe(16)
+    claims = {
+        "sub": user.id,
+        "role": user.role,
+        "iat": time.time(),
+        "exp": (expires_at - datetime.utcnow()).total_seconds() + time.time(),
+        "jti": jti,
+        "usr": user.model_dump(mode="json"),
+    }
+    payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode("utf-8"))
+    signing_input = f"{TOKEN_PREFIX}.{payload}"
+    return f"{signing_input}.{_sign(signing_input.encode('ascii'))}", jti
+
+
+def verify_signed_token(token: str) -> dict:
+    try:
+        prefix, payload, signature = token.split(".")
+    except ValueError:
+        raise SignedTokenError("Malformed token")
+    if prefix != TOKEN_PREFIX:
+        raise SignedTokenError("Unknown token version")
+
+    expected = _sign(f"{prefix}.{payload}".encode("ascii"))
+    if not hmac.compare_digest(signature, expected):
+        raise SignedTokenError("Bad signature")
+
+    try:
+        claims = json.loads(_b64decode(payload))
+    except ValueError:
+        raise SignedTokenError("Malformed payload")
+    if claims.get("exp", 0) <= time.time():
+        raise SignedTokenError("Token expired")
+    return claims
+
+
+def signed_token_expiry(claims: dict) -> datetime:
+    return datetime.utcfromtimestamp(claims["exp"])
@@ -2,17 +2,21 @@
 from datetime import datetime, timedelta
 from typing import Optional
 from api.users import LoginResponse
-import bcrypt
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 import secrets
 from models.user import User, Session as DBSession
 from schemas.user import User as UserSchema
-async def authenticate_user(db: Session, username: str, password: str) -> Optional[LoginResponse]:
+from auth.hashing import verify_password
+from auth.signed_tokens import issue_signed_token
+from core.config import settings
+async def authenticate_user(db: AsyncSession, username: str, password: str) -> Optional[LoginResponse]:
     try:
         print("Attempting authentication for:", username)
         
         # Direct database query
-        user = db.query(User).filter(User.username == username).first()
+        result = await db.execute(select(User).where(User.username == username))
+        user = result.scalars().first()
         
         print("Database query result:", {
             "id": user.id if user else None,
@@ -33,7 +37,7 @@ async def authenticate_user(db: Session, username: str, password: str) -> Option
         print(f"  - Stored password hash: {user.password[:20]}...")
         
         is_password_valid = (
-            bcrypt.checkpw(password.encode('utf-8'), user.password.encode('utf-8')) 
+            await verify_password(password, user.password)
             if user.password.startswith('$2b$') 
             else user.password == password
         )
@@ -49,21 +53,26 @@ async def authenticate_user(db: Session, username: str, password: str) -> Option
             return None
         
         # Create session in database
-        token = secrets.token_urlsafe(32)
         expires_at = datetime.utcnow() + timedelta(hours=24)  # 24 hours
+        user_data = UserSchema.from_orm(user)
+        if settings.AUTH_MODE == "signed":
+            # The row is kept for auditing and logout only, requests never
+            # look it up; it stores the token's jti
+            token, session_token = issue_signed_token(user_data, expires_at)
+        else:
+            token = session_token = secrets.token_urlsafe(32)
         
         db_session = DBSession(
-            token=token,
+            token=session_token,
             user_id=user.id,
             expires_at=expires_at
         )
         db.add(db_session)
-        db.commit()
+        await db.commit()
         
         print("Authentication successful, database session created")
         
         # Return user without password
-        user_data = UserSchema.from_orm(user)
         return LoginResponse(
             user=user_data,
             token=token
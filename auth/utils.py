@@ -1,36 +1,104 @@
 # auth/utils.py
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.user import Session as DBSession, User
 from schemas.user import User as UserSchema
-from core.database import get_db
+from core.database import get_async_db
+from core.config import settings
+from auth.token_cache import TokenCache
+from auth.session_touch import LastAccessedBuffer
+from auth.revocation import RevocationStore, RevocationSync
+from auth.session_reaper import SessionReaper
+from auth.signed_tokens import SignedTokenError, verify_signed_token, signed_token_expiry
 
 security = HTTPBearer()
-invalidated_tokens = set()
+revoked_tokens = RevocationStore(
+    max_entries=settings.REVOCATION_MAX_ENTRIES,
+    error_rate=settings.REVOCATION_BLOOM_ERROR_RATE,
+    default_ttl=timedelta(hours=24),
+    # Signed tokens are never checked against their session row
+    evict=settings.AUTH_MODE != "signed"
+)
+revocation_sync = RevocationSync(
+    revoked_tokens,
+    interval_seconds=settings.REVOCATION_SYNC_SECONDS if settings.AUTH_MODE == "signed" else 0
+)
+token_cache = TokenCache(
+    max_size=settings.TOKEN_CACHE_MAX_SIZE,
+    ttl_seconds=settings.TOKEN_CACHE_TTL_SECONDS
+)
+last_accessed_buffer = LastAccessedBuffer(
+    flush_seconds=settings.SESSION_TOUCH_FLUSH_SECONDS,
+    max_pending=settings.SESSION_TOUCH_MAX_PENDING
+)
+session_reaper = SessionReaper(
+    interval_seconds=settings.SESSION_REAPER_INTERVAL_SECONDS,
+    batch_size=settings.SESSION_REAPER_BATCH_SIZE,
+    retention=timedelta(hours=settings.SESSION_REAPER_RETENTION_HOURS)
+)
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> UserSchema:
-    token = credentials.credentials
+    return await user_for_token(db, credentials.credentials)
+
+async def user_for_token(db: AsyncSession, token: str) -> UserSchema:
+    # Shared by the HTTP dependency and WebSocket handlers, which receive the
+    # token in a message instead of an Authorization header
+    if settings.AUTH_MODE == "signed":
+        return validate_signed_token(token)
     return await validate_token(db, token)
 
-async def validate_token(db: Session, token: str) -> UserSchema:
+def validate_signed_token(token: str) -> UserSchema:
+    # Signed mode: signature, expiry and the in-memory revocation list only,
+    # the sessions table is not consulted. Revocations are keyed by jti.
+    try:
+        claims = verify_signed_token(token)
+    except SignedTokenError as error:
+        print(f"Signed token rejected: {error}")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token"
+        )
+    if revoked_tokens.is_revoked(claims["jti"]):
+        print('Token has been invalidated')
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token"
+        )
+    if revoked_tokens.is_user_revoked(claims["sub"], claims["iat"]):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token"
+        )
+    return UserSchema.model_validate(claims["usr"])
+
+async def validate_token(db: AsyncSession, token: str) -> UserSchema:
     try:
-        if token in invalidated_tokens:
+        if revoked_tokens.is_revoked(token):
             print('Token has been invalidated')
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid or expired token"
             )
+
+        cached_user = token_cache.get(token)
+        if cached_user is not None:
+            if not last_accessed_buffer.write_through:
+                last_accessed_buffer.touch(token)
+            return cached_user
         
-        db_session = db.query(DBSession).filter(
+        result = await db.execute(select(DBSession).where(
             DBSession.token == token,
             DBSession.is_active == True,
             DBSession.expires_at > datetime.utcnow()
-        ).first()
+        ))
+        db_session = result.scalars().first()
         
         if not db_session:
             print(f'No valid session found for token: {token[:10]}...')
@@ -39,20 +107,26 @@ async def validate_token(db: Session, token: str) -> UserSchema:
                 detail="Invalid or expired token"
             )
         
-        db_session.last_accessed = datetime.utcnow()
-        db.commit()
+        if last_accessed_buffer.write_through:
+            db_session.last_accessed = datetime.utcnow()
+            await db.commit()
+        else:
+            last_accessed_buffer.touch(token)
         
-        user = db.query(User).filter(User.id == db_session.user_id).first()
+        user = await db.get(User, db_session.user_id)
         
         if not user or not user.is_active:
             db_session.is_active = False
-            db.commit()
+            db_session.revoked_at = datetime.utcnow()
+            await db.commit()
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User inactive"
             )
         
-        return UserSchema.from_orm(user)
+        user_data = UserSchema.from_orm(user)
+        token_cache.set(token, user_data, db_session.expires_at)
+        return user_data
         
     except HTTPException:
         raise
@@ -63,14 +137,29 @@ async def validate_token(db: Session, token: str) -> UserSchema:
             detail="Authentication failed"
         )
 
-async def destroy_token(db: Session, token: str) -> None:
+async def destroy_token(db: AsyncSession, token: str) -> None:
     try:
-        db_session = db.query(DBSession).filter(DBSession.token == token).first()
+        session_token, expires_at = token, None
+        if settings.AUTH_MODE == "signed":
+            # Sessions rows and revocations hold the jti; a token that no
+            # longer verifies is rejected anyway
+            try:
+                claims = verify_signed_token(token)
+            except SignedTokenError:
+                print(f"Signed token already invalid: {token[:10]}...")
+                return
+            session_token, expires_at = claims["jti"], signed_token_expiry(claims)
+
+        result = await db.execute(select(DBSession).where(DBSession.token == session_token))
+        db_session = result.scalars().first()
         if db_session:
             db_session.is_active = False
-            db.commit()
-            
-        invalidated_tokens.add(token)
+            db_session.revoked_at = datetime.utcnow()
+            await db.commit()
+            expires_at = db_session.expires_at
+
+        revoked_tokens.revoke(session_token, expires_at)
+        token_cache.evict(token)
         print(f"Session destroyed and token invalidated: {token[:10]}...")
     except Exception as error:
         print("Token destruction error:", error)
@@ -79,6 +168,14 @@ async def destroy_token(db: Session, token: str) -> None:
             detail="Logout failed"
         )
 
+def invalidate_user_tokens(user_id: int, cutoff: Optional[datetime] = None) -> None:
+    # Called when a user's role, status or profile changes so no cached or
+    # already-issued token keeps serving the old snapshot. cutoff is the
+    # users.tokens_valid_after the caller committed, which is how other
+    # workers learn of it.
+    token_cache.evict_user(user_id)
+    revoked_tokens.revoke_user(user_id, cutoff)
+
 def require_role(roles: list[str]):
     def role_checker(current_user: UserSchema = Depends(get_current_user)):
         if current_user.role not in roles:
@@ -0,0 +1,90 @@
+# benchmarks/assessment_listing.py
+#
+# Statement count and wall time of the admin assessment listing as the table
+# grows: the old per-row employee lookup against the joined, projected query.
+# Seeds a throwaway in-memory SQLite database:
+#
+#   python -m benchmarks.assessment_listing --sizes 100 1000 10000
+import argparse
+import asyncio
+import os
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from api.assessments import assessment_list_query
+from core.query_stats import RequestQueryStats, current_query_stats, instrument_engine
+from models.user import Assessment, Base, User
+
+
+async def seed(db: AsyncSession, size: int) -> None:
+    employees = max(1, size // 10)
+    await db.execute(insert(User), [
+        {"email": f"e{i}@example.com", "role": "employee",
+         "first_name": f"First{i}", "last_name": f"Last{i}"}
+        for i in range(employees)
+    ])
+    await db.execute(insert(Assessment), [
+        {"assessment_id": f"A{i}", "user_id": i % employees + 1,
+         "assessment_type": "manual", "title": f"Assessment {i}",
+         "status": "completed" if i % 3 else "scheduled"}
+        for i in range(size)
+    ])
+    await db.commit()
+
+
+async def old_listing(db: AsyncSession) -> int:
+    assessments = (await db.execute(select(Assessment))).scalars().all()
+    results = []
+    for assessment in assessments:
+        user = await db.get(User, assessment.user_id)
+        results.append({
+            **assessment.__dict__,
+            "employee_name": f"{user.first_name} {user.last_name}" if user else "Unknown Employee"
+        })
+    return len(results)
+
+
+async def new_listing(db: AsyncSession) -> int:
+    result = await db.execute(assessment_list_query([]))
+    return len(result.mappings().all())
+
+
+async def measure(engine, listing) -> tuple:
+    stats = RequestQueryStats()
+    token = current_query_stats.set(stats)
+    try:
+        async with AsyncSession(engine) as db:
+            started = time.perf_counter()
+            rows = await listing(db)
+            elapsed = (time.perf_counter() - started) * 1000
+    finally:
+        current_query_stats.reset(token)
+    return rows, stats.count, elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'old queries':>12} {'old ms':>10} {'new queries':>12} {'new ms':>10}")
+    for size in args.sizes:
+        engine = create_async_engine("sqlite+aiosqlite://")
+        instrument_engine(engine.sync_engine)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine) as db:
+            await seed(db, size)
+
+        _, old_queries, old_ms = await measure(engine, old_listing)
+        rows, new_queries, new_ms = await measure(engine, new_listing)
+        print(f"{rows:>8} {old_queries:>12} {old_ms:>10.1f} {new_queries:>12} {new_ms:>10.1f}")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
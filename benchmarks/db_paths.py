@@ -0,0 +1,78 @@
+# benchmarks/db_paths.py
+#
+# Concurrent-request throughput of the sync get_db path (psycopg2, blocking
+# the event loop the way the old routers did) against the AsyncSession path
+# (asyncpg). Uses DATABASE_URL from the environment / .env:
+#
+#   python -m benchmarks.db_paths --requests 500 --concurrency 50 --sleep-ms 5
+#
+# --sleep-ms adds pg_sleep to each query to model network/DB latency; set it
+# to 0 on non-Postgres databases.
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import select, text
+
+from core.database import AsyncSessionLocal, SessionLocal, async_engine, engine
+from models.user import User
+
+
+def build_statement(sleep_ms: float):
+    if sleep_ms > 0:
+        return text("SELECT pg_sleep(:seconds)").bindparams(seconds=sleep_ms / 1000)
+    return select(User.id).limit(50)
+
+
+async def sync_request(statement) -> None:
+    # Mirrors an `async def` route using Depends(get_db)
+    db = SessionLocal()
+    try:
+        db.execute(statement).all()
+    finally:
+        db.close()
+
+
+async def async_request(statement) -> None:
+    async with AsyncSessionLocal() as db:
+        (await db.execute(statement)).all()
+
+
+async def run(label: str, request, statement, total: int, concurrency: int) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            await request(statement)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    await request(statement)  # warm the pool
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    print(
+        f"{label:<6} {total / elapsed:8.1f} req/s  "
+        f"p50={latencies[len(latencies) // 2]:7.2f} ms  "
+        f"p99={latencies[int(len(latencies) * 0.99) - 1]:7.2f} ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--sleep-ms", type=float, default=5)
+    args = parser.parse_args()
+
+    statement = build_statement(args.sleep_ms)
+    await run("sync", sync_request, statement, args.requests, args.concurrency)
+    await run("async", async_request, statement, args.requests, args.concurrency)
+    engine.dispose()
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,72 @@
+# benchmarks/movement_codec.py
+#
+# Per-session storage size and decode time of movement data: the legacy JSON
+# (PoseData-style landmark dicts) against the binary float32 format in
+# analysis.movement_codec. Sessions are synthetic 33-landmark recordings:
+#
+#   python -m benchmarks.movement_codec --seconds 10 60 300 --fps 30
+import argparse
+import time
+
+import numpy as np
+import orjson
+
+from analysis.movement_codec import decode_movement, encode_movement, movement_from_json
+
+LANDMARKS = 33
+
+
+def synthetic_session(frames: int, fps: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    timestamps = np.arange(frames) / fps
+    points = rng.random((frames, LANDMARKS, 3), dtype=np.float32)
+    legacy = [
+        {
+            "timestamp": float(timestamps[i]),
+            "landmarks": [
+                {"x": float(x), "y": float(y), "visibility": float(v)}
+                for x, y, v in points[i]
+            ],
+        }
+        for i in range(frames)
+    ]
+    return timestamps, points, legacy
+
+
+def best_of(repeats: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=int, nargs="+", default=[10, 60, 300])
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    for seconds in args.seconds:
+        frames = seconds * args.fps
+        timestamps, points, legacy = synthetic_session(frames, args.fps)
+        json_text = orjson.dumps(legacy)
+        blob = encode_movement(timestamps, points)
+
+        json_ms = best_of(args.repeats, lambda: movement_from_json(orjson.loads(json_text)))
+        blob_ms = best_of(args.repeats, lambda: decode_movement(blob))
+        decoded = decode_movement(blob)
+        assert np.array_equal(decoded.points, points)
+
+        print(
+            f"{seconds:4d}s {frames:6d} frames  "
+            f"json={len(json_text) / 1024:9.1f} KiB  blob={len(blob) / 1024:8.1f} KiB  "
+            f"({len(json_text) / len(blob):4.1f}x smaller)  "
+            f"decode json={json_ms:8.2f} ms  blob={blob_ms:6.3f} ms  ({json_ms / blob_ms:7.0f}x faster)"
+        )
+
+
+if __name__ == "__main__":
+    main()
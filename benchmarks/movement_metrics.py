@@ -0,0 +1,79 @@
+# benchmarks/movement_metrics.py
+#
+# Throughput of analysis.metrics on one core, in frames per second, against
+# the same joint angles computed with a per-frame Python loop. Sessions are
+# synthetic 33-landmark recordings at 30 fps:
+#
+#   python -m benchmarks.movement_metrics --frames 900 9000 90000
+import argparse
+import math
+import os
+import time
+
+# Pin BLAS and friends to one thread so the numbers are per core
+for _var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_var, "1")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import numpy as np
+
+from analysis.metrics import JOINTS, MIN_VISIBILITY, compute_movement_metrics
+from analysis.movement_codec import MovementArrays
+
+LANDMARKS = 33
+FPS = 30
+
+
+def synthetic_session(frames: int, seed: int = 0) -> MovementArrays:
+    rng = np.random.default_rng(seed)
+    points = rng.random((frames, LANDMARKS, 3), dtype=np.float32)
+    points[..., 2] = 0.6 + 0.4 * points[..., 2]
+    return MovementArrays(np.arange(frames) / FPS, points)
+
+
+def loop_angles(movement: MovementArrays) -> list:
+    # The per-frame, per-joint approach this replaces (angles only)
+    frames = movement.points.tolist()
+    result = []
+    for frame in frames:
+        row = []
+        for proximal, vertex, distal in JOINTS.values():
+            (ax, ay, av), (bx, by, bv), (cx, cy, cv) = frame[proximal], frame[vertex], frame[distal]
+            if min(av, bv, cv) < MIN_VISIBILITY:
+                row.append(float("nan"))
+                continue
+            ux, uy, vx, vy = ax - bx, ay - by, cx - bx, cy - by
+            row.append(math.degrees(math.atan2(abs(ux * vy - uy * vx), ux * vx + uy * vy)))
+        result.append(row)
+    return result
+
+
+def timed(fn, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, nargs="+", default=[900, 9000, 90000])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--loop-max-frames", type=int, default=9000,
+                        help="Skip the slow Python loop above this many frames")
+    args = parser.parse_args()
+
+    for frames in args.frames:
+        movement = synthetic_session(frames)
+        vectorized = timed(lambda: compute_movement_metrics(movement, "benchmark"), args.repeats)
+        line = f"{frames:7d} frames  vectorized (all metrics) {frames / vectorized:12,.0f} frames/s"
+        if frames <= args.loop_max_frames:
+            loop = timed(lambda: loop_angles(movement), max(1, args.repeats // 2))
+            line += f"  python loop (angles only) {frames / loop:10,.0f} frames/s  ({loop / vectorized:5.1f}x)"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# benchmarks/pose_ingest.py
+#
+# Sustained pose-frame ingestion: many simulated cameras stream frames at a
+# fixed rate over the WebSocket endpoint for a while, then end their streams.
+# Reports the frame rate the server kept up with, how late the cameras fell
+# behind their schedule (backpressure), and the shared writer's numbers.
+# Runs the app under uvicorn in this process against a throwaway SQLite file:
+#
+#   python -m benchmarks.pose_ingest --cameras 200 --fps 30 --seconds 10
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+
+_db_dir = tempfile.mkdtemp(prefix="pose_ingest_")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_db_dir}/bench.db")
+
+import bcrypt
+import uvicorn
+import websockets
+from sqlalchemy import func, insert, select
+
+from core.database import AsyncSessionLocal, async_engine
+from models.user import AssessmentSession, Base, PoseFrameBatch, User
+
+LANDMARKS = 33
+
+
+async def seed(sessions: int) -> None:
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(User), [{
+            "username": "bench", "email": "bench@example.com", "role": "admin",
+            "first_name": "Bench", "last_name": "Admin",
+            "password": bcrypt.hashpw(b"bench", bcrypt.gensalt(4)).decode(),
+        }])
+        await db.execute(insert(AssessmentSession), [
+            {"session_id": f"bench-{i}", "assessment_type": "manual"}
+            for i in range(sessions)
+        ])
+        await db.commit()
+
+
+def landmarks_json(camera: int) -> str:
+    # Serialized once per camera so the simulated clients spend their CPU on
+    # sending, not on building JSON
+    return json.dumps([
+        {"x": (camera + point) % 100 / 100, "y": point / LANDMARKS, "visibility": 0.9}
+        for point in range(LANDMARKS)
+    ])
+
+
+async def camera(url: str, token: str, camera_id: int, fps: int, seconds: float) -> dict:
+    interval = 1 / fps
+    frames = int(fps * seconds)
+    lags = []
+    landmarks = landmarks_json(camera_id)
+    async with websockets.connect(url, max_queue=None) as ws:
+        await ws.send(json.dumps({"type": "auth", "token": token}))
+        started = time.perf_counter()
+        for index in range(frames):
+            scheduled = started + index * interval
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                lags.append(-delay * 1000)
+            await ws.send(f'{{"landmarks":{landmarks},"timestamp":{index / fps}}}')
+        await ws.send(json.dumps({"type": "end"}))
+        closed = json.loads(await ws.recv())
+    return {"sent": frames, "acked": closed.get("frames", 0), "lags": lags}
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cameras", type=int, default=200)
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    await seed(args.cameras)
+
+    import main as app_module
+    from core.pose_ingest import pose_writer
+
+    server = uvicorn.Server(uvicorn.Config(
+        app_module.app, host="127.0.0.1", port=args.port, log_level="warning", ws="websockets"
+    ))
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    import httpx
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{args.port}") as client:
+        response = await client.post("/api/auth/login", json={"username": "bench", "password": "bench"})
+        token = response.json()["token"]
+
+    url = f"ws://127.0.0.1:{args.port}/api/sessions/bench-{{}}/stream"
+    started = time.perf_counter()
+    results = await asyncio.gather(*(
+        camera(url.format(i), token, i, args.fps, args.seconds) for i in range(args.cameras)
+    ))
+    elapsed = time.perf_counter() - started
+
+    server.should_exit = True
+    await serving
+
+    async with AsyncSessionLocal() as db:
+        stored = await db.scalar(select(func.coalesce(func.sum(PoseFrameBatch.frame_count), 0)))
+        batches = await db.scalar(select(func.count()).select_from(PoseFrameBatch))
+
+    sent = sum(result["sent"] for result in results)
+    acked = sum(result["acked"] for result in results)
+    lags = sorted(lag for result in results for lag in result["lags"])
+    p99 = lags[int(len(lags) * 0.99) - 1] if lags else 0.0
+    print(
+        f"cameras={args.cameras} target={args.cameras * args.fps} frames/s  "
+        f"achieved={sent / elapsed:8.1f} frames/s over {elapsed:.1f}s"
+    )
+    print(
+        f"sent={sent} acked={acked} stored={stored} in {batches} batches  "
+        f"late sends={len(lags)} p50={statistics.median(lags) if lags else 0:.2f} ms "
+        f"p99={p99:.2f} ms max={max(lags, default=0):.2f} ms"
+    )
+    print("writer stats:", pose_writer.stats())
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+# benchmarks/serialization.py
+#
+# Encode time and allocations for a 10k-row employee page: FastAPI's default
+# response path (validate into the response model, serialize, jsonable_encoder,
+# json.dumps) against the pre-built TypeAdapter + dump_json fast path.
+#
+#   python -m benchmarks.serialization --rows 10000 --repeat 5
+import argparse
+import asyncio
+import os
+import time
+import tracemalloc
+from datetime import datetime
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from api.pagination import page_response
+from models.user import User as UserModel
+from schemas.response_models import Page, UserPageAdapter
+from schemas.user import User as UserSchema
+
+
+def build_page(rows: int) -> dict:
+    now = datetime.utcnow()
+    items = [
+        UserModel(
+            id=i, email=f"employee{i}@example.com", role="employee",
+            first_name=f"First{i}", last_name=f"Last{i}",
+            is_active=True, created_at=now,
+        )
+        for i in range(rows)
+    ]
+    return {"items": items, "next_cursor": None, "total": rows}
+
+
+def default_path(field, response_class):
+    async def encode(page):
+        content = await serialize_response(field=field, response_content=page)
+        return response_class(content).body
+    return encode
+
+
+def fast_path():
+    async def encode(page):
+        return page_response(UserPageAdapter, page).body
+    return encode
+
+
+async def measure(label: str, encode, page: dict, repeat: int) -> bytes:
+    body = await encode(page)  # warm-up
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await encode(page)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    await encode(page)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{label:<22} best={min(timings):8.1f} ms  peak alloc={peak / 1024 / 1024:7.2f} MiB  body={len(body) / 1024:7.1f} KiB")
+    return body
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    page = build_page(args.rows)
+    field = create_model_field(name="Response", type_=Page[UserSchema], mode="serialization")
+
+    await measure("default (json)", default_path(field, JSONResponse), page, args.repeat)
+    await measure("default (orjson)", default_path(field, ORJSONResponse), page, args.repeat)
+    await measure("TypeAdapter.dump_json", fast_path(), page, args.repeat)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+# core/change_feed.py
+import logging
+from typing import Callable, Dict, List
+
+from sqlalchemy import inspect
+
+logger = logging.getLogger(__name__)
+
+
+class Change:
+    __slots__ = ("table", "op", "row")
+
+    def __init__(self, table: str, op: str, row: dict):
+        self.table = table
+        # "insert", "update" or "delete"
+        self.op = op
+        # Column values loaded on the object at flush time; always has "id"
+        self.row = row
+
+
+class ChangeFeed:
+    # Committed ORM writes, handed to in-process subscribers (the derived
+    # in-memory indexes) after the transaction commits. Changes are
+    # snapshotted at flush time and dropped on rollback, so subscribers
+    # never see uncommitted state. Writes made with Core statements bypass
+    # the ORM and must be published explicitly.
+    def __init__(self):
+        self._subscribers: Dict[str, List[Callable[[List[Change]], None]]] = {}
+        self.published = 0
+        self.failures = 0
+
+    def subscribe(self, table: str, callback: Callable[[List[Change]], None]) -> None:
+        self._subscribers.setdefault(table, []).append(callback)
+
+    def capture(self, session) -> None:
+        if not self._subscribers:
+            return
+        pending = session.info.setdefault("pending_changes", [])
+        for op, objects in (("insert", session.new), ("update", session.dirty), ("delete", session.deleted)):
+            for obj in objects:
+                table = getattr(obj, "__tablename__", None)
+                if table not in self._subscribers:
+                    continue
+                state = inspect(obj)
+                row = {
+                    attr.key: state.dict[attr.key]
+                    for attr in state.mapper.column_attrs
+                    if attr.key in state.dict
+                }
+                pending.append(Change(table, op, row))
+
+    def discard(self, session) -> None:
+        session.info.pop("pending_changes", None)
+
+    def commit(self, session) -> None:
+        changes = session.info.pop("pending_changes", None)
+        if changes:
+            self.publish(changes)
+
+    def publish(self, changes: List[Change]) -> None:
+        by_table: Dict[str, List[Change]] = {}
+        for change in changes:
+            by_table.setdefault(change.table, []).append(change)
+        for table, table_changes in by_table.items():
+            for callback in self._subscribers.get(table, ()):
+                # A broken subscriber must not fail the request that wrote
+                try:
+                    callback(table_changes)
+                except Exception as error:
+                    self.failures += 1
+                    logger.error(f"❌ Change feed subscriber {callback} failed: {error}")
+            self.published += len(table_changes)
+
+    def stats(self) -> dict:
+        return {
+            "subscribers": {table: len(callbacks) for table, callbacks in self._subscribers.items()},
+            "published": self.published,
+            "failures": self.failures,
+        }
+
+
+change_feed = ChangeFeed()
@@ -2,6 +2,94 @@ from pydantic_settings import BaseSettings  # ✅ use pydantic_settings instead
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    # Adds X-DB-* query count/time headers to every response
+    DEBUG: bool = False
+
+    # Connection pool, applied to both the sync and the async engine
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_SLOW_WAIT_MS: float = 100
+    # sslmode for Postgres connections; empty leaves it to the driver default
+    DB_SSL_MODE: str = "require"
+
+    # Optional read replica for read-only endpoints. Reads fall back to the
+    # primary for REPLICA_RETRY_SECONDS after a replica failure, and for
+    # REPLICA_MAX_STALENESS_SECONDS after a write (0 = no read-after-write pinning).
+    READ_REPLICA_URL: str = ""
+    REPLICA_RETRY_SECONDS: float = 30
+    REPLICA_MAX_STALENESS_SECONDS: float = 0
+
+    # Per-request query instrumentation
+    SLOW_QUERY_MS: float = 200
+    N_PLUS_ONE_THRESHOLD: int = 5
+
+    # ETag response cache for rarely-changing reference lists. TTL bounds how
+    # stale another worker's copy can get, as invalidation is per process.
+    RESPONSE_CACHE_MAX_ENTRIES: int = 256
+    RESPONSE_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    RESPONSE_CACHE_TTL_SECONDS: float = 30
+
+    # In-process cache of validated bearer tokens (0 disables it)
+    TOKEN_CACHE_MAX_SIZE: int = 10000
+    TOKEN_CACHE_TTL_SECONDS: float = 60
+
+    # Write-behind of Session.last_accessed. FLUSH_SECONDS is the freshness
+    # window; 0 writes through on every request like before.
+    SESSION_TOUCH_FLUSH_SECONDS: float = 30
+    SESSION_TOUCH_MAX_PENDING: int = 1000
+
+    # Threads available for bcrypt hashing/verification
+    BCRYPT_MAX_WORKERS: int = 4
+    # How many of them bulk imports may hold at once, so logins always find
+    # a free thread
+    BCRYPT_BULK_WORKERS: int = 1
+
+    # Logged-out tokens kept in memory until their session expires
+    REVOCATION_MAX_ENTRIES: int = 100000
+    REVOCATION_BLOOM_ERROR_RATE: float = 0.001
+    # Signed mode: how often each worker pulls logouts and user cutoffs made
+    # through other workers, which bounds how long they go unseen (0 disables it)
+    REVOCATION_SYNC_SECONDS: float = 10
+
+    # "session" looks every token up in the sessions table; "signed" issues
+    # HMAC-signed tokens that are verified without a query.
+    AUTH_MODE: str = "session"
+    AUTH_SIGNING_KEY: str = ""
+
+    # Background deletion of expired sessions (interval 0 disables it)
+    SESSION_REAPER_INTERVAL_SECONDS: float = 600
+    SESSION_REAPER_BATCH_SIZE: int = 1000
+    SESSION_REAPER_RETENTION_HOURS: float = 24
+
+    # Lifetime of an employer's cached org sets, which is how long edits made
+    # through another worker can go unseen by this one
+    ORG_INDEX_TTL_SECONDS: float = 60
+
+    # Full rebuild of the in-memory indexes (consultant scope, summary
+    # counters, user search) on one shared schedule, which picks up writes
+    # made by other worker processes (0 disables it)
+    INDEX_REFRESH_SECONDS: float = 300
+
+    # WebSocket pose ingestion: frames buffered per connection before the
+    # socket stops being read, frames per stored batch, and how long a
+    # partial batch may wait
+    POSE_QUEUE_MAX_FRAMES: int = 256
+    POSE_BATCH_MAX_FRAMES: int = 120
+    POSE_FLUSH_SECONDS: float = 1.0
+    # Batches waiting for the shared writer, and batches per INSERT
+    POSE_WRITER_MAX_PENDING: int = 1000
+    POSE_WRITER_MAX_ROWS: int = 200
+
+    # Process pool that scores finished sessions. MAX_PENDING bounds the
+    # queue (beyond it submissions get a 503); a job whose worker crashes is
+    # retried until MAX_ATTEMPTS; JOB_HISTORY finished jobs stay pollable.
+    SCORING_MAX_WORKERS: int = 2
+    SCORING_MAX_PENDING: int = 100
+    SCORING_MAX_ATTEMPTS: int = 3
+    SCORING_JOB_HISTORY: int = 1000
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,191 @@
+# core/consultant_scope.py
+import heapq
+import logging
+from datetime import datetime
+from typing import Dict, FrozenSet, Optional, Set, Tuple
+
+from sqlalchemy import and_, or_
+
+from core.change_feed import Change
+from core.derived_index import DerivedIndex, index_refresher
+from models.user import User, RoleEnum
+
+logger = logging.getLogger(__name__)
+
+SCOPE_COLUMNS = [
+    User.id, User.role, User.is_active, User.employer_id, User.location,
+    User.created_by_consultant_id, User.assigned_locations, User.created_at,
+]
+
+# Sort key for rows written before created_at had a default; they come
+# first, like NULLS FIRST in api.pagination.keyset_order
+_NO_CREATED_AT = datetime.max
+
+
+class ScopeUser:
+    __slots__ = ("id", "role", "is_active", "employer_id", "location",
+                 "created_by_consultant_id", "assigned_locations", "created_at")
+
+    def __init__(self, row: dict):
+        self.id = row["id"]
+        self.role = None
+        self.is_active = True
+        self.employer_id = None
+        self.location = None
+        self.created_by_consultant_id = None
+        self.assigned_locations: FrozenSet[str] = frozenset()
+        self.created_at = _NO_CREATED_AT
+        self.merge(row)
+
+    def merge(self, row: dict) -> None:
+        for key in self.__slots__:
+            if key not in row or key == "id":
+                continue
+            value = row[key]
+            if key == "role" and value is not None:
+                value = RoleEnum(value).value
+            elif key == "assigned_locations":
+                value = frozenset(value or ())
+            elif key == "created_at" and value is None:
+                value = _NO_CREATED_AT
+            setattr(self, key, value)
+
+    @property
+    def is_employee(self) -> bool:
+        return self.role == RoleEnum.employee.value and bool(self.is_active)
+
+    @property
+    def sort_key(self) -> Tuple[datetime, int]:
+        return (self.created_at, self.id)
+
+
+class ScopeIndex:
+    # One generation of the index: every user's scope-relevant columns plus
+    # two inverted maps over active employees, by creating consultant and
+    # by (employer_id, location).
+    def __init__(self):
+        self.users: Dict[int, ScopeUser] = {}
+        self.by_creator: Dict[int, Set[int]] = {}
+        self.by_location: Dict[Tuple[int, str], Set[int]] = {}
+
+    def apply(self, change: Change) -> None:
+        user_id = change.row.get("id")
+        if user_id is None:
+            return
+        user = self.users.get(user_id)
+        if user is not None:
+            self._unlink(user)
+        if change.op == "delete":
+            self.users.pop(user_id, None)
+            return
+        if user is None:
+            user = ScopeUser(change.row)
+            self.users[user_id] = user
+        else:
+            user.merge(change.row)
+        self._link(user)
+
+    def _link(self, user: ScopeUser) -> None:
+        if not user.is_employee:
+            return
+        if user.created_by_consultant_id is not None:
+            self.by_creator.setdefault(user.created_by_consultant_id, set()).add(user.id)
+        if user.employer_id is not None and user.location is not None:
+            self.by_location.setdefault((user.employer_id, user.location), set()).add(user.id)
+
+    def _unlink(self, user: ScopeUser) -> None:
+        for bucket, key in (
+            (self.by_creator, user.created_by_consultant_id),
+            (self.by_location, (user.employer_id, user.location)),
+        ):
+            members = bucket.get(key)
+            if members is not None:
+                members.discard(user.id)
+                if not members:
+                    del bucket[key]
+
+    def resolve(self, consultant_id: int) -> Set[int]:
+        scope = set(self.by_creator.get(consultant_id, ()))
+        consultant = self.users.get(consultant_id)
+        if consultant is not None and consultant.employer_id is not None:
+            for location in consultant.assigned_locations:
+                scope.update(self.by_location.get((consultant.employer_id, location), ()))
+        return scope
+
+
+class ConsultantScopeResolver(DerivedIndex):
+    # Which employees a consultant may see: the ones they created, plus
+    # every active employee of their employer at one of their assigned
+    # locations. Answered from an in-memory index; until it is built,
+    # callers fall back to scope_conditions() in SQL.
+    columns = {"users": SCOPE_COLUMNS}
+
+    def __init__(self):
+        super().__init__()
+        self.lookups = 0
+        self.fallbacks = 0
+
+    def new_state(self) -> ScopeIndex:
+        return ScopeIndex()
+
+    def apply_change(self, state: ScopeIndex, change: Change) -> None:
+        state.apply(change)
+
+    def built(self, previous: Optional[ScopeIndex], state: ScopeIndex) -> None:
+        logger.info(f"🗂️ Consultant scope index built: {len(state.users)} users in {self.last_build_ms}ms")
+
+    def resolve(self, consultant_id: int) -> Optional[Set[int]]:
+        # Every employee id in the consultant's scope; None when not built
+        with self._lock:
+            if self._state is None:
+                self.fallbacks += 1
+                return None
+            self.lookups += 1
+            return self._state.resolve(consultant_id)
+
+    def page(self, consultant_id: int, after: Optional[Tuple[datetime, int]], limit: int) -> Optional[dict]:
+        # Returns the ids of one page, newest first, with the same keyset
+        # order as api.pagination.paginate; None when the index is not built.
+        with self._lock:
+            if self._state is None:
+                self.fallbacks += 1
+                return None
+            self.lookups += 1
+            users = self._state.users
+            keys = [users[user_id].sort_key for user_id in self._state.resolve(consultant_id)]
+        total = len(keys)
+        if after is not None:
+            after = (_NO_CREATED_AT if after[0] is None else after[0], after[1])
+            keys = [key for key in keys if key < after]
+        top = heapq.nlargest(limit + 1, keys)
+        next_key = top[limit - 1] if len(top) > limit else None
+        if next_key is not None and next_key[0] == _NO_CREATED_AT:
+            next_key = (None, next_key[1])
+        return {"ids": [user_id for _, user_id in top[:limit]], "next_key": next_key, "total": total}
+
+    def stats(self) -> dict:
+        with self._lock:
+            index = self._state
+            return {
+                **self.build_stats(),
+                "users": len(index.users) if index else 0,
+                "creators": len(index.by_creator) if index else 0,
+                "locations": len(index.by_location) if index else 0,
+                "lookups": self.lookups,
+                "fallbacks": self.fallbacks,
+            }
+
+
+def scope_conditions(consultant_id: int, employer_id: Optional[int], assigned_locations) -> list:
+    # The same rule as the index, for use in SQL
+    scope = User.created_by_consultant_id == consultant_id
+    if employer_id is not None and assigned_locations:
+        scope = or_(scope, and_(
+            User.employer_id == employer_id,
+            User.location.in_(list(assigned_locations)),
+        ))
+    return [User.role == RoleEnum.employee, User.is_active == True, scope]
+
+
+consultant_scope = ConsultantScopeResolver()
+index_refresher.register(consultant_scope)
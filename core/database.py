@@ -1,12 +1,51 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from contextlib import asynccontextmanager
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from core.config import settings
+from core import pool_metrics
+from core.read_routing import ReplicaRouter
+from core.query_stats import instrument_engine
+from core.change_feed import change_feed
+
+def async_database_url(url: str) -> str:
+    # DATABASE_URL is written for psycopg2; the async engine needs the
+    # matching async driver for the same database.
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://"):]
+    return url
+
+def engine_options(url: str, is_async: bool) -> dict:
+    # SQLite (used for local runs) keeps SQLAlchemy's own pool choice
+    if url.startswith("sqlite"):
+        return {}
+    options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    if settings.DB_SSL_MODE:
+        # psycopg2 takes sslmode, asyncpg spells it ssl
+        ssl_key = "ssl" if is_async else "sslmode"
+        options["connect_args"] = {ssl_key: settings.DB_SSL_MODE}
+    return options
+
+def instrument_pool(name: str, url: str, engine) -> None:
+    if not url.startswith("sqlite"):
+        pool_metrics.instrument(name, engine, settings.DB_POOL_SLOW_WAIT_MS)
 
 engine = create_engine(
     settings.DATABASE_URL,
     echo=False,
-    connect_args={"sslmode": "require"}  # psycopg2 supports sslmode param
+    **engine_options(settings.DATABASE_URL, is_async=False)
 )
+instrument_pool("primary", settings.DATABASE_URL, engine)
+instrument_engine(engine)
 
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -14,9 +53,117 @@ SessionLocal = sessionmaker(
     bind=engine,
 )
 
+async_engine = create_async_engine(
+    async_database_url(settings.DATABASE_URL),
+    echo=False,
+    **engine_options(settings.DATABASE_URL, is_async=True)
+)
+instrument_pool("primary_async", settings.DATABASE_URL, async_engine.sync_engine)
+instrument_engine(async_engine.sync_engine)
+
+class PrimarySession(Session):
+    pass
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    sync_session_class=PrimarySession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+replica_engine = None
+ReplicaSessionLocal = None
+if settings.READ_REPLICA_URL:
+    replica_engine = create_async_engine(
+        async_database_url(settings.READ_REPLICA_URL),
+        echo=False,
+        **engine_options(settings.READ_REPLICA_URL, is_async=True)
+    )
+    instrument_pool("replica", settings.READ_REPLICA_URL, replica_engine.sync_engine)
+    instrument_engine(replica_engine.sync_engine)
+    ReplicaSessionLocal = async_sessionmaker(
+        bind=replica_engine,
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+replica_router = ReplicaRouter(
+    enabled=replica_engine is not None,
+    retry_seconds=settings.REPLICA_RETRY_SECONDS,
+    max_staleness_seconds=settings.REPLICA_MAX_STALENESS_SECONDS,
+)
+
+# Auth session bookkeeping never makes replica reads stale
+UNTRACKED_WRITE_TABLES = {"sessions"}
+
+def _remember_written_table(conn, clauseelement, multiparams, params, execution_options, result):
+    # Every INSERT/UPDATE/DELETE on the primary, ORM flushes and Core
+    # statements alike (bulk import, score write-back, reaper, touch writer)
+    if getattr(clauseelement, "is_dml", False):
+        table = getattr(clauseelement, "table", None)
+        name = getattr(table, "name", None)
+        if name not in UNTRACKED_WRITE_TABLES:
+            conn.info["primary_write"] = True
+
+def _note_primary_write(conn):
+    if conn.info.pop("primary_write", False):
+        replica_router.note_write()
+
+def _forget_primary_write(conn):
+    conn.info.pop("primary_write", None)
+
+for _primary in (engine, async_engine.sync_engine):
+    event.listen(_primary, "after_execute", _remember_written_table)
+    event.listen(_primary, "commit", _note_primary_write)
+    event.listen(_primary, "rollback", _forget_primary_write)
+
+@event.listens_for(PrimarySession, "after_flush")
+def _capture_changes(session, flush_context):
+    change_feed.capture(session)
+
+@event.listens_for(PrimarySession, "after_rollback")
+def _discard_changes(session):
+    change_feed.discard(session)
+
+@event.listens_for(PrimarySession, "after_commit")
+def _publish_changes(session):
+    change_feed.commit(session)
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+@asynccontextmanager
+async def read_session():
+    # For read-only work: a replica session when one is configured and
+    # healthy, otherwise the primary.
+    if replica_router.use_replica():
+        db = ReplicaSessionLocal()
+        try:
+            await db.connection()
+        except Exception as error:
+            await db.close()
+            replica_router.mark_down(error)
+        else:
+            replica_router.note_read(on_replica=True)
+            try:
+                yield db
+            finally:
+                await db.close()
+            return
+    replica_router.note_read(on_replica=False)
+    async with AsyncSessionLocal() as db:
+        yield db
+
+async def get_read_db():
+    async with read_session() as db:
+        yield db
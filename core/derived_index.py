@@ -0,0 +1,184 @@
+# core/derived_index.py
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+
+from core.change_feed import Change, change_feed
+from core.config import settings
+from core.database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+class DerivedIndex:
+    # In-memory state derived from database tables: built from a full load,
+    # kept current from the change feed, and rebuilt on the shared
+    # index_refresher schedule to pick up writes made by other worker
+    # processes. Subclasses list the columns they read per table and say how
+    # a change updates a state; until the first build, state is None.
+    columns: Dict[str, list] = {}
+
+    def __init__(self):
+        self._state = None
+        self._building: Optional[List[Change]] = None
+        self._lock = threading.Lock()
+        self.builds = 0
+        self.last_build_ms = 0.0
+        self.last_build_at: Optional[datetime] = None
+        self.changes_applied = 0
+        for table in self.columns:
+            change_feed.subscribe(table, self.apply)
+
+    @property
+    def ready(self) -> bool:
+        return self._state is not None
+
+    def new_state(self):
+        raise NotImplementedError
+
+    def apply_change(self, state, change: Change) -> None:
+        raise NotImplementedError
+
+    def built(self, previous, state) -> None:
+        # Called once a rebuild has swapped in its new state
+        pass
+
+    async def rebuild(self) -> None:
+        await rebuild_indexes([self])
+
+    def apply(self, changes: List[Change]) -> None:
+        with self._lock:
+            if self._building is not None:
+                self._building.extend(changes)
+            if self._state is None:
+                return
+            for change in changes:
+                self.apply_change(self._state, change)
+            self.changes_applied += len(changes)
+
+    def build_stats(self) -> dict:
+        return {
+            "ready": self._state is not None,
+            "builds": self.builds,
+            "last_build_ms": self.last_build_ms,
+            "last_build_at": self.last_build_at,
+            "refresh_seconds": index_refresher.refresh_seconds,
+            "changes_applied": self.changes_applied,
+        }
+
+
+_rebuild_lock = asyncio.Lock()
+
+
+async def rebuild_indexes(indexes: List[DerivedIndex]) -> None:
+    # Each table is read once for every index that derives from it. Changes
+    # committed while the tables load are replayed on top of the new states;
+    # applying a change twice leaves the same state.
+    async with _rebuild_lock:
+        started = time.perf_counter()
+        states = {}
+        for index in indexes:
+            with index._lock:
+                index._building = []
+            states[index] = index.new_state()
+        try:
+            tables: Dict[str, list] = {}
+            for index in indexes:
+                for table, columns in index.columns.items():
+                    merged = tables.setdefault(table, [])
+                    keys = {column.key for column in merged}
+                    merged.extend(column for column in columns if column.key not in keys)
+            async with AsyncSessionLocal() as db:
+                for table, columns in tables.items():
+                    readers = [
+                        (index, [column.key for column in index.columns[table]])
+                        for index in indexes if table in index.columns
+                    ]
+                    result = await db.stream(select(*columns).execution_options(yield_per=5000))
+                    async for row in result.mappings():
+                        for index, fields in readers:
+                            index.apply_change(
+                                states[index], Change(table, "insert", {field: row[field] for field in fields})
+                            )
+            elapsed = round((time.perf_counter() - started) * 1000, 2)
+            for index in indexes:
+                with index._lock:
+                    for change in index._building:
+                        index.apply_change(states[index], change)
+                    previous = index._state
+                    index._state = states[index]
+                    index._building = None
+                index.builds += 1
+                index.last_build_ms = elapsed
+                index.last_build_at = datetime.utcnow()
+                index.built(previous, states[index])
+        finally:
+            for index in indexes:
+                with index._lock:
+                    index._building = None
+
+
+class IndexRefresher:
+    # One schedule for every derived index: they are built together at
+    # startup and rebuilt together every refresh_seconds, so each table is
+    # read once per round however many indexes derive from it.
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self.indexes: List[DerivedIndex] = []
+        self._task: Optional[asyncio.Task] = None
+        self.rounds = 0
+        self.failures = 0
+        self.last_round_ms = 0.0
+
+    def register(self, index: DerivedIndex) -> None:
+        self.indexes.append(index)
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        await self.refresh()
+        if self.refresh_seconds > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def refresh(self) -> None:
+        started = time.perf_counter()
+        try:
+            await rebuild_indexes(self.indexes)
+        except Exception as error:
+            self.failures += 1
+            logger.error(f"❌ Derived index rebuild failed: {error}")
+            return
+        self.rounds += 1
+        self.last_round_ms = round((time.perf_counter() - started) * 1000, 2)
+
+    def stats(self) -> dict:
+        return {
+            "refresh_seconds": self.refresh_seconds,
+            "indexes": [type(index).__name__ for index in self.indexes],
+            "rounds": self.rounds,
+            "failures": self.failures,
+            "last_round_ms": self.last_round_ms,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            await self.refresh()
+
+
+index_refresher = IndexRefresher(settings.INDEX_REFRESH_SECONDS)
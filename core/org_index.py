@@ -0,0 +1,97 @@
+# core/org_index.py
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from models.user import Employer
+
+
+class EmployerOrg:
+    __slots__ = ("employer_id", "locations", "business_units", "subclients", "job_roles")
+
+    def __init__(self, employer_id: int, locations, business_units, subclients, job_roles):
+        self.employer_id = employer_id
+        self.locations = frozenset(locations or ())
+        self.business_units = frozenset(business_units or ())
+        self.subclients = frozenset(subclients or ())
+        self.job_roles = frozenset(job_roles or ())
+
+    def invalid(self, field: str, values: Iterable[str]) -> List[str]:
+        # field is one of the set names above; returns the values not in it
+        allowed = getattr(self, field)
+        return [value for value in values if value not in allowed]
+
+
+class EmployerOrgIndex:
+    # Frozen sets of each employer's locations, business units, subclients
+    # and job roles, loaded on first use and dropped when the employer is
+    # updated or deleted. Membership checks never touch the database once
+    # an employer is warm. Invalidation only reaches this process, so
+    # entries also expire after ttl_seconds to pick up edits made through
+    # other workers.
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._orgs: Dict[int, Tuple[EmployerOrg, float]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    async def get(self, db: AsyncSession, employer_id: int) -> Optional[EmployerOrg]:
+        with self._lock:
+            cached = self._orgs.get(employer_id)
+            if cached is not None:
+                org, expires = cached
+                if expires > time.monotonic():
+                    self.hits += 1
+                    return org
+                del self._orgs[employer_id]
+                self.expirations += 1
+            self.misses += 1
+            generation = self._generation
+
+        result = await db.execute(
+            select(
+                Employer.locations, Employer.business_units,
+                Employer.subclients, Employer.job_roles,
+            ).where(Employer.id == employer_id)
+        )
+        row = result.first()
+        if row is None:
+            return None
+        org = EmployerOrg(employer_id, *row)
+
+        with self._lock:
+            # An invalidation while the row was loading means it may be
+            # stale already, so it is used for this call but not kept
+            if generation == self._generation:
+                self._orgs[employer_id] = (org, time.monotonic() + self.ttl_seconds)
+        return org
+
+    def invalidate(self, employer_id: int) -> None:
+        with self._lock:
+            self._orgs.pop(employer_id, None)
+            self._generation += 1
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "employers": len(self._orgs),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "ttl_seconds": self.ttl_seconds,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+employer_org_index = EmployerOrgIndex(settings.ORG_INDEX_TTL_SECONDS)
@@ -0,0 +1,120 @@
+# core/pool_metrics.py
+import logging
+import threading
+import time
+from typing import Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+logger = logging.getLogger(__name__)
+
+
+class PoolMetrics:
+    # Bound to an engine rather than a pool: engine.dispose() swaps in a new
+    # pool, and the numbers should describe whichever one serves traffic now
+    def __init__(self, name: str, slow_wait_ms: float, engine: Engine):
+        self.name = name
+        self.slow_wait_ms = slow_wait_ms
+        self.engine = engine
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.slow_waits = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self.connects = 0
+        self.total_connect_ms = 0.0
+        self.max_connect_ms = 0.0
+
+    def record_wait(self, elapsed_ms: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait_ms += elapsed_ms
+            self.max_wait_ms = max(self.max_wait_ms, elapsed_ms)
+            if elapsed_ms < self.slow_wait_ms:
+                return
+            self.slow_waits += 1
+        logger.warning(
+            f"⏳ DB pool '{self.name}' checkout waited {elapsed_ms:.1f} ms ({self.status()})"
+        )
+
+    def record_timeout(self, elapsed_ms: float) -> None:
+        with self._lock:
+            self.timeouts += 1
+        logger.error(
+            f"❌ DB pool '{self.name}' checkout timed out after {elapsed_ms:.1f} ms ({self.status()})"
+        )
+
+    def record_connect(self, elapsed_ms: float) -> None:
+        with self._lock:
+            self.connects += 1
+            self.total_connect_ms += elapsed_ms
+            self.max_connect_ms = max(self.max_connect_ms, elapsed_ms)
+        logger.info(f"🔌 DB pool '{self.name}' opened a connection in {elapsed_ms:.1f} ms")
+
+    def status(self) -> str:
+        return self.engine.pool.status()
+
+    def snapshot(self) -> dict:
+        pool = self.engine.pool
+        with self._lock:
+            data = {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "slow_waits": self.slow_waits,
+                "avg_wait_ms": round(self.total_wait_ms / self.checkouts, 3) if self.checkouts else 0.0,
+                "max_wait_ms": round(self.max_wait_ms, 3),
+                "connects": self.connects,
+                "avg_connect_ms": round(self.total_connect_ms / self.connects, 3) if self.connects else 0.0,
+                "max_connect_ms": round(self.max_connect_ms, 3),
+            }
+        # QueuePool and AsyncAdaptedQueuePool expose these; other pools may not
+        for key, attr in (("size", "size"), ("checked_out", "checkedout"),
+                          ("idle", "checkedin"), ("overflow", "overflow")):
+            if hasattr(pool, attr):
+                data[key] = getattr(pool, attr)()
+        if "overflow" in data:
+            # QueuePool counts overflow from -pool_size
+            data["overflow"] = max(0, data["overflow"])
+        return data
+
+
+pool_metrics: Dict[str, PoolMetrics] = {}
+
+
+def instrument(name: str, engine: Engine, slow_wait_ms: float) -> PoolMetrics:
+    # Connect times come from pool events registered on the engine, which
+    # carry over to the pool that replaces this one on dispose(). The start
+    # time rides on the connection record: under asyncpg several connects
+    # interleave on one thread. The pool has no event before a checkout
+    # starts waiting, so checkout waits (and pool timeouts) are timed around
+    # this engine's raw_connection() instead.
+    metrics = PoolMetrics(name, slow_wait_ms, engine)
+
+    @event.listens_for(engine, "do_connect")
+    def _before_connect(dialect, conn_rec, cargs, cparams):
+        conn_rec.info["connect_started"] = time.perf_counter()
+
+    @event.listens_for(engine, "connect")
+    def _after_connect(dbapi_connection, connection_record):
+        started = connection_record.info.pop("connect_started", None)
+        if started is not None:
+            metrics.record_connect((time.perf_counter() - started) * 1000)
+
+    raw_connection = engine.raw_connection
+
+    def timed_raw_connection():
+        started = time.perf_counter()
+        try:
+            connection = raw_connection()
+        except PoolTimeoutError:
+            metrics.record_timeout((time.perf_counter() - started) * 1000)
+            raise
+        metrics.record_wait((time.perf_counter() - started) * 1000)
+        return connection
+
+    engine.raw_connection = timed_raw_connection
+    pool_metrics[name] = metrics
+    return metrics
@@ -0,0 +1,361 @@
+# core/pose_ingest.py
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError, TimeoutError as PoolTimeoutError
+
+from analysis.movement_codec import MovementArrays, encode_movement, movement_from_frames
+from analysis.online_metrics import MovementAccumulator
+from core.config import settings
+from core.database import AsyncSessionLocal
+from models.user import PoseFrameBatch
+
+logger = logging.getLogger(__name__)
+
+# A frame as stored: [timestamp, [[x, y, visibility], ...]]
+Frame = list
+
+
+def is_transient(error: Exception) -> bool:
+    # Lost connections, pool timeouts and lock waits clear up on their own;
+    # constraint and data errors fail the same way on every retry
+    if isinstance(error, DBAPIError):
+        return error.connection_invalidated or isinstance(error, (OperationalError, InterfaceError))
+    return isinstance(error, (PoolTimeoutError, OSError, asyncio.TimeoutError))
+
+
+class PoseBatchWriter:
+    # Shared writer behind every pose stream. Connections hand it finished
+    # batches through a bounded queue; it drains up to max_rows of them into
+    # one executemany INSERT. When the database falls behind or is
+    # unreachable, the write is retried until it succeeds; meanwhile the
+    # queue fills, submit() waits, and that wait reaches each socket as
+    # backpressure. Rows are only dropped if the database is still failing at
+    # shutdown. A permanent error (a session row that is gone, bad data) is
+    # not retried: the rows are written one at a time so only the offending
+    # ones are rejected and every other stream carries on. submit() hands
+    # back a future that resolves once the row is committed (True) or
+    # dropped or rejected (False); rows are written in order, so the last
+    # one a stream submitted resolves after all of its earlier ones.
+    def __init__(self, max_pending: int, max_rows: int, shutdown_retries: int = 3,
+                 max_backoff_seconds: float = 5.0):
+        self.max_pending = max_pending
+        self.max_rows = max_rows
+        self.shutdown_retries = shutdown_retries
+        self.max_backoff_seconds = max_backoff_seconds
+        self._stopping = False
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self.batches_submitted = 0
+        self.submit_waits = 0
+        self.writes = 0
+        self.write_failures = 0
+        self.batches_written = 0
+        self.frames_written = 0
+        self.batches_dropped = 0
+        self.frames_dropped = 0
+        self.batches_rejected = 0
+        self.frames_rejected = 0
+        self.last_write_ms = 0.0
+        self.max_write_ms = 0.0
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        # The writer drains whatever connections already handed over, then
+        # exits at the marker; a write still failing gives up after
+        # shutdown_retries attempts
+        self._stopping = True
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+        self._queue = None
+
+    async def submit(self, session_id: str, movement: MovementArrays) -> asyncio.Future:
+        if self._queue is None:
+            raise RuntimeError("Pose batch writer is not running")
+        row = {
+            "session_id": session_id,
+            "frame_count": movement.frame_count,
+            "first_timestamp": float(movement.timestamps[0]),
+            "last_timestamp": float(movement.timestamps[-1]),
+            "frames_blob": encode_movement(movement.timestamps, movement.points),
+        }
+        written = asyncio.get_running_loop().create_future()
+        if self._queue.full():
+            self.submit_waits += 1
+        await self._queue.put((row, written))
+        self.batches_submitted += 1
+        return written
+
+    def stats(self) -> dict:
+        return {
+            "pending_batches": self._queue.qsize() if self._queue else 0,
+            "max_pending": self.max_pending,
+            "max_rows": self.max_rows,
+            "batches_submitted": self.batches_submitted,
+            "submit_waits": self.submit_waits,
+            "writes": self.writes,
+            "write_failures": self.write_failures,
+            "batches_written": self.batches_written,
+            "frames_written": self.frames_written,
+            "batches_dropped": self.batches_dropped,
+            "frames_dropped": self.frames_dropped,
+            "batches_rejected": self.batches_rejected,
+            "frames_rejected": self.frames_rejected,
+            "last_write_ms": self.last_write_ms,
+            "max_write_ms": self.max_write_ms,
+        }
+
+    def _take(self, first: tuple) -> List[tuple]:
+        items = [first]
+        while len(items) < self.max_rows and not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is None:
+                self._queue.put_nowait(None)
+                break
+            items.append(item)
+        return items
+
+    async def _run(self) -> None:
+        while True:
+            first = await self._queue.get()
+            if first is None:
+                return
+            await self._write(self._take(first))
+
+    async def _write(self, items: List[tuple]) -> None:
+        rows = [row for row, _ in items]
+        frames = sum(row["frame_count"] for row in rows)
+        attempt = 0
+        while True:
+            attempt += 1
+            started = time.perf_counter()
+            try:
+                async with AsyncSessionLocal() as db:
+                    await db.execute(insert(PoseFrameBatch), rows)
+                    await db.commit()
+            except Exception as error:
+                self.write_failures += 1
+                if not is_transient(error):
+                    await self._reject(items, error)
+                    return
+                logger.error(f"❌ Pose batch write failed (attempt {attempt}): {error}")
+                if self._stopping and attempt >= self.shutdown_retries:
+                    break
+                await asyncio.sleep(min(0.1 * 2 ** attempt, self.max_backoff_seconds))
+                continue
+            elapsed = round((time.perf_counter() - started) * 1000, 2)
+            self.writes += 1
+            self.batches_written += len(rows)
+            self.frames_written += frames
+            self.last_write_ms = elapsed
+            self.max_write_ms = max(self.max_write_ms, elapsed)
+            self._resolve(items, True)
+            return
+        logger.error(f"❌ Dropped {frames} pose frames for good at shutdown")
+        self.batches_dropped += len(rows)
+        self.frames_dropped += frames
+        self._resolve(items, False)
+
+    async def _reject(self, items: List[tuple], error: Exception) -> None:
+        if len(items) > 1:
+            logger.warning(f"⚠️ Pose batch write rejected, writing its {len(items)} rows one at a time: {error}")
+            for item in items:
+                await self._write([item])
+            return
+        row, _ = items[0]
+        logger.error(f"❌ Pose batch for session {row['session_id']} rejected: {error}")
+        self.batches_rejected += 1
+        self.frames_rejected += row["frame_count"]
+        self._resolve(items, False)
+
+    @staticmethod
+    def _resolve(items: List[tuple], written: bool) -> None:
+        for _, future in items:
+            if not future.done():
+                future.set_result(written)
+
+
+class PoseStream:
+    # One connection's frames. The receive loop put()s into a bounded queue
+    # (waiting when it is full, so the socket is simply not read); a batcher
+    # task groups frames into batches of up to batch_frames, or whatever
+    # arrived within flush_seconds, and submits them to the writer. Each
+    # batch also updates the session's running metrics, if it has any.
+    def __init__(self, session_id: str, writer: PoseBatchWriter, max_queue: int,
+                 batch_frames: int, flush_seconds: float,
+                 accumulator: Optional[MovementAccumulator] = None):
+        self.session_id = session_id
+        self.writer = writer
+        self.accumulator = accumulator
+        self.batch_frames = batch_frames
+        self.flush_seconds = flush_seconds
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._closing = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._written: Optional[asyncio.Future] = None
+        self.batches_lost = 0
+        self.frames_received = 0
+        self.batches = 0
+        self.queue_full_waits = 0
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def put(self, frame: Frame) -> None:
+        if self._queue.full():
+            self.queue_full_waits += 1
+        await self._queue.put(frame)
+        self.frames_received += 1
+
+    async def close(self) -> bool:
+        # Flushes everything queued so far and waits until it is committed,
+        # so a scoring job started afterwards reads every frame. False when
+        # the writer dropped or rejected any of the stream's batches.
+        if self._task is None:
+            return True
+        self._closing.set()
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+        if self._written is not None:
+            await self._written
+        return not self.batches_lost
+
+    async def abort(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        closing = False
+        while not closing:
+            first = await self._queue.get()
+            if first is None:
+                break
+            batch = [first]
+            deadline = loop.time() + self.flush_seconds
+            while len(batch) < self.batch_frames:
+                closing = self._drain(batch)
+                if closing or len(batch) >= self.batch_frames:
+                    break
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                # One wakeup per flush interval rather than one per frame;
+                # close() cuts the wait short
+                try:
+                    await asyncio.wait_for(self._closing.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+            movement = movement_from_frames(batch)
+            if self.accumulator is not None:
+                self.accumulator.update(movement.timestamps, movement.points)
+            self._written = await self.writer.submit(self.session_id, movement)
+            self._written.add_done_callback(self._count_lost)
+            self.batches += 1
+
+    def _count_lost(self, written: asyncio.Future) -> None:
+        if not written.result():
+            self.batches_lost += 1
+
+    def _drain(self, batch: List[Frame]) -> bool:
+        while len(batch) < self.batch_frames and not self._queue.empty():
+            frame = self._queue.get_nowait()
+            if frame is None:
+                return True
+            batch.append(frame)
+        return False
+
+
+class PoseIngestStats:
+    def __init__(self):
+        self.connections = 0
+        self.active_connections = 0
+        self.frames_received = 0
+        self.frames_rejected = 0
+        self.queue_full_waits = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "connections": self.connections,
+            "active_connections": self.active_connections,
+            "frames_received": self.frames_received,
+            "frames_rejected": self.frames_rejected,
+            "queue_full_waits": self.queue_full_waits,
+        }
+
+
+class LiveSession:
+    def __init__(self, exercise_type: str, complete: bool):
+        self.accumulator = MovementAccumulator(exercise_type)
+        # False when frames were stored before this stream opened, or two
+        # streams fed it at once: the running metrics then miss or mix frames
+        self.complete = complete
+        self.streams = 0
+
+
+class LiveSessions:
+    # Running metrics of every session with an open stream, so a provisional
+    # score can be read mid-session and the final one written on close
+    def __init__(self):
+        self._sessions: Dict[str, LiveSession] = {}
+
+    def open(self, session_id: str, exercise_type: str, complete: bool) -> LiveSession:
+        live = self._sessions.get(session_id)
+        if live is None:
+            live = self._sessions[session_id] = LiveSession(exercise_type, complete)
+        else:
+            live.complete = False
+        live.streams += 1
+        return live
+
+    def get(self, session_id: str) -> Optional[LiveSession]:
+        return self._sessions.get(session_id)
+
+    def close(self, session_id: str) -> None:
+        live = self._sessions.get(session_id)
+        if live is None:
+            return
+        live.streams -= 1
+        if live.streams <= 0:
+            del self._sessions[session_id]
+
+    def stats(self) -> dict:
+        return {
+            "live_sessions": len(self._sessions),
+            "incomplete": sum(1 for live in self._sessions.values() if not live.complete),
+        }
+
+
+pose_writer = PoseBatchWriter(settings.POSE_WRITER_MAX_PENDING, settings.POSE_WRITER_MAX_ROWS)
+pose_ingest_stats = PoseIngestStats()
+live_sessions = LiveSessions()
+
+
+def open_pose_stream(session_id: str, accumulator: Optional[MovementAccumulator] = None) -> PoseStream:
+    stream = PoseStream(
+        session_id, pose_writer,
+        max_queue=settings.POSE_QUEUE_MAX_FRAMES,
+        batch_frames=settings.POSE_BATCH_MAX_FRAMES,
+        flush_seconds=settings.POSE_FLUSH_SECONDS,
+        accumulator=accumulator,
+    )
+    stream.start()
+    return stream
@@ -0,0 +1,128 @@
+# core/query_stats.py
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_literals = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_whitespace = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    # Parameters are already bound out of the SQL; this also folds inlined
+    # literals and LIMIT/OFFSET numbers so equivalent statements compare equal.
+    return _whitespace.sub(" ", _literals.sub("?", statement)).strip()
+
+
+class RequestQueryStats:
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.shapes: Counter = Counter()
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated_shapes(self, threshold: int) -> List[tuple]:
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= threshold]
+
+
+current_query_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+class RouteQueryStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: Dict[str, dict] = {}
+
+    def record(self, route: str, stats: RequestQueryStats, suspected_n_plus_one: bool) -> None:
+        with self._lock:
+            entry = self._routes.setdefault(route, {
+                "requests": 0,
+                "queries": 0,
+                "db_ms": 0.0,
+                "max_queries": 0,
+                "max_db_ms": 0.0,
+                "n_plus_one_requests": 0,
+            })
+            entry["requests"] += 1
+            entry["queries"] += stats.count
+            entry["db_ms"] += stats.total_ms
+            entry["max_queries"] = max(entry["max_queries"], stats.count)
+            entry["max_db_ms"] = max(entry["max_db_ms"], stats.total_ms)
+            if suspected_n_plus_one:
+                entry["n_plus_one_requests"] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                route: {
+                    **entry,
+                    "db_ms": round(entry["db_ms"], 2),
+                    "max_db_ms": round(entry["max_db_ms"], 2),
+                    "avg_queries": round(entry["queries"] / entry["requests"], 2),
+                    "avg_db_ms": round(entry["db_ms"] / entry["requests"], 2),
+                }
+                for route, entry in self._routes.items()
+            }
+
+
+route_query_stats = RouteQueryStats()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started"].pop()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed_ms)
+    if elapsed_ms >= settings.SLOW_QUERY_MS:
+        logger.warning(f"🐢 Slow query ({elapsed_ms:.1f} ms): {statement_shape(statement)[:500]}")
+
+
+def _handle_error(context) -> None:
+    # A failed execute never reaches after_cursor_execute; drop its start
+    # time so later queries on this connection pair with their own
+    connection = context.connection
+    if connection is None or context.statement is None:
+        return
+    started = connection.info.get("query_started")
+    if started:
+        started.pop()
+
+
+def instrument_engine(engine) -> None:
+    # Takes a sync Engine; pass async_engine.sync_engine for async engines
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+# Requests that matched no route (404 scans) share one entry, so the table
+# stays bounded by the number of routes
+UNMATCHED_ROUTE = "unmatched"
+
+
+def finish_request(route: str, stats: RequestQueryStats) -> List[tuple]:
+    suspects = stats.repeated_shapes(settings.N_PLUS_ONE_THRESHOLD)
+    route_query_stats.record(route, stats, bool(suspects))
+    for shape, n in suspects:
+        logger.warning(f"🔁 Possible N+1 on {route}: {n}x {shape[:300]}")
+    return suspects
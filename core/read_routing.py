@@ -0,0 +1,66 @@
+# core/read_routing.py
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicaRouter:
+    # Decides whether a read-only request may use the replica. The replica is
+    # skipped while it is marked down (retry_seconds after a failure) and,
+    # when max_staleness_seconds is set, for that long after any write
+    # committed by this process so read-after-write sees fresh data.
+    def __init__(self, enabled: bool, retry_seconds: float, max_staleness_seconds: float):
+        self.enabled = enabled
+        self.retry_seconds = retry_seconds
+        self.max_staleness_seconds = max_staleness_seconds
+        self._lock = threading.Lock()
+        self._down_until = 0.0
+        self._last_write = 0.0
+        self.replica_reads = 0
+        self.primary_reads = 0
+        self.fallbacks = 0
+        self.stale_reroutes = 0
+
+    def use_replica(self) -> bool:
+        if not self.enabled:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            if now < self._down_until:
+                return False
+            if self.max_staleness_seconds > 0 and now - self._last_write < self.max_staleness_seconds:
+                self.stale_reroutes += 1
+                return False
+        return True
+
+    def note_write(self) -> None:
+        self._last_write = time.monotonic()
+
+    def note_read(self, on_replica: bool) -> None:
+        with self._lock:
+            if on_replica:
+                self.replica_reads += 1
+            else:
+                self.primary_reads += 1
+
+    def mark_down(self, error: Exception) -> None:
+        with self._lock:
+            self._down_until = time.monotonic() + self.retry_seconds
+            self.fallbacks += 1
+        logger.warning(
+            f"⚠️ Read replica unavailable, using primary for {self.retry_seconds:.0f}s: {error}"
+        )
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "replica_up": time.monotonic() >= self._down_until,
+                "max_staleness_seconds": self.max_staleness_seconds,
+                "replica_reads": self.replica_reads,
+                "primary_reads": self.primary_reads,
+                "fallbacks": self.fallbacks,
+                "stale_reroutes": self.stale_reroutes,
+            }
@@ -0,0 +1,141 @@
+# core/response_cache.py
+import hashlib
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Optional, Tuple
+
+from fastapi import Request, Response
+
+from core.config import settings
+
+
+class CachedBody:
+    __slots__ = ("etag", "body", "tag", "expires")
+
+    def __init__(self, etag: str, body: bytes, tag: str, expires: float):
+        self.etag = etag
+        self.body = body
+        self.tag = tag
+        self.expires = expires
+
+
+class ResponseCache:
+    # Rendered JSON bodies keyed by (route, query string, role), tagged with
+    # the resource they were built from so writes can drop every variant.
+    # LRU-evicted by entry count and by total body size.
+    #
+    # Each tag has a generation that invalidate() bumps. Handlers take it
+    # before reading and pass it to put(), so a body read before a write
+    # cannot be stored after that write's invalidation. Invalidation only
+    # reaches this process; ttl_seconds bounds how long other workers keep
+    # serving a body after a write there.
+    def __init__(self, max_entries: int, max_bytes: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple[str, str, str], CachedBody]" = OrderedDict()
+        self._generations: Counter = Counter()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.stale_puts = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def key(route: str, request: Request, role: str) -> Tuple[str, str, str]:
+        return (route, request.url.query, role)
+
+    def generation(self, tag: str) -> int:
+        with self._lock:
+            return self._generations[tag]
+
+    def get(self, key: Tuple[str, str, str]) -> Optional[CachedBody]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= time.monotonic():
+                self._bytes -= len(self._entries.pop(key).body)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: Tuple[str, str, str], tag: str, body: bytes, generation: int) -> CachedBody:
+        # generation: generation(tag) taken before the body was read
+        entry = CachedBody(
+            f'"{hashlib.sha256(body).hexdigest()[:32]}"', body, tag, time.monotonic() + self.ttl_seconds
+        )
+        if len(body) > self.max_bytes:
+            return entry
+        with self._lock:
+            if self._generations[tag] != generation:
+                # Invalidated while this body was being read; serve it once,
+                # don't keep it
+                self.stale_puts += 1
+                return entry
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous.body)
+            self._entries[key] = entry
+            self._bytes += len(body)
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted.body)
+                self.evictions += 1
+        return entry
+
+    def invalidate(self, tag: str) -> None:
+        with self._lock:
+            self._generations[tag] += 1
+            for key in [key for key, entry in self._entries.items() if entry.tag == tag]:
+                self._bytes -= len(self._entries.pop(key).body)
+            self.invalidations += 1
+
+    def respond(self, request: Request, entry: CachedBody) -> Response:
+        headers = {"ETag": entry.etag, "Cache-Control": "private, no-cache"}
+        if _etag_matches(request.headers.get("if-none-match"), entry.etag):
+            with self._lock:
+                self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+        return Response(content=entry.body, media_type="application/json", headers=headers)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "not_modified": self.not_modified,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "stale_puts": self.stale_puts,
+                "invalidations": self.invalidations,
+            }
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    candidates = [value.strip() for value in header.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+response_cache = ResponseCache(
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+)
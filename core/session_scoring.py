@@ -0,0 +1,264 @@
+# core/session_scoring.py
+import asyncio
+import enum
+import logging
+import multiprocessing
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from sqlalchemy import select, update
+
+from analysis.movement_store import session_movement
+from analysis.scoring import score_movement
+from core.config import settings
+from core.database import AsyncSessionLocal
+from models.user import AssessmentSession
+from schemas.user import MovementScore
+
+logger = logging.getLogger(__name__)
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+
+class ScoringQueueFull(Exception):
+    pass
+
+
+async def save_score(session_id: str, result: dict) -> None:
+    # result: MovementScore.model_dump()
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(AssessmentSession)
+            .where(AssessmentSession.session_id == session_id)
+            .values(
+                overall_score=result["overall_score"],
+                joint_scores=result["joint_scores"],
+                movement_metrics=result["movement_metrics"],
+                recommendations=result["recommendations"],
+            )
+        )
+        await db.commit()
+
+
+class ScoringJob:
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.status = QUEUED
+        self.attempts = 0
+        self.submitted_at = time.time()
+        self.submitted = time.perf_counter()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.overall_score: Optional[float] = None
+        self.error: Optional[str] = None
+
+    @property
+    def active(self) -> bool:
+        return self.status in (QUEUED, RUNNING)
+
+    def as_dict(self) -> dict:
+        return {
+            "session_id": self.session_id,
+            "status": self.status,
+            "attempts": self.attempts,
+            "submitted_at": self.submitted_at,
+            "queue_ms": round((self.started - self.submitted) * 1000, 2) if self.started else None,
+            "run_ms": round((self.finished - self.started) * 1000, 2) if self.finished and self.started else None,
+            "overall_score": self.overall_score,
+            "error": self.error,
+        }
+
+
+class SessionScorer:
+    # Scores finished sessions in a process pool so the NumPy work never
+    # holds the event loop's GIL. Jobs wait in a bounded asyncio queue; one
+    # dispatcher per worker takes a job, loads the movement, sends the arrays
+    # to the pool and writes the result back in a single UPDATE. A crashed
+    # worker breaks the whole pool, so the pool is replaced and the job is
+    # retried up to max_attempts. Recent jobs are kept for status polling.
+    def __init__(self, max_workers: int, max_pending: int, max_attempts: int, history: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+        self.history = history
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: list = []
+        self._jobs: "OrderedDict[str, ScoringJob]" = OrderedDict()
+        self._finished_at: deque = deque()
+        self.submitted = 0
+        self.rejected = 0
+        self.recorded = 0
+        self.completed = 0
+        self.failed = 0
+        self.retries = 0
+        self.pool_restarts = 0
+        self.running = 0
+        self.total_queue_ms = 0.0
+        self.max_queue_ms = 0.0
+        self.total_run_ms = 0.0
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._executor = self._new_executor()
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._tasks = [asyncio.create_task(self._run()) for _ in range(self.max_workers)]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def submit(self, session_id: str) -> ScoringJob:
+        # A session already waiting or being scored keeps its job
+        if self._queue is None:
+            raise RuntimeError("Session scorer is not running")
+        job = self._jobs.get(session_id)
+        if job is not None and job.active:
+            return job
+        if self._queue.full():
+            self.rejected += 1
+            raise ScoringQueueFull(f"Scoring queue is full ({self.max_pending} sessions waiting)")
+        job = ScoringJob(session_id)
+        self._queue.put_nowait(job)
+        self._remember(job)
+        self.submitted += 1
+        return job
+
+    async def record(self, session_id: str, score: MovementScore) -> ScoringJob:
+        # Saves a score computed elsewhere (from a stream's running metrics)
+        # and makes it pollable like a pool job. A pool job already under way
+        # for the session is left to finish instead.
+        job = self._jobs.get(session_id)
+        if job is not None and job.active:
+            return job
+        job = ScoringJob(session_id)
+        job.status = RUNNING
+        job.started = job.submitted
+        await save_score(session_id, score.model_dump())
+        job.status = DONE
+        job.overall_score = score.overall_score
+        job.finished = time.perf_counter()
+        self._remember(job)
+        self.recorded += 1
+        return job
+
+    def job(self, session_id: str) -> Optional[ScoringJob]:
+        return self._jobs.get(session_id)
+
+    def stats(self) -> dict:
+        now = time.perf_counter()
+        while self._finished_at and now - self._finished_at[0] > 60:
+            self._finished_at.popleft()
+        return {
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "running": self.running,
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+            "recorded": self.recorded,
+            "completed": self.completed,
+            "failed": self.failed,
+            "retries": self.retries,
+            "pool_restarts": self.pool_restarts,
+            "completed_last_minute": len(self._finished_at),
+            "avg_queue_ms": round(self.total_queue_ms / self.completed, 2) if self.completed else 0.0,
+            "max_queue_ms": round(self.max_queue_ms, 2),
+            "avg_run_ms": round(self.total_run_ms / self.completed, 2) if self.completed else 0.0,
+        }
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # spawn, not fork: the server process has threads and open connections
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    def _remember(self, job: ScoringJob) -> None:
+        self._jobs[job.session_id] = job
+        self._jobs.move_to_end(job.session_id)
+        while len(self._jobs) > self.history:
+            oldest = next(iter(self._jobs.values()))
+            if oldest.active:
+                break
+            self._jobs.popitem(last=False)
+
+    async def _run(self) -> None:
+        while True:
+            job = await self._queue.get()
+            self.running += 1
+            try:
+                await self._score(job)
+            except Exception as error:
+                job.status = FAILED
+                job.error = str(error)[:200]
+                self.failed += 1
+                logger.error(f"❌ Scoring session {job.session_id} failed: {error}")
+            finally:
+                self.running -= 1
+                job.finished = time.perf_counter()
+
+    async def _score(self, job: ScoringJob) -> None:
+        job.status = RUNNING
+        job.started = time.perf_counter()
+        queue_ms = (job.started - job.submitted) * 1000
+
+        async with AsyncSessionLocal() as db:
+            exercise_type = await db.scalar(
+                select(AssessmentSession.assessment_type).where(AssessmentSession.session_id == job.session_id)
+            )
+            movement = await session_movement(db, job.session_id)
+        if movement is None:
+            raise ValueError("Session has no movement data")
+        exercise_type = exercise_type.value if isinstance(exercise_type, enum.Enum) else str(exercise_type)
+
+        result = await self._in_pool(job, movement.timestamps, movement.points, exercise_type)
+        await save_score(job.session_id, result)
+
+        finished = time.perf_counter()
+        job.status = DONE
+        job.overall_score = result["overall_score"]
+        self.completed += 1
+        self.total_queue_ms += queue_ms
+        self.max_queue_ms = max(self.max_queue_ms, queue_ms)
+        self.total_run_ms += (finished - job.started) * 1000
+        self._finished_at.append(finished)
+
+    async def _in_pool(self, job: ScoringJob, *args) -> dict:
+        loop = asyncio.get_running_loop()
+        while True:
+            job.attempts += 1
+            executor = self._executor
+            try:
+                return await loop.run_in_executor(executor, score_movement, *args)
+            except BrokenProcessPool:
+                # Every job in flight on a broken pool lands here; only the
+                # first one replaces it
+                if self._executor is executor:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    self._executor = self._new_executor()
+                    self.pool_restarts += 1
+                    logger.warning("⚠️ Scoring worker crashed; process pool restarted")
+                if job.attempts >= self.max_attempts:
+                    raise RuntimeError(f"Scoring worker crashed {job.attempts} times")
+                self.retries += 1
+
+
+session_scorer = SessionScorer(
+    settings.SCORING_MAX_WORKERS,
+    settings.SCORING_MAX_PENDING,
+    settings.SCORING_MAX_ATTEMPTS,
+    settings.SCORING_JOB_HISTORY,
+)
@@ -0,0 +1,171 @@
+# core/summary_counters.py
+import enum
+import logging
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.change_feed import Change
+from core.derived_index import DerivedIndex, index_refresher
+from models.user import User, Employer, Assessment, AssessmentSession
+
+logger = logging.getLogger(__name__)
+
+
+def _value(value):
+    return value.value if isinstance(value, enum.Enum) else value
+
+
+def _user_keys(row: dict) -> List[Tuple[str, object]]:
+    if not row.get("is_active", True):
+        return []
+    role = _value(row.get("role"))
+    keys = [("users_by_role", role)]
+    if role == "employee" and row.get("employer_id") is not None:
+        keys.append(("employees_by_employer", row["employer_id"]))
+    return keys
+
+
+def _employer_keys(row: dict) -> List[Tuple[str, object]]:
+    if not row.get("is_active", True):
+        return []
+    return [("employers", "active")]
+
+
+def _assessment_keys(row: dict) -> List[Tuple[str, object]]:
+    return [
+        ("assessments_by_status", _value(row.get("status"))),
+        ("assessments_by_type", _value(row.get("assessment_type"))),
+    ]
+
+
+def _session_keys(row: dict) -> List[Tuple[str, object]]:
+    return [
+        ("sessions_by_outcome", _value(row.get("outcome"))),
+        ("sessions_by_escalation_level", _value(row.get("escalation_level"))),
+    ]
+
+
+class TrackedTable:
+    def __init__(self, model, columns: list, keys: Callable[[dict], List[Tuple[str, object]]]):
+        self.model = model
+        self.name = model.__tablename__
+        self.columns = columns
+        self.fields = tuple(column.key for column in columns)
+        self.keys = keys
+
+
+TRACKED_TABLES = [
+    TrackedTable(User, [User.id, User.role, User.is_active, User.employer_id], _user_keys),
+    TrackedTable(Employer, [Employer.id, Employer.is_active], _employer_keys),
+    TrackedTable(Assessment, [Assessment.id, Assessment.status, Assessment.assessment_type], _assessment_keys),
+    TrackedTable(
+        AssessmentSession,
+        [AssessmentSession.id, AssessmentSession.outcome, AssessmentSession.escalation_level],
+        _session_keys,
+    ),
+]
+
+
+class SummaryState:
+    # The counted columns of every tracked row, kept so an update or delete
+    # can take back exactly what the row contributed before.
+    def __init__(self):
+        self.rows: Dict[str, Dict[int, tuple]] = {table.name: {} for table in TRACKED_TABLES}
+        self.counts: Dict[str, Counter] = {}
+
+    def apply(self, table: TrackedTable, change: Change) -> None:
+        row_id = change.row.get("id")
+        if row_id is None:
+            return
+        rows = self.rows[table.name]
+        previous = rows.get(row_id)
+        if previous is not None:
+            self._count(table, dict(zip(table.fields, previous)), -1)
+        if change.op == "delete":
+            rows.pop(row_id, None)
+            return
+        merged = dict(zip(table.fields, previous)) if previous is not None else {}
+        merged.update((field, change.row[field]) for field in table.fields if field in change.row)
+        rows[row_id] = tuple(merged.get(field) for field in table.fields)
+        self._count(table, merged, 1)
+
+    def _count(self, table: TrackedTable, row: dict, delta: int) -> None:
+        for counter, key in table.keys(row):
+            counts = self.counts.setdefault(counter, Counter())
+            counts[key] += delta
+            if counts[key] <= 0:
+                del counts[key]
+
+
+class SummaryCounters(DerivedIndex):
+    # Headline counts for the admin dashboard, maintained from the change
+    # feed as rows are created, updated and deleted. Each rebuild is a full
+    # recount that replaces the state and records how far the live counters
+    # had drifted (writes from other worker processes, or raw SQL outside
+    # the ORM).
+    columns = {table.name: table.columns for table in TRACKED_TABLES}
+
+    def __init__(self):
+        super().__init__()
+        self._tables = {table.name: table for table in TRACKED_TABLES}
+        self.last_drift: Dict[str, dict] = {}
+
+    def new_state(self) -> SummaryState:
+        return SummaryState()
+
+    def apply_change(self, state: SummaryState, change: Change) -> None:
+        state.apply(self._tables[change.table], change)
+
+    def built(self, previous: Optional[SummaryState], state: SummaryState) -> None:
+        self.last_drift = _drift(previous, state) if previous is not None else {}
+        if self.last_drift:
+            logger.warning(f"⚠️ Summary counters drifted, corrected by recount: {self.last_drift}")
+
+    async def summary(self) -> dict:
+        if self._state is None:
+            await self.rebuild()
+        with self._lock:
+            counts = self._state.counts
+            return {
+                "users_by_role": _as_dict(counts.get("users_by_role")),
+                "employees_by_employer": _as_dict(counts.get("employees_by_employer")),
+                "employers": counts.get("employers", Counter()).get("active", 0),
+                "assessments_by_status": _as_dict(counts.get("assessments_by_status")),
+                "assessments_by_type": _as_dict(counts.get("assessments_by_type")),
+                "sessions_by_outcome": _as_dict(counts.get("sessions_by_outcome")),
+                "sessions_by_escalation_level": _as_dict(counts.get("sessions_by_escalation_level")),
+                "reconciled_at": self.last_build_at,
+            }
+
+    def stats(self) -> dict:
+        with self._lock:
+            state = self._state
+            return {
+                **self.build_stats(),
+                "tracked_rows": {name: len(rows) for name, rows in state.rows.items()} if state else {},
+                "last_drift": self.last_drift,
+            }
+
+
+def _as_dict(counts: Optional[Counter]) -> Dict[str, int]:
+    # JSON object keys are strings; rows with no value count under "none"
+    return {("none" if key is None else str(key)): count for key, count in (counts or {}).items()}
+
+
+def _drift(live: SummaryState, recounted: SummaryState) -> Dict[str, dict]:
+    drift = {}
+    for counter in set(live.counts) | set(recounted.counts):
+        before = live.counts.get(counter, Counter())
+        after = recounted.counts.get(counter, Counter())
+        changed = {
+            ("none" if key is None else str(key)): after.get(key, 0) - before.get(key, 0)
+            for key in set(before) | set(after)
+            if after.get(key, 0) != before.get(key, 0)
+        }
+        if changed:
+            drift[counter] = changed
+    return drift
+
+
+summary_counters = SummaryCounters()
+index_refresher.register(summary_counters)
@@ -0,0 +1,223 @@
+# core/user_search.py
+import heapq
+import logging
+import re
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from core.change_feed import Change
+from core.derived_index import DerivedIndex, index_refresher
+from models.user import User, RoleEnum
+
+logger = logging.getLogger(__name__)
+
+SEARCH_FIELDS = ("first_name", "last_name", "email", "employee_id")
+SEARCH_COLUMNS = [
+    User.id, User.role, User.is_active, User.employer_id,
+    User.first_name, User.last_name, User.email, User.employee_id,
+]
+
+GRAM_SIZE = 3
+# Queries shorter than a trigram are answered from word prefixes
+_WORD_SPLIT = re.compile(r"[^0-9a-z]+")
+
+# Lower ranks sort first
+RANK_EXACT = 0
+RANK_FIELD_PREFIX = 1
+RANK_WORD_PREFIX = 2
+RANK_SUBSTRING = 3
+
+
+def _normalize(value) -> str:
+    return str(value).strip().lower() if value is not None else ""
+
+
+def _grams(text: str) -> Set[str]:
+    return {text[i:i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+
+def _words(text: str) -> List[str]:
+    return [word for word in _WORD_SPLIT.split(text) if word]
+
+
+class SearchUser:
+    __slots__ = ("id", "role", "is_active", "employer_id", "first_name", "last_name",
+                 "email", "employee_id", "terms", "keys")
+
+    def __init__(self, row: dict):
+        self.id = row["id"]
+        self.role = None
+        self.is_active = True
+        self.employer_id = None
+        self.first_name = None
+        self.last_name = None
+        self.email = None
+        self.employee_id = None
+        self.merge(row)
+
+    def merge(self, row: dict) -> None:
+        for key in ("role", "is_active", "employer_id") + SEARCH_FIELDS:
+            if key in row:
+                value = row[key]
+                if key == "role" and value is not None:
+                    value = RoleEnum(value).value
+                setattr(self, key, value)
+        # Normalized field values, and every posting key they produce
+        self.terms = tuple(_normalize(getattr(self, field)) for field in SEARCH_FIELDS)
+        keys: Set[str] = set()
+        for term in self.terms:
+            keys |= _grams(term)
+            for word in _words(term) + [term]:
+                keys.update(word[:length] for length in range(1, GRAM_SIZE) if len(word) >= length)
+        self.keys = frozenset(keys)
+
+    def rank(self, query: str) -> Optional[Tuple[int, int]]:
+        best = None
+        for term in self.terms:
+            if not term or query not in term:
+                continue
+            if term == query:
+                rank = RANK_EXACT
+            elif term.startswith(query):
+                rank = RANK_FIELD_PREFIX
+            elif any(word.startswith(query) for word in _words(term)):
+                rank = RANK_WORD_PREFIX
+            else:
+                rank = RANK_SUBSTRING
+            candidate = (rank, len(term))
+            if best is None or candidate < best:
+                best = candidate
+        return best
+
+    def as_hit(self) -> dict:
+        return {
+            "id": self.id,
+            "firstName": self.first_name,
+            "lastName": self.last_name,
+            "email": self.email,
+            "role": self.role,
+            "employee_id": self.employee_id,
+            "employer_id": self.employer_id,
+        }
+
+
+class SearchIndex:
+    # One generation of the index: posting sets from trigram (and short word
+    # prefix) to user ids, over active users only.
+    def __init__(self):
+        self.users: Dict[int, SearchUser] = {}
+        self.postings: Dict[str, Set[int]] = {}
+
+    def apply(self, change: Change) -> None:
+        user_id = change.row.get("id")
+        if user_id is None:
+            return
+        user = self.users.get(user_id)
+        if user is not None:
+            self._unlink(user)
+        if change.op == "delete":
+            self.users.pop(user_id, None)
+            return
+        if user is None:
+            user = SearchUser(change.row)
+            self.users[user_id] = user
+        else:
+            user.merge(change.row)
+        if user.is_active:
+            for key in user.keys:
+                self.postings.setdefault(key, set()).add(user_id)
+
+    def _unlink(self, user: SearchUser) -> None:
+        for key in user.keys:
+            members = self.postings.get(key)
+            if members is not None:
+                members.discard(user.id)
+                if not members:
+                    del self.postings[key]
+
+    def candidates(self, query: str) -> Set[int]:
+        if len(query) < GRAM_SIZE:
+            return self.postings.get(query, set())
+        # Intersect the rarest grams first; a miss on any gram ends it
+        postings = sorted((self.postings.get(gram, set()) for gram in _grams(query)), key=len)
+        if not postings or not postings[0]:
+            return set()
+        result = set(postings[0])
+        for members in postings[1:]:
+            result &= members
+            if not result:
+                break
+        return result
+
+
+class UserSearch(DerivedIndex):
+    # Type-ahead over first name, last name, email and employee ID, answered
+    # from an in-memory trigram index.
+    columns = {"users": SEARCH_COLUMNS}
+
+    def __init__(self):
+        super().__init__()
+        self.searches = 0
+        self.total_search_ms = 0.0
+        self.max_search_ms = 0.0
+
+    def new_state(self) -> SearchIndex:
+        return SearchIndex()
+
+    def apply_change(self, state: SearchIndex, change: Change) -> None:
+        state.apply(change)
+
+    def built(self, previous: Optional[SearchIndex], state: SearchIndex) -> None:
+        logger.info(f"🔎 User search index built: {len(state.users)} users, {len(state.postings)} keys in {self.last_build_ms}ms")
+
+    def search(
+        self,
+        query: str,
+        limit: int,
+        role: Optional[str] = None,
+        employer_id: Optional[int] = None,
+        within: Optional[Iterable[int]] = None,
+    ) -> Optional[List[dict]]:
+        # Best matches first: exact field, field prefix, word prefix, then
+        # substring; shorter fields before longer. None when not built yet.
+        query = _normalize(query)
+        started = time.perf_counter()
+        with self._lock:
+            if self._state is None:
+                return None
+            users = self._state.users
+            candidates = self._state.candidates(query) if query else set()
+            if within is not None:
+                candidates = candidates & set(within)
+            ranked = []
+            for user_id in candidates:
+                user = users[user_id]
+                if role is not None and user.role != role:
+                    continue
+                if employer_id is not None and user.employer_id != employer_id:
+                    continue
+                rank = user.rank(query)
+                if rank is not None:
+                    ranked.append((rank, user.terms[1], user.terms[0], user_id))
+            hits = [users[entry[-1]].as_hit() for entry in heapq.nsmallest(limit, ranked)]
+            elapsed = (time.perf_counter() - started) * 1000
+            self.searches += 1
+            self.total_search_ms += elapsed
+            self.max_search_ms = max(self.max_search_ms, elapsed)
+        return hits
+
+    def stats(self) -> dict:
+        with self._lock:
+            index = self._state
+            return {
+                **self.build_stats(),
+                "users": len(index.users) if index else 0,
+                "keys": len(index.postings) if index else 0,
+                "searches": self.searches,
+                "avg_search_ms": round(self.total_search_ms / self.searches, 4) if self.searches else 0.0,
+                "max_search_ms": round(self.max_search_ms, 4),
+            }
+
+
+user_search = UserSearch()
+index_refresher.register(user_search)
@@ -1,9 +1,41 @@
 import asyncio
-from core.database import engine
+from sqlalchemy import inspect
+from core.database import async_engine
 from models.user import Base
 
+def add_missing_columns(conn):
+    # create_all does not alter existing tables either; nullable columns
+    # added to a model later are added here, and columns the model has since
+    # made nullable lose their NOT NULL (SQLite cannot do that in place)
+    inspector = inspect(conn)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"]: column for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if not column.nullable:
+                continue
+            if column.name in existing:
+                if not existing[column.name]["nullable"] and conn.dialect.name != "sqlite":
+                    conn.exec_driver_sql(f'ALTER TABLE {table.name} ALTER COLUMN {column.name} DROP NOT NULL')
+                    print(f"🔓 Made {table.name}.{column.name} nullable")
+                continue
+            column_type = column.type.compile(dialect=conn.dialect)
+            conn.exec_driver_sql(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}')
+            print(f"➕ Added column {table.name}.{column.name}")
+
+def create_missing_indexes(conn):
+    # create_all skips tables that already exist, so indexes added to a model
+    # later would never reach an existing database without this
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
 async def init_models():
-    async with engine.begin() as conn:
+    async with async_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(add_missing_columns)
+        await conn.run_sync(create_missing_indexes)
+    await async_engine.dispose()
 
 asyncio.run(init_models())
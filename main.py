@@ -1,12 +1,58 @@
-from fastapi import  FastAPI
+import logging
+from contextlib import asynccontextmanager
+from fastapi import  FastAPI, Request
+from fastapi.responses import ORJSONResponse
 from api import users
 from api import employers
 from api import consultants
 from api import employees
 from api import assessments
-from api.consultant import employees
+from api.consultant import employees as consultant_employees
+from api import internal
+from api import exports
+from api import imports
+from api import summary
+from api import search
+from api import sessions
+from auth.utils import last_accessed_buffer, revocation_sync, revoked_tokens, session_reaper
+from auth.hashing import password_hasher
+from core.derived_index import index_refresher
+from core.pose_ingest import pose_writer
+from core.session_scoring import session_scorer
+from core.database import AsyncSessionLocal, async_engine, replica_engine
+from core.config import settings
+from core.query_stats import UNMATCHED_ROUTE, RequestQueryStats, current_query_stats, finish_request
 from fastapi.middleware.cors import CORSMiddleware
-app = FastAPI()
+
+async def load_revoked_tokens():
+    async with AsyncSessionLocal() as db:
+        await revoked_tokens.load_from_db(db)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    try:
+        await load_revoked_tokens()
+    except Exception as error:
+        logging.error(f"❌ Could not rehydrate revoked tokens: {error}")
+    await revocation_sync.start()
+    await last_accessed_buffer.start()
+    await session_reaper.start()
+    await index_refresher.start()
+    await pose_writer.start()
+    await session_scorer.start()
+    yield
+    await session_scorer.stop()
+    await pose_writer.stop()
+    await index_refresher.stop()
+    await session_reaper.stop()
+    await last_accessed_buffer.stop()
+    await revocation_sync.stop()
+    password_hasher.shutdown()
+    await async_engine.dispose()
+    if replica_engine is not None:
+        await replica_engine.dispose()
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],  
@@ -14,9 +60,47 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+
+@app.middleware("http")
+async def query_stats_middleware(request: Request, call_next):
+    stats = RequestQueryStats()
+    token = current_query_stats.set(stats)
+    try:
+        response = await call_next(request)
+    finally:
+        current_query_stats.reset(token)
+    route = request.scope.get("route")
+    route_name = f"{request.method} {route.path}" if route else UNMATCHED_ROUTE
+    if settings.DEBUG:
+        # Streaming bodies (exports) query after the headers are sent, so
+        # their headers only cover what ran before the first chunk
+        response.headers["X-DB-Query-Count"] = str(stats.count)
+        response.headers["X-DB-Time-Ms"] = f"{stats.total_ms:.2f}"
+        suspects = stats.repeated_shapes(settings.N_PLUS_ONE_THRESHOLD)
+        if suspects:
+            response.headers["X-DB-N-Plus-One"] = str(suspects[0][1])
+    # Recorded once the body has been sent, so streamed responses count
+    # the queries their body iterators run
+    body = response.body_iterator
+
+    async def finish_after_body():
+        try:
+            async for chunk in body:
+                yield chunk
+        finally:
+            finish_request(route_name, stats)
+
+    response.body_iterator = finish_after_body()
+    return response
 app.include_router(users.router, prefix="/api/auth", tags=["users"])
 app.include_router(employers.router,prefix="/api/admin",tags=["admin"])
 app.include_router(consultants.router,prefix="/api/admin",tags=["admin"])
 app.include_router(employees.router,prefix="/api/admin",tags=["admin"])
 app.include_router(assessments.router,prefix="/api/admin",tags=["admin"])
-app.include_router(employees.router,prefix="/api/consultant",tags=["consultant"])
\ No newline at end of file
+app.include_router(consultant_employees.router,prefix="/api/consultant",tags=["consultant"])
+app.include_router(exports.router,prefix="/api/admin",tags=["admin"])
+app.include_router(imports.router,prefix="/api/admin",tags=["admin"])
+app.include_router(summary.router,prefix="/api/admin",tags=["admin"])
+app.include_router(search.router,prefix="/api/admin",tags=["admin"])
+app.include_router(sessions.router,prefix="/api/sessions",tags=["sessions"])
+app.include_router(internal.router,prefix="/api/internal",tags=["internal"])
\ No newline at end of file
@@ -0,0 +1,99 @@
+import argparse
+import asyncio
+from sqlalchemy import null, select, update
+from analysis.movement_codec import encode_movement, movement_from_json
+from analysis.movement_store import migrate_movement
+from core.database import AsyncSessionLocal, async_engine
+from models.user import AssessmentSession, PoseFrameBatch
+
+# Moves JSON movement_data into the binary movement_blob column, one batch of
+# sessions per transaction, and prints what each session saved. Readers go
+# through analysis.movement_store, which handles both formats, so this can
+# run while the app is up. Run create_tables.py first to add the columns.
+
+async def migrate_sessions(batch_size: int, keep_json: bool) -> None:
+    totals = {"sessions": 0, "json_bytes": 0, "blob_bytes": 0, "json_decode_ms": 0.0, "blob_decode_ms": 0.0}
+    last_id = 0
+    while True:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(AssessmentSession.id, AssessmentSession.session_id, AssessmentSession.movement_data)
+                .where(
+                    AssessmentSession.id > last_id,
+                    AssessmentSession.movement_data.isnot(None),
+                    AssessmentSession.movement_blob.is_(None),
+                )
+                .order_by(AssessmentSession.id)
+                .limit(batch_size)
+            )
+            rows = result.all()
+            if not rows:
+                break
+            for row in rows:
+                last_id = row.id
+                blob, report = migrate_movement(row.session_id, row.movement_data)
+                values = {"movement_blob": blob}
+                if not keep_json:
+                    values["movement_data"] = null()
+                await db.execute(
+                    update(AssessmentSession).where(AssessmentSession.id == row.id).values(**values)
+                )
+                print(f"📦 {report.as_dict()}")
+                totals["sessions"] += 1
+                totals["json_bytes"] += report.json_bytes
+                totals["blob_bytes"] += report.blob_bytes
+                totals["json_decode_ms"] += report.json_decode_ms
+                totals["blob_decode_ms"] += report.blob_decode_ms
+            await db.commit()
+
+    if totals["sessions"]:
+        print(
+            f"✅ Migrated {totals['sessions']} sessions: "
+            f"{totals['json_bytes']} JSON bytes -> {totals['blob_bytes']} blob bytes "
+            f"({totals['json_bytes'] / max(totals['blob_bytes'], 1):.1f}x smaller), "
+            f"decode {totals['json_decode_ms']:.1f} ms -> {totals['blob_decode_ms']:.1f} ms"
+        )
+    else:
+        print("✅ No JSON movement_data left to migrate")
+
+async def migrate_pose_batches(batch_size: int) -> None:
+    migrated = 0
+    last_id = 0
+    while True:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(PoseFrameBatch.id, PoseFrameBatch.frames)
+                .where(
+                    PoseFrameBatch.id > last_id,
+                    PoseFrameBatch.frames.isnot(None),
+                    PoseFrameBatch.frames_blob.is_(None),
+                )
+                .order_by(PoseFrameBatch.id)
+                .limit(batch_size)
+            )
+            rows = result.all()
+            if not rows:
+                break
+            for row in rows:
+                last_id = row.id
+                movement = movement_from_json(row.frames)
+                await db.execute(
+                    update(PoseFrameBatch).where(PoseFrameBatch.id == row.id).values(
+                        frames_blob=encode_movement(movement.timestamps, movement.points),
+                        frames=null(),
+                    )
+                )
+            migrated += len(rows)
+            await db.commit()
+    print(f"✅ Migrated {migrated} pose frame batches")
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--keep-json", action="store_true", help="Leave movement_data in place")
+    args = parser.parse_args()
+    await migrate_sessions(args.batch_size, args.keep_json)
+    await migrate_pose_batches(args.batch_size)
+    await async_engine.dispose()
+
+asyncio.run(main())
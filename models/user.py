@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, Integer, String, Boolean, Float, Text, DateTime, JSON, ForeignKey, Enum as SQLAlchemyEnum
+from sqlalchemy import Column, Integer, String, Boolean, Float, Text, DateTime, JSON, LargeBinary, ForeignKey, Index, text, Enum as SQLAlchemyEnum
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -77,15 +77,32 @@ class Session(Base):
     __tablename__ = "sessions"
     
     id = Column(Integer, primary_key=True, index=True)
+    # The bearer token in session mode, the token's jti in signed mode
     token = Column(String, unique=True, nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     last_accessed = Column(DateTime, default=datetime.utcnow)
     expires_at = Column(DateTime, nullable=False)
     is_active = Column(Boolean, default=True)
+    revoked_at = Column(DateTime)
     
     user = relationship("User", back_populates="sessions")
 
+    __table_args__ = (
+        # validate_token: token lookup restricted to live sessions, with the
+        # columns it reads included so Postgres can answer from the index
+        Index(
+            "ix_sessions_active_token",
+            "token",
+            postgresql_where=text("is_active"),
+            postgresql_include=["expires_at", "user_id"],
+        ),
+        # Session reaper and revocation rehydration range-scan on expiry
+        Index("ix_sessions_expires_at", "expires_at"),
+        # Revocation sync reads the logouts since its last pull
+        Index("ix_sessions_revoked_at", "revoked_at"),
+    )
+
 class User(Base):
     __tablename__ = "users"
     
@@ -124,6 +141,8 @@ class User(Base):
     state = Column(String)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    # Signed tokens issued before this are rejected (role or status changed)
+    tokens_valid_after = Column(DateTime)
     
     # Relationships - ONLY THESE LINES ARE CHANGED
     sessions = relationship("Session", back_populates="user")
@@ -140,6 +159,14 @@ class User(Base):
         foreign_keys="Assessment.consultant_id"
     )
 
+    __table_args__ = (
+        # Keyset pagination of the per-role lists
+        Index("ix_users_role_created_at_id", "role", "created_at", "id"),
+        # Consultant scope lookups
+        Index("ix_users_created_by_consultant_id", "created_by_consultant_id"),
+        Index("ix_users_employer_id_location", "employer_id", "location"),
+    )
+
 class Employer(Base):
     __tablename__ = "employers"
     
@@ -168,6 +195,10 @@ class Employer(Base):
     # Relationships
     users = relationship("User", back_populates="employer")
 
+    __table_args__ = (
+        Index("ix_employers_created_at_id", "created_at", "id"),
+    )
+
 class Assessment(Base):
     __tablename__ = "assessments"
     
@@ -200,6 +231,10 @@ class Assessment(Base):
     )
     sessions = relationship("AssessmentSession", back_populates="assessment")
 
+    __table_args__ = (
+        Index("ix_assessments_created_at_id", "created_at", "id"),
+    )
+
 class AssessmentSession(Base):
     __tablename__ = "assessment_sessions"
     
@@ -213,7 +248,9 @@ class AssessmentSession(Base):
     session_type = Column(SQLAlchemyEnum(SessionTypeEnum), default=SessionTypeEnum.initial)
     overall_score = Column(Float)
     joint_scores = Column(JSON)
-    movement_data = Column(JSON)
+    movement_data = Column(JSON)  # legacy JSON frames, see movement_blob
+    # analysis.movement_codec binary: float64 timestamps + float32 landmarks
+    movement_blob = Column(LargeBinary)
     movement_metrics = Column(JSON)
     recommendations = Column(JSON)
     consultant_notes = Column(Text)
@@ -228,6 +265,25 @@ class AssessmentSession(Base):
     user = relationship("User", foreign_keys=[user_id])
     consultant = relationship("User", foreign_keys=[consultant_id])
 
+class PoseFrameBatch(Base):
+    __tablename__ = "pose_frame_batches"
+
+    # One row per batch of streamed pose frames for an assessment session
+    id = Column(Integer, primary_key=True, index=True)
+    session_id = Column(String, ForeignKey("assessment_sessions.session_id"), nullable=False)
+    frame_count = Column(Integer, nullable=False)
+    first_timestamp = Column(Float, nullable=False)
+    last_timestamp = Column(Float, nullable=False)
+    # Legacy [[timestamp, [[x, y, visibility], ...]], ...]; new batches are
+    # written to frames_blob in the analysis.movement_codec format
+    frames = Column(JSON)
+    frames_blob = Column(LargeBinary)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_pose_frame_batches_session_id_first_timestamp", "session_id", "first_timestamp"),
+    )
+
 class Exercise(Base):
     __tablename__ = "exercises"
     
@@ -1,6 +1,20 @@
 # schemas/response_models.py
-from pydantic import BaseModel
-from schemas.user import User as UserSchema
+from typing import Generic, List, Optional, TypeVar
+from pydantic import BaseModel, TypeAdapter
+from schemas.user import User as UserSchema, Employer, AssessmentListItem
+
+T = TypeVar("T")
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+# Built once at import; list endpoints validate ORM rows straight into these
+# and dump JSON in one pass (see api.pagination.page_response)
+UserPageAdapter = TypeAdapter(Page[UserSchema])
+EmployerPageAdapter = TypeAdapter(Page[Employer])
+AssessmentPageAdapter = TypeAdapter(Page[AssessmentListItem])
 
 class LoginRequest(BaseModel):
     username: str
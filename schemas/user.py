@@ -67,10 +67,22 @@ class UserCreate(UserBase):
     state: Optional[str] = None
 
 
+class UserSearchHit(BaseModel):
+    id: int
+    email: str
+    first_name: str = Field(..., alias="firstName")
+    last_name: str = Field(..., alias="lastName")
+    role: str
+    employee_id: Optional[str] = None
+    employer_id: Optional[int] = None
+
+    class Config:
+        populate_by_name = True
+
 class User(UserBase):
     id: int
     is_active: bool
-    created_at: datetime
+    created_at: Optional[datetime] = None  # NULL on rows older than its default
 
     class Config:
         from_attributes = True
@@ -106,7 +118,7 @@ class EmployerCreate(EmployerBase):
 class Employer(EmployerBase):
     id: int
     is_active: bool
-    created_at: datetime
+    created_at: Optional[datetime] = None
 
     model_config = {
         "from_attributes": True,
@@ -128,13 +140,22 @@ class AssessmentCreate(AssessmentBase):
 
 class Assessment(AssessmentBase):
     id: int
-    created_at: datetime
+    created_at: Optional[datetime] = None
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
 
+class AssessmentListItem(Assessment):
+    consultant_id: Optional[int] = None
+    description: Optional[str] = None
+    status: Optional[str] = None
+    overall_progress: Optional[float] = None
+    final_score: Optional[float] = None
+    scheduled_date: Optional[datetime] = None
+    employee_name: str
+
 class AssessmentSessionBase(BaseModel):
     session_id: str
     assessment_type: str
@@ -149,7 +170,7 @@ class AssessmentSessionCreate(AssessmentSessionBase):
 
 class AssessmentSession(AssessmentSessionBase):
     id: int
-    created_at: datetime
+    created_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True